@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+한국어/혼합 상담용 요약 전용 프롬프트 템플릿 추가
+
+현재 기본 일본어 템플릿(source_language=ja)의 본문을 그대로 복사해 source_language=ko
+변형을 만듦. 번역 지시는 템플릿 본문이 아니라 원문 언어별 고정 프롬프트(LANGUAGE_PROMPTS)에
+있으므로 본문은 같아도 요약 전용 프롬프트로 호출됨. 이미 같은 버전의 변형이 있으면 건너뜀
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.models import PromptTemplate
+
+# 데이터베이스 설정
+engine = create_engine(settings.DATABASE_URL)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+VARIANT_SUFFIX = " (한국어 상담)"
+
+def add_summary_only_template():
+    """기본 일본어 템플릿을 복사해 요약 전용(ko) 템플릿 생성"""
+    session = SessionLocal()
+
+    try:
+        source = session.query(PromptTemplate).filter(
+            PromptTemplate.is_active == True,
+            PromptTemplate.source_language == "ja"
+        ).order_by(PromptTemplate.created_at.desc()).first()
+
+        if not source:
+            print("❌ 활성 일본어 프롬프트 템플릿을 찾을 수 없습니다")
+            return
+
+        existing = session.query(PromptTemplate).filter(
+            PromptTemplate.name == source.name + VARIANT_SUFFIX,
+            PromptTemplate.version == source.version,
+            PromptTemplate.source_language == "ko"
+        ).first()
+
+        if existing:
+            print(f"ℹ️  요약 전용 템플릿이 이미 존재합니다 (ID {existing.id}, v{existing.version})")
+            return
+
+        variant = PromptTemplate(
+            name=source.name + VARIANT_SUFFIX,
+            version=source.version,
+            template_text=source.template_text,
+            source_language="ko",
+            target_language="ko",
+            is_active=True,
+            created_from_guide=source.created_from_guide
+        )
+        session.add(variant)
+        session.commit()
+        print(f"✅ 요약 전용 템플릿 생성: {variant.name} v{variant.version} (ID {variant.id})")
+
+    except Exception as e:
+        session.rollback()
+        print(f"❌ 오류 발생: {str(e)}")
+        raise
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    print("🚀 한국어 상담용 요약 전용 템플릿 추가 중...")
+    add_summary_only_template()
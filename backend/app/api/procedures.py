@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 from ..core.database import get_db
 from ..models import Procedure, ProcedureHistory
+from ..services.pagination import NEXT_CURSOR_HEADER, decode_cursor, keyset_page
 from pydantic import BaseModel
 import logging
 
@@ -25,6 +26,7 @@ class ProcedureBase(BaseModel):
     precautions: Optional[str] = None
     price_info: Optional[str] = None
     additional_info: Optional[dict] = None
+    aliases: Optional[List[str]] = None
 
 class ProcedureCreate(ProcedureBase):
     procedure_number: int
@@ -46,13 +48,23 @@ class ProcedureResponse(ProcedureBase):
 # API 엔드포인트들
 @router.get("/", response_model=List[ProcedureResponse])
 def get_procedures(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = Query(None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 헤더 값 (없으면 첫 페이지)"),
+    limit: int = Query(100, ge=1, le=500),
     category: Optional[str] = Query(None, description="카테고리 필터 (A, B, C, D)"),
     active_only: bool = Query(True, description="활성 시술만 조회"),
     db: Session = Depends(get_db)
 ):
-    """시술 목록 조회"""
+    """
+    시술 목록 조회 (시술 번호 순 키셋 페이지네이션)
+    
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 돌려줌
+    """
+    try:
+        after = decode_cursor(cursor, (int,)) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     query = db.query(Procedure)
     
     if active_only:
@@ -61,7 +73,9 @@ def get_procedures(
     if category:
         query = query.filter(Procedure.category == category)
     
-    procedures = query.order_by(Procedure.procedure_number).offset(skip).limit(limit).all()
+    procedures, next_cursor = keyset_page(query, (Procedure.procedure_number,), after, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return procedures
 
 @router.get("/{procedure_id}", response_model=ProcedureResponse)
@@ -1,14 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Header, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Callable, List, Optional
 from datetime import date, datetime
-import json
-from ..core.database import get_db
-from ..models import ConsultationSummary, PromptTemplate
-from ..services.openai_service import OpenAISummaryService
+from ..core.database import get_db, SessionLocal
+from ..core.config import settings
+from ..models import ConsultationSummary, PromptTemplate, SummaryJob
+from ..services.summary_provider import SummaryProvider
+from ..services.provider_router import ProviderRouter
+from ..services.provider_clients import get_summary_provider
+from ..services.summary_cache import summary_cache
+from ..services.single_flight import summary_flights
+from ..services.summary_generation import (
+    summary_cache_key, template_key, cache_value, find_template, route_template, generate_cached_summary, attach_telemetry,
+    discussed_procedures
+)
+from ..services.prompt_builder import prompt_cache_stats
+from ..services.token_estimator import token_estimator
+from ..services.telemetry import start_trace, telemetry_store
+from ..services.markdown_cleaner import StreamingMarkdownCleaner
+from ..services.sse_protocol import SummaryStreamEncoder, SSE_HEADERS, sse_event
+from ..services.stream_buffer import summary_streams
+from ..services.template_registry import template_registry
+from ..services.transcript_preprocessor import transcript_preprocessor
+from ..services.procedure_matcher import procedure_matcher
+from ..services.summary_sections import SectionParser, SUMMARY_SECTIONS, SECTION_KEYS, parse_sections
+from ..services.pagination import NEXT_CURSOR_HEADER, decode_cursor, keyset_page
+from ..services.job_queue import summary_job_queue, TERMINAL_STATUSES
 from pydantic import BaseModel
+import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +52,7 @@ class SummaryCreateDirect(BaseModel):
     consultant_name: Optional[str] = None
     customer_name: Optional[str] = None
     consultation_title: Optional[str] = None
+    telemetry_id: Optional[int] = None  # 생성 응답의 계측 ID (요약 행에 생성 지표 연결)
 
 class SummaryUpdate(BaseModel):
     summary_text: str
@@ -45,6 +68,8 @@ class SummaryResponse(BaseModel):
     consultant_name: Optional[str]
     customer_name: Optional[str]
     consultation_title: Optional[str]
+    generation_metrics: Optional[dict] = None
+    sections: Optional[dict] = None
     created_by: Optional[str]
     created_at: datetime
     
@@ -55,49 +80,263 @@ class SummaryGenerateRequest(BaseModel):
     original_text: str
     consultation_date: Optional[date] = None
     prompt_template_id: Optional[int] = None
+    force_refresh: bool = False  # True면 캐시를 무시하고 새로 생성
+
+class SummaryGenerateSaveRequest(SummaryGenerateRequest):
+    """생성과 동시에 저장할 상담 메타데이터 (스트림 완료 시 서버에서 저장)"""
+    consultant_name: Optional[str] = None
+    customer_name: Optional[str] = None
+    consultation_title: Optional[str] = None
+    procedures_discussed: Optional[List[int]] = None
+
+class SummaryJobCreate(SummaryGenerateSaveRequest):
+    save_result: bool = True  # 완료 시 상담 요약으로 저장
+
+class SummaryJobResponse(BaseModel):
+    id: int
+    status: str
+    attempts: int
+    max_attempts: int
+    summary_text: Optional[str]
+    summary_id: Optional[int]
+    telemetry_id: Optional[int]
+    error: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    
+    class Config:
+        from_attributes = True
+
+async def _preprocess(original_text: str):
+    """녹취록 전처리 (긴 녹취록 전체를 훑으므로 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+    return await asyncio.to_thread(transcript_preprocessor.process, original_text)
+
+async def _plan_request(original_text: str, template: PromptTemplate) -> dict:
+    """
+    제공자 호출 전 토큰 예산 계획 (허용 한도를 넘으면 413)
+    
+    녹취록 전체 토큰화와 템플릿 컴파일은 스레드에서 실행 (다른 스트림의 이벤트 루프를 막지 않도록)
+    """
+    plan = await asyncio.to_thread(token_estimator.plan, original_text, template.template_text, template.source_language)
+    if not plan["fits"]:
+        raise HTTPException(
+            status_code=413,
+            detail=f"상담 내용이 너무 깁니다. 약 {plan['transcript_tokens']} 토큰으로, 최대 {plan['limit_tokens']} 토큰까지 요약할 수 있습니다"
+        )
+    return plan
+
+def _generation_failure(result: dict) -> HTTPException:
+    """요약 실패 결과를 HTTP 오류로 변환 (제공자 과부하/장애는 Retry-After를 담은 503)"""
+    if result.get("status_code") in (429, 503, 504):
+        retry_after = result.get("retry_after") or settings.LLM_BREAKER_RECOVERY_SECONDS
+        return HTTPException(
+            status_code=503,
+            detail=f"AI 제공자가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도해 주세요: {result['error']}",
+            headers={"Retry-After": str(int(max(1, retry_after)))}
+        )
+    return HTTPException(status_code=500, detail=f"AI 요약 생성 실패: {result['error']}")
+
+def _stream_response(buffer, offset: int = 0, prefix: str = "") -> StreamingResponse:
+    """스트림 버퍼를 SSE 프로토콜 v2로 전송 (offset부터, 재개 시 앞부분으로 체크섬 이어감)"""
+    async def generate():
+        # 델타만 전송 (약 50ms 단위로 묶음), 체크섬 체크포인트, 유휴 시 ping
+        encoder = SummaryStreamEncoder(
+            coalesce_interval=settings.SSE_COALESCE_MS / 1000,
+            heartbeat_interval=settings.SSE_HEARTBEAT_SECONDS,
+            checkpoint_chars=settings.SSE_CHECKPOINT_CHARS,
+            offset=offset
+        )
+        encoder.seed(prefix)
+        yield encoder.meta(**buffer.meta, resumed_from=offset if offset else None)
+        try:
+            async for frame in encoder.frames(buffer.read(offset)):
+                yield frame
+            
+            if buffer.error:
+                yield encoder.error(buffer.error)
+            else:
+                yield encoder.done(**buffer.result)
+        except Exception as e:
+            yield encoder.error(str(e))
+    
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+async def _start_summary_stream(
+    request: SummaryGenerateRequest,
+    db: Session,
+    summary_service: SummaryProvider,
+    persist: Optional[Callable[[str, PromptTemplate, Optional[dict]], dict]] = None
+):
+    """
+    템플릿 조회/캐시 확인 후 요약 생성 스트림 버퍼 시작
+
+    persist: 생성 완료 후 (요약, 템플릿, 계측)을 받아 저장하고 done 이벤트에 추가할 필드를 돌려주는 함수
+    """
+    # 녹취록 전처리 (프롬프트/캐시 키에만 사용, 원문은 그대로 저장)
+    prompt_text, preprocessing = await _preprocess(request.original_text)
+    
+    # 프롬프트 템플릿 가져오기 (지정하지 않으면 녹취록 언어별 기본 활성 템플릿)
+    template, detection = route_template(db, prompt_text, request.prompt_template_id)
+    
+    if not template:
+        raise HTTPException(status_code=404, detail="사용 가능한 프롬프트 템플릿이 없습니다")
+    
+    cache_key = summary_cache_key(prompt_text, template, summary_service)
+    cached = None if request.force_refresh else summary_cache.get(cache_key, db)
+    plan = None if cached else await _plan_request(prompt_text, template)
+    
+    # 업스트림은 구독자와 별도 태스크에서 끝까지 실행되므로 연결이 끊겨도 계측이 기록됨
+    # (요청 세션은 응답이 끝나면 닫히므로 기록할 때마다 전용 세션 사용)
+    def record_result(trace, summary_text: Optional[str] = None) -> Optional[int]:
+        session = SessionLocal()
+        try:
+            row = telemetry_store.record(trace, session)
+            if summary_text is not None:
+                summary_cache.set(cache_key, cache_value(summary_text, template, summary_service), session)
+            return row.id if row else None
+        finally:
+            session.close()
+    
+    async def upstream():
+        trace = start_trace(
+            template.id, template.version, streamed=True,
+            preprocess_tokens_saved=preprocessing["tokens_saved"], language=detection["language"]
+        )
+        parts = []
+        usage = None
+        try:
+            response = await summary_service.summarize_japanese_to_korean(
+                japanese_text=prompt_text,
+                prompt_template=template.template_text,
+                stream=True,
+                template_key=template_key(template),
+                plan=plan
+            )
+            async for chunk in response:
+                if chunk["type"] == "content":
+                    trace.mark_first_token()
+                    parts.append(chunk["content"])
+                elif chunk["type"] == "usage":
+                    usage = chunk["usage"]
+                yield chunk
+        except Exception as e:
+            trace.finish(False, usage, str(e))
+            record_result(trace)
+            raise
+        
+        trace.finish(True, usage)
+        summary_text = summary_service._clean_markdown("".join(parts))
+        telemetry_id = record_result(trace, summary_text)
+        yield {"type": "telemetry", "telemetry": {"id": telemetry_id, **trace.metrics()}}
+    
+    # 요약 델타: 업스트림(진행 중이면 합류) 청크를 도착하는 대로 마크다운 정리
+    # (전송 합계 = 최종 요약, 종료 시 재작성 없음). 캐시 적중이면 저장된 요약 그대로
+    # 항목 분리도 정리된 델타를 받는 대로 줄 단위로 진행 (종료 시 요약 전체 재파싱 없음)
+    stream_state = {"telemetry": None, "summary": "", "sections": {}}
+    
+    async def summary_deltas():
+        if cached:
+            stream_state["summary"] = cached["summary"]
+            stream_state["sections"] = parse_sections(cached["summary"])
+            yield cached["summary"]
+            return
+        
+        response, _ = summary_flights.stream(cache_key, upstream)
+        cleaner = StreamingMarkdownCleaner()
+        sections = SectionParser()
+        async for chunk in response:
+            if chunk["type"] == "telemetry":
+                stream_state["telemetry"] = chunk["telemetry"]
+            elif chunk["type"] == "content":
+                delta = cleaner.feed(chunk["content"])
+                sections.feed(delta)
+                yield delta
+        delta = cleaner.finish()
+        sections.feed(delta)
+        yield delta
+        stream_state["summary"] = cleaner.text
+        stream_state["sections"] = sections.finish()
+    
+    # 생성은 스트림 버퍼로 끝까지 진행 (연결이 끊겨도 stream_id + Last-Event-ID로 재개)
+    def stream_result() -> dict:
+        telemetry = stream_state["telemetry"]
+        result = {
+            "telemetry_id": telemetry["id"] if telemetry else None,
+            "telemetry": telemetry,
+            "sections": stream_state["sections"]
+        }
+        if persist:
+            result.update(persist(stream_state["summary"], template, telemetry))
+        return result
+    
+    return summary_streams.start(
+        {
+            "template_used": template.name,
+            "consultation_date": str(request.consultation_date or date.today()),
+            "cached": bool(cached),
+            "language": detection,
+            "preprocessing": preprocessing
+        },
+        summary_deltas(),
+        stream_result
+    )
 
 # API 엔드포인트들
 @router.post("/generate", response_model=dict)
 async def generate_summary(
     request: SummaryGenerateRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    summary_service: SummaryProvider = Depends(get_summary_provider)
 ):
     """AI를 이용한 상담 요약 생성"""
     try:
-        # 프롬프트 템플릿 가져오기
-        if request.prompt_template_id:
-            template = db.query(PromptTemplate).filter(
-                PromptTemplate.id == request.prompt_template_id,
-                PromptTemplate.is_active == True
-            ).first()
-        else:
-            # 기본 활성 템플릿 사용
-            template = db.query(PromptTemplate).filter(
-                PromptTemplate.is_active == True
-            ).order_by(PromptTemplate.created_at.desc()).first()
+        # 녹취록 전처리 후 템플릿 선택 (지정하지 않으면 녹취록 언어별 기본 활성 템플릿)
+        prompt_text, preprocessing = await _preprocess(request.original_text)
+        template, detection = route_template(db, prompt_text, request.prompt_template_id)
         
         if not template:
             raise HTTPException(status_code=404, detail="사용 가능한 프롬프트 템플릿이 없습니다")
         
-        # OpenAI API를 통한 요약 생성
-        openai_service = OpenAISummaryService()
-        result = await openai_service.summarize_japanese_to_korean(
-            japanese_text=request.original_text,
-            prompt_template=template.template_text
-        )
+        # 동일 원문/템플릿/모델 요청은 캐시에서 바로 반환
+        cache_key = summary_cache_key(prompt_text, template, summary_service)
+        cached = None if request.force_refresh else summary_cache.get(cache_key, db)
         
-        if not result["success"]:
-            raise HTTPException(status_code=500, detail=f"AI 요약 생성 실패: {result['error']}")
-        
-        logger.info(f"AI 요약 생성 완료: {len(request.original_text)} -> {len(result['summary'])} 글자")
+        if cached:
+            summary_text = cached["summary"]
+            logger.info(f"AI 요약 캐시 적중: {cache_key[:12]}")
+        else:
+            # 토큰 예산 사전 계획 후 요약 제공자 라우터를 통한 요약 생성 (공유 클라이언트 풀, 중복 요청 합류)
+            plan = await _plan_request(prompt_text, template)
+            result = await generate_cached_summary(
+                prompt_text, template, summary_service, cache_key, plan, preprocessing, detection["language"]
+            )
+            
+            if not result["success"]:
+                raise _generation_failure(result)
+            
+            summary_text = result["summary"]
+            logger.info(
+                f"AI 요약 생성 완료: {len(request.original_text)} -> {len(summary_text)} 글자 "
+                f"(전처리 절감 약 {preprocessing['tokens_saved']} 토큰)"
+            )
         
+        telemetry = None if cached else result.get("telemetry")
         return {
-            "summary": result["summary"],
+            "summary": summary_text,
+            "sections": parse_sections(summary_text),
             "original_text": request.original_text,
             "template_used": template.name,
-            "consultation_date": request.consultation_date or date.today()
+            "consultation_date": request.consultation_date or date.today(),
+            "cached": bool(cached),
+            "language": detection,
+            "preprocessing": preprocessing,
+            "telemetry_id": telemetry["id"] if telemetry else None,
+            "telemetry": telemetry
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"요약 생성 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -105,84 +344,92 @@ async def generate_summary(
 @router.post("/generate/stream")
 async def generate_summary_stream(
     request: SummaryGenerateRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    summary_service: SummaryProvider = Depends(get_summary_provider)
 ):
     """AI를 이용한 상담 요약 생성 (스트리밍)"""
     try:
-        # 프롬프트 템플릿 가져오기
-        if request.prompt_template_id:
-            template = db.query(PromptTemplate).filter(
-                PromptTemplate.id == request.prompt_template_id,
-                PromptTemplate.is_active == True
-            ).first()
-        else:
-            # 기본 활성 템플릿 사용
-            template = db.query(PromptTemplate).filter(
-                PromptTemplate.is_active == True
-            ).order_by(PromptTemplate.created_at.desc()).first()
-        
-        if not template:
-            raise HTTPException(status_code=404, detail="사용 가능한 프롬프트 템플릿이 없습니다")
+        return _stream_response(await _start_summary_stream(request, db, summary_service))
         
-        # OpenAI API를 통한 스트리밍 요약 생성
-        openai_service = OpenAISummaryService()
-        
-        async def generate():
-            try:
-                # 스트리밍 응답 받기
-                response = await openai_service.summarize_japanese_to_korean(
-                    japanese_text=request.original_text,
-                    prompt_template=template.template_text,
-                    stream=True
-                )
-                
-                full_summary = ""
-                
-                # 스트리밍 청크를 SSE 형식으로 전송
-                for chunk in response:
-                    if chunk.choices[0].delta.content is not None:
-                        content = chunk.choices[0].delta.content
-                        full_summary += content
-                        
-                        # SSE 형식으로 데이터 전송
-                        data = {
-                            "type": "content",
-                            "content": content,
-                            "accumulated": full_summary
-                        }
-                        yield f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
-                
-                # 완료 신호 전송
-                final_data = {
-                    "type": "done",
-                    "summary": openai_service._clean_markdown(full_summary),
-                    "template_used": template.name,
-                    "consultation_date": str(request.consultation_date or date.today())
-                }
-                yield f"data: {json.dumps(final_data, ensure_ascii=False)}\n\n"
-                
-            except Exception as e:
-                error_data = {
-                    "type": "error",
-                    "error": str(e)
-                }
-                yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n"
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"스트리밍 요약 생성 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/generate/stream/save")
+async def generate_and_save_summary_stream(
+    request: SummaryGenerateSaveRequest,
+    created_by: str = "system",
+    db: Session = Depends(get_db),
+    summary_service: SummaryProvider = Depends(get_summary_provider)
+):
+    """AI 요약 스트리밍 생성 후 서버에서 바로 저장 (done 이벤트에 summary_id, 원문 재업로드 불필요)"""
+    # 저장은 스트림 완료 시 백그라운드에서 실행되므로 (클라이언트가 끊겨도 저장) 요청 세션 대신 전용 세션 사용
+    def persist(summary_text: str, template: PromptTemplate, telemetry: Optional[dict]) -> dict:
+        db = SessionLocal()
+        try:
+            db_summary = ConsultationSummary(
+                consultation_date=request.consultation_date or date.today(),
+                original_text=request.original_text,
+                summary_text=summary_text,
+                prompt_template_id=template.id,
+                procedures_discussed=discussed_procedures(
+                    db, request.procedures_discussed, request.original_text, summary_text
+                ),
+                consultant_name=request.consultant_name,
+                customer_name=request.customer_name,
+                consultation_title=request.consultation_title,
+                created_by=created_by
+            )
+            
+            db.add(db_summary)
+            db.commit()
+            db.refresh(db_summary)
+            
+            attach_telemetry(db_summary, telemetry["id"] if telemetry else None, db)
+            summary_id = db_summary.id
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
         
-        return StreamingResponse(
-            generate(),
-            media_type="text/plain",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "*"
-            }
-        )
+        logger.info(f"스트리밍 요약 생성 후 저장 완료: ID {summary_id}")
+        return {"summary_id": summary_id}
+    
+    try:
+        return _stream_response(await _start_summary_stream(request, db, summary_service, persist))
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"스트리밍 요약 생성 중 오류: {str(e)}")
+        logger.error(f"스트리밍 요약 생성/저장 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/generate/stream/{stream_id}")
+async def resume_summary_stream(
+    stream_id: str,
+    last_event_id: Optional[str] = Header(None),
+    offset: Optional[int] = Query(None, ge=0, description="Last-Event-ID 대신 쓸 수 있는 재개 오프셋 (글자 수)")
+):
+    """끊긴 스트리밍 요약 재개 (진행 중인 생성을 이어 받음, LLM 재호출 없음)"""
+    buffer = await summary_streams.get(stream_id)
+    if buffer is None:
+        raise HTTPException(status_code=404, detail="스트림이 없거나 만료되었습니다. 요약을 다시 생성해주세요")
+    
+    try:
+        start = offset if offset is not None else int(last_event_id or 0)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Last-Event-ID 형식이 올바르지 않습니다")
+    
+    prefix = await buffer.prefix(start)
+    if len(prefix) < start:
+        raise HTTPException(status_code=409, detail="재개 오프셋이 생성된 요약 길이를 넘습니다")
+    
+    logger.info(f"스트리밍 요약 재개: {stream_id[:8]} @ {start}")
+    return _stream_response(buffer, start, prefix)
+
 @router.post("/direct", response_model=SummaryResponse)
 async def create_summary_direct(
     summary: SummaryCreateDirect,
@@ -191,11 +438,9 @@ async def create_summary_direct(
 ):
     """상담 요약 직접 저장 (AI 생성 없이)"""
     try:
-        # 프롬프트 템플릿 확인 (옵션)
+        # 프롬프트 템플릿 확인 (옵션, 과거 버전 포함)
         if summary.prompt_template_id:
-            template = db.query(PromptTemplate).filter(
-                PromptTemplate.id == summary.prompt_template_id
-            ).first()
+            template = find_template(db, summary.prompt_template_id, active_only=False)
             if not template:
                 raise HTTPException(status_code=404, detail="프롬프트 템플릿을 찾을 수 없습니다")
         
@@ -205,7 +450,9 @@ async def create_summary_direct(
             original_text=summary.original_text,
             summary_text=summary.summary_text,
             prompt_template_id=summary.prompt_template_id,
-            procedures_discussed=summary.procedures_discussed,
+            procedures_discussed=discussed_procedures(
+                db, summary.procedures_discussed, summary.original_text, summary.summary_text
+            ),
             consultant_name=summary.consultant_name,
             customer_name=summary.customer_name,
             consultation_title=summary.consultation_title,
@@ -216,6 +463,8 @@ async def create_summary_direct(
         db.commit()
         db.refresh(db_summary)
         
+        attach_telemetry(db_summary, summary.telemetry_id, db)
+        
         logger.info(f"상담 요약 직접 저장 완료: ID {db_summary.id}")
         return db_summary
         
@@ -228,44 +477,42 @@ async def create_summary_direct(
 async def create_summary(
     summary: SummaryCreate,
     created_by: str = "system",
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    summary_service: SummaryProvider = Depends(get_summary_provider)
 ):
     """상담 요약 저장 (AI 생성 포함)"""
     try:
-        # 프롬프트 템플릿 확인
-        if summary.prompt_template_id:
-            template = db.query(PromptTemplate).filter(
-                PromptTemplate.id == summary.prompt_template_id
-            ).first()
-            if not template:
-                raise HTTPException(status_code=404, detail="프롬프트 템플릿을 찾을 수 없습니다")
-        
-        # AI 요약 생성
-        if summary.prompt_template_id:
-            template = db.query(PromptTemplate).filter(
-                PromptTemplate.id == summary.prompt_template_id
-            ).first()
-        else:
-            template = db.query(PromptTemplate).filter(
-                PromptTemplate.is_active == True
-            ).order_by(PromptTemplate.created_at.desc()).first()
+        # 프롬프트 템플릿 확인 (지정하지 않으면 녹취록 언어별 기본 활성 템플릿, 한 번만 조회)
+        prompt_text, preprocessing = await _preprocess(summary.original_text)
+        template, detection = route_template(db, prompt_text, summary.prompt_template_id, active_only=False)
+        if not template:
+            raise HTTPException(status_code=404, detail="프롬프트 템플릿을 찾을 수 없습니다")
         
-        openai_service = OpenAISummaryService()
-        result = await openai_service.summarize_japanese_to_korean(
-            japanese_text=summary.original_text,
-            prompt_template=template.template_text
-        )
+        cache_key = summary_cache_key(prompt_text, template, summary_service)
+        cached = summary_cache.get(cache_key, db)
         
-        if not result["success"]:
-            raise HTTPException(status_code=500, detail=f"AI 요약 생성 실패: {result['error']}")
+        telemetry_id = None
+        if cached:
+            summary_text = cached["summary"]
+        else:
+            plan = await _plan_request(prompt_text, template)
+            result = await generate_cached_summary(
+                prompt_text, template, summary_service, cache_key, plan, preprocessing, detection["language"]
+            )
+            
+            if not result["success"]:
+                raise _generation_failure(result)
+            
+            summary_text = result["summary"]
+            telemetry_id = result["telemetry"]["id"]
         
         # DB에 저장
         db_summary = ConsultationSummary(
             consultation_date=summary.consultation_date,
             original_text=summary.original_text,
-            summary_text=result["summary"],
+            summary_text=summary_text,
             prompt_template_id=summary.prompt_template_id or template.id,
-            procedures_discussed=summary.procedures_discussed,
+            procedures_discussed=discussed_procedures(db, summary.procedures_discussed, summary.original_text, summary_text),
             created_by=created_by
         )
         
@@ -273,23 +520,157 @@ async def create_summary(
         db.commit()
         db.refresh(db_summary)
         
+        attach_telemetry(db_summary, telemetry_id, db)
+        
         logger.info(f"상담 요약 저장 완료: ID {db_summary.id}")
         return db_summary
         
+    except HTTPException:
+        db.rollback()
+        raise
     except Exception as e:
         db.rollback()
         logger.error(f"상담 요약 저장 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/jobs", response_model=SummaryJobResponse, status_code=202)
+def submit_summary_job(
+    request: SummaryJobCreate,
+    created_by: str = "system",
+    db: Session = Depends(get_db)
+):
+    """요약 생성 작업 등록 (워커 프로세스가 처리, 상태는 조회 또는 SSE로 확인)"""
+    try:
+        job = summary_job_queue.submit(
+            db,
+            created_by=created_by,
+            original_text=request.original_text,
+            consultation_date=request.consultation_date,
+            prompt_template_id=request.prompt_template_id,
+            procedures_discussed=request.procedures_discussed,
+            consultant_name=request.consultant_name,
+            customer_name=request.customer_name,
+            consultation_title=request.consultation_title,
+            force_refresh=request.force_refresh,
+            save_result=request.save_result
+        )
+        logger.info(f"요약 작업 등록: ID {job.id}")
+        return job
+        
+    except Exception as e:
+        db.rollback()
+        logger.error(f"요약 작업 등록 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/jobs/stats", response_model=dict)
+def get_summary_job_stats(db: Session = Depends(get_db)):
+    """요약 작업 큐 상태별 건수 및 최장 대기 시간"""
+    return summary_job_queue.get_stats(db)
+
+@router.get("/jobs/{job_id}", response_model=SummaryJobResponse)
+def get_summary_job(job_id: int, db: Session = Depends(get_db)):
+    """요약 작업 상태 조회 (폴링)"""
+    job = db.get(SummaryJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="요약 작업을 찾을 수 없습니다")
+    return job
+
+def _job_snapshot(job_id: int) -> Optional[dict]:
+    """작업 상태 1회 조회 (폴링마다 짧은 세션을 열고 바로 반환해 구독 중 연결을 붙잡지 않음)"""
+    db = SessionLocal()
+    try:
+        job = db.get(SummaryJob, job_id)
+        return SummaryJobResponse.model_validate(job).model_dump(mode="json") if job else None
+    finally:
+        db.close()
+
+@router.get("/jobs/{job_id}/events")
+async def stream_summary_job_events(job_id: int):
+    """요약 작업 상태 변경을 SSE로 전송 (status 이벤트, 완료/실패 시 종료)"""
+    snapshot = _job_snapshot(job_id)
+    if not snapshot:
+        raise HTTPException(status_code=404, detail="요약 작업을 찾을 수 없습니다")
+    
+    async def generate():
+        job = snapshot
+        last_state = None
+        last_sent = time.monotonic()
+        while True:
+            if job is None:  # 구독 중 삭제된 작업
+                return
+            state = (job["status"], job["attempts"])
+            if state != last_state:
+                last_state = state
+                last_sent = time.monotonic()
+                yield sse_event("status", job)
+                if job["status"] in TERMINAL_STATUSES:
+                    return
+            elif time.monotonic() - last_sent >= settings.SSE_HEARTBEAT_SECONDS:
+                last_sent = time.monotonic()
+                yield SummaryStreamEncoder.heartbeat()
+            await asyncio.sleep(settings.SUMMARY_JOB_POLL_SECONDS)
+            job = _job_snapshot(job_id)
+    
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@router.get("/telemetry/stats", response_model=dict)
+def get_summary_telemetry_stats(
+    days: int = Query(7, ge=1, le=365),
+    streamed: Optional[bool] = None,
+    db: Session = Depends(get_db)
+):
+    """템플릿 버전/모델별 생성 지연시간 분위수 (대기, 첫 토큰, 전체, 초당 출력 토큰)"""
+    return {
+        "days": days,
+        "groups": telemetry_store.aggregate(db, days=days, streamed=streamed)
+    }
+
+@router.get("/cache/stats", response_model=dict)
+def get_summary_cache_stats():
+    """요약 결과 캐시 적중/미스 및 진행 중 생성 합류 통계"""
+    return {
+        **summary_cache.get_stats(),
+        "in_flight": summary_flights.get_stats(),
+        "streams": summary_streams.get_stats(),
+        "templates": template_registry.get_stats(),
+        "procedure_matcher": procedure_matcher.get_stats()
+    }
+
+@router.get("/prompt-cache/stats", response_model=dict)
+def get_prompt_cache_stats(template_key: Optional[str] = Query(None, description="템플릿 키 (id:version)")):
+    """템플릿 버전별 제공자 프롬프트 캐시 적중률"""
+    return prompt_cache_stats.get_stats(template_key)
+
+@router.get("/providers/stats", response_model=dict)
+def get_provider_stats(summary_service: ProviderRouter = Depends(get_summary_provider)):
+    """요약 제공자별 지연시간 백분위수 및 장애 조치 통계"""
+    return summary_service.get_stats()
+
+# 상담 요약 목록 정렬 키 (최신 상담일 순, 같은 날은 최근 등록 순) - idx_summaries_date_id 인덱스와 같은 순서
+SUMMARY_PAGE_KEY = (ConsultationSummary.consultation_date, ConsultationSummary.id)
+
+def _summary_cursor(cursor: Optional[str]):
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor, (date, int))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/", response_model=List[SummaryResponse])
 def get_summaries(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: Optional[str] = Query(None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 헤더 값 (없으면 첫 페이지)"),
+    limit: int = Query(100, ge=1, le=500),
     start_date: Optional[date] = Query(None, description="시작 날짜"),
     end_date: Optional[date] = Query(None, description="종료 날짜"),
     db: Session = Depends(get_db)
 ):
-    """상담 요약 목록 조회"""
+    """
+    상담 요약 목록 조회 (키셋 페이지네이션)
+    
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 돌려줌
+    """
     query = db.query(ConsultationSummary)
     
     if start_date:
@@ -297,10 +678,57 @@ def get_summaries(
     if end_date:
         query = query.filter(ConsultationSummary.consultation_date <= end_date)
     
-    summaries = query.order_by(ConsultationSummary.consultation_date.desc())\
-                    .offset(skip).limit(limit).all()
+    summaries, next_cursor = keyset_page(query, SUMMARY_PAGE_KEY, _summary_cursor(cursor), limit, descending=True)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return summaries
 
+@router.get("/sections", response_model=List[dict])
+def get_summary_sections():
+    """요약 항목 목록 (키, 제목)"""
+    return [{"key": key, "title": title} for key, title, _ in SUMMARY_SECTIONS]
+
+@router.get("/sections/{section}", response_model=List[dict])
+def search_summary_section(
+    section: str,
+    response: Response,
+    q: Optional[str] = Query(None, description="항목 본문 검색어"),
+    cursor: Optional[str] = Query(None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 헤더 값 (없으면 첫 페이지)"),
+    limit: int = Query(100, ge=1, le=500),
+    start_date: Optional[date] = Query(None, description="시작 날짜"),
+    end_date: Optional[date] = Query(None, description="종료 날짜"),
+    db: Session = Depends(get_db)
+):
+    """
+    항목별 조회 (예: 결정 사항만 모아 보기)
+    
+    sections ? 항목 조건은 GIN 인덱스로 걸러지고, 요약 본문은 읽지 않음
+    """
+    if section not in SECTION_KEYS:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 요약 항목: {section}")
+    
+    section_text = ConsultationSummary.sections[section].astext
+    query = db.query(
+        ConsultationSummary.id,
+        ConsultationSummary.consultation_date,
+        ConsultationSummary.consultant_name,
+        ConsultationSummary.customer_name,
+        ConsultationSummary.consultation_title,
+        section_text.label("text")
+    ).filter(ConsultationSummary.sections.has_key(section))
+    
+    if q:
+        query = query.filter(section_text.ilike(f"%{q}%"))
+    if start_date:
+        query = query.filter(ConsultationSummary.consultation_date >= start_date)
+    if end_date:
+        query = query.filter(ConsultationSummary.consultation_date <= end_date)
+    
+    rows, next_cursor = keyset_page(query, SUMMARY_PAGE_KEY, _summary_cursor(cursor), limit, descending=True)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return [{**row._asdict(), "section": section} for row in rows]
+
 @router.get("/{summary_id}", response_model=SummaryResponse)
 def get_summary(summary_id: int, db: Session = Depends(get_db)):
     """특정 상담 요약 조회"""
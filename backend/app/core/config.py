@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 import os
 from dotenv import load_dotenv
 
@@ -66,6 +66,93 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     
+    # AI 제공자 HTTP 커넥션 풀 설정 (프로세스 전체 공유)
+    OPENAI_MAX_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    OPENAI_KEEPALIVE_EXPIRY: float = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "120"))
+    OPENAI_TIMEOUT: float = float(os.getenv("OPENAI_TIMEOUT", "120"))
+    OPENAI_WARMUP_CONNECTIONS: int = int(os.getenv("OPENAI_WARMUP_CONNECTIONS", "2"))
+    
+    # 요약 결과 캐시 설정 (프로세스 내 LRU + Postgres 영속 계층)
+    SUMMARY_CACHE_MAX_ENTRIES: int = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "512"))
+    SUMMARY_CACHE_TTL_SECONDS: int = int(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "604800"))
+    SUMMARY_CACHE_PERSIST: bool = os.getenv("SUMMARY_CACHE_PERSIST", "True").lower() == "true"
+    
+    # 녹취록 전처리 (요약 전 토큰 절감, 빈 값이면 전처리 안 함)
+    TRANSCRIPT_PREPROCESS_STEPS: str = os.getenv("TRANSCRIPT_PREPROCESS_STEPS", "nfkc,timestamps,labels,fillers,loops")
+    TRANSCRIPT_LOOP_MIN_REPEATS: int = int(os.getenv("TRANSCRIPT_LOOP_MIN_REPEATS", "4"))
+    
+    # 녹취록 언어 판정 (한국어/혼합 상담은 번역 없는 요약 전용 템플릿으로)
+    LANGUAGE_DETECT_DOMINANT_RATIO: float = float(os.getenv("LANGUAGE_DETECT_DOMINANT_RATIO", "0.9"))
+    LANGUAGE_DETECT_MIN_CHARS: int = int(os.getenv("LANGUAGE_DETECT_MIN_CHARS", "20"))
+    
+    # 시술 언급 자동 추출 (다른 프로세스의 시술 변경 확인 간격)
+    PROCEDURE_MATCHER_REFRESH_SECONDS: int = int(os.getenv("PROCEDURE_MATCHER_REFRESH_SECONDS", "60"))
+    
+    # 긴 녹취록 map-reduce 요약 설정
+    LONG_TRANSCRIPT_THRESHOLD_TOKENS: int = int(os.getenv("LONG_TRANSCRIPT_THRESHOLD_TOKENS", "10000"))
+    MAX_TRANSCRIPT_TOKENS: int = int(os.getenv("MAX_TRANSCRIPT_TOKENS", "200000"))
+    TRANSCRIPT_CHUNK_CHARS: int = int(os.getenv("TRANSCRIPT_CHUNK_CHARS", "6000"))
+    MAP_REDUCE_CONCURRENCY: int = int(os.getenv("MAP_REDUCE_CONCURRENCY", "4"))
+    
+    # 요약 제공자 라우팅 (우선순위 순, 장애 조치 및 hedge 요청)
+    LLM_PROVIDER_ORDER: str = os.getenv("LLM_PROVIDER_ORDER", "openai,gemini")
+    LLM_HEDGE_ENABLED: bool = os.getenv("LLM_HEDGE_ENABLED", "False").lower() == "true"
+    LLM_HEDGE_MIN_DELAY_MS: int = int(os.getenv("LLM_HEDGE_MIN_DELAY_MS", "1500"))
+    
+    # 제공자 승인 제어 (분당 요청/토큰 한도, 0이면 제한 없음 + AIMD 동시 실행 창)
+    OPENAI_RPM: int = int(os.getenv("OPENAI_RPM", "500"))
+    OPENAI_TPM: int = int(os.getenv("OPENAI_TPM", "200000"))
+    GEMINI_RPM: int = int(os.getenv("GEMINI_RPM", "360"))
+    GEMINI_TPM: int = int(os.getenv("GEMINI_TPM", "4000000"))
+    LLM_INITIAL_CONCURRENCY: int = int(os.getenv("LLM_INITIAL_CONCURRENCY", "8"))
+    LLM_MIN_CONCURRENCY: int = int(os.getenv("LLM_MIN_CONCURRENCY", "1"))
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "64"))
+    LLM_ADMISSION_MAX_WAIT: float = float(os.getenv("LLM_ADMISSION_MAX_WAIT", "120"))
+    
+    # 제공자 장애 대응 (재시도 예산, 회로 차단, 응답 기한)
+    LLM_MAX_ATTEMPTS: int = int(os.getenv("LLM_MAX_ATTEMPTS", "3"))
+    LLM_RETRY_BUDGET_RATIO: float = float(os.getenv("LLM_RETRY_BUDGET_RATIO", "0.2"))
+    LLM_BACKOFF_BASE: float = float(os.getenv("LLM_BACKOFF_BASE", "0.5"))
+    LLM_BACKOFF_CAP: float = float(os.getenv("LLM_BACKOFF_CAP", "20"))
+    LLM_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5"))
+    LLM_BREAKER_RECOVERY_SECONDS: float = float(os.getenv("LLM_BREAKER_RECOVERY_SECONDS", "30"))
+    LLM_FIRST_TOKEN_TIMEOUT: float = float(os.getenv("LLM_FIRST_TOKEN_TIMEOUT", "30"))
+    LLM_STREAM_IDLE_TIMEOUT: float = float(os.getenv("LLM_STREAM_IDLE_TIMEOUT", "30"))
+    LLM_REQUEST_TIMEOUT: float = float(os.getenv("LLM_REQUEST_TIMEOUT", "180"))
+    
+    # 요약 스트리밍 SSE (델타 묶음 간격, 유휴 ping 간격, 체크섬 체크포인트 간격)
+    SSE_COALESCE_MS: int = int(os.getenv("SSE_COALESCE_MS", "50"))
+    SSE_HEARTBEAT_SECONDS: float = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+    SSE_CHECKPOINT_CHARS: int = int(os.getenv("SSE_CHECKPOINT_CHARS", "1000"))
+    
+    # 재개 가능한 요약 스트림 버퍼 (Last-Event-ID 재접속, 공유 백엔드는 선택: redis://...)
+    STREAM_BUFFER_TTL_SECONDS: float = float(os.getenv("STREAM_BUFFER_TTL_SECONDS", "600"))
+    STREAM_BUFFER_MAX_STREAMS: int = int(os.getenv("STREAM_BUFFER_MAX_STREAMS", "500"))
+    STREAM_BUFFER_REDIS_URL: str = os.getenv("STREAM_BUFFER_REDIS_URL", "")
+    
+    # 프롬프트 템플릿 레지스트리 캐시 (지문 확인 간격, 과거 버전 보관 개수)
+    TEMPLATE_CACHE_REFRESH_SECONDS: float = float(os.getenv("TEMPLATE_CACHE_REFRESH_SECONDS", "30"))
+    TEMPLATE_CACHE_MAX_INACTIVE: int = int(os.getenv("TEMPLATE_CACHE_MAX_INACTIVE", "32"))
+    
+    # 요약 작업 큐 (summary_worker.py 워커 프로세스)
+    SUMMARY_JOB_CONCURRENCY: int = int(os.getenv("SUMMARY_JOB_CONCURRENCY", "4"))  # 워커 프로세스당 동시 처리 작업 수
+    SUMMARY_JOB_VISIBILITY_SECONDS: float = float(os.getenv("SUMMARY_JOB_VISIBILITY_SECONDS", "300"))  # 하트비트가 끊기면 이 시간 후 재할당
+    SUMMARY_JOB_MAX_ATTEMPTS: int = int(os.getenv("SUMMARY_JOB_MAX_ATTEMPTS", "3"))
+    SUMMARY_JOB_RETRY_BASE_SECONDS: float = float(os.getenv("SUMMARY_JOB_RETRY_BASE_SECONDS", "10"))
+    SUMMARY_JOB_RETRY_CAP_SECONDS: float = float(os.getenv("SUMMARY_JOB_RETRY_CAP_SECONDS", "300"))
+    SUMMARY_JOB_POLL_SECONDS: float = float(os.getenv("SUMMARY_JOB_POLL_SECONDS", "1.0"))  # 빈 큐 폴링 / 상태 SSE 조회 간격
+    
+    # 가짜 LLM 제공자 (LLM_PROVIDER_ORDER에 fake 포함 시 사용, 부하 테스트용)
+    FAKE_LLM_PROFILE: str = os.getenv("FAKE_LLM_PROFILE", "realistic")  # instant, fast, realistic, slow, heavy_tail
+    FAKE_LLM_TTFT_MS: Optional[float] = float(os.getenv("FAKE_LLM_TTFT_MS")) if os.getenv("FAKE_LLM_TTFT_MS") else None
+    FAKE_LLM_TOKENS_PER_SEC: Optional[float] = float(os.getenv("FAKE_LLM_TOKENS_PER_SEC")) if os.getenv("FAKE_LLM_TOKENS_PER_SEC") else None
+    FAKE_LLM_JITTER: Optional[str] = os.getenv("FAKE_LLM_JITTER") or None  # none, uniform, normal, lognormal, exponential, pareto
+    FAKE_LLM_JITTER_SCALE: Optional[float] = float(os.getenv("FAKE_LLM_JITTER_SCALE")) if os.getenv("FAKE_LLM_JITTER_SCALE") else None
+    FAKE_LLM_ERROR_RATE: float = float(os.getenv("FAKE_LLM_ERROR_RATE", "0"))
+    FAKE_LLM_RATE_LIMIT_RATE: float = float(os.getenv("FAKE_LLM_RATE_LIMIT_RATE", "0"))
+    FAKE_LLM_SEED: int = int(os.getenv("FAKE_LLM_SEED", "0"))
+    
     # CORS 설정 (환경별)
     @property
     def ALLOWED_ORIGINS(self) -> List[str]:
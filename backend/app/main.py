@@ -2,8 +2,12 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from .core.config import settings
-from .core.database import engine, Base
+from .core.database import engine, Base, SessionLocal
 from .api import procedures, summaries
+from .services.provider_clients import provider_registry
+from .services.template_registry import template_registry
+from .services.procedure_matcher import procedure_matcher
+from contextlib import asynccontextmanager
 import logging
 
 # 로깅 설정
@@ -13,13 +17,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 앱 수명주기: AI 제공자 클라이언트 풀 생성/정리, 프롬프트 템플릿/시술 매처 적재
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await provider_registry.startup()
+    db = SessionLocal()
+    try:
+        template_registry.load(db)
+        procedure_matcher.load(db)
+    except Exception as e:
+        # DB 미준비 시 첫 조회 때 적재
+        logger.warning(f"프롬프트 템플릿/시술 매처 사전 적재 실패: {str(e)}")
+    finally:
+        db.close()
+    try:
+        yield
+    finally:
+        await provider_registry.shutdown()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="포르테 시술 상담 지원 플랫폼 API",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -29,6 +52,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # 목록 API 다음 페이지 커서
 )
 
 # 데이터베이스 테이블 생성
@@ -1,4 +1,4 @@
 from .procedure import Procedure, ProcedureHistory
-from .summary import ConsultationSummary, PromptTemplate
+from .summary import ConsultationSummary, PromptTemplate, SummaryCacheEntry, SummaryTelemetry, SummaryJob
 
-__all__ = ["Procedure", "ProcedureHistory", "ConsultationSummary", "PromptTemplate"]
\ No newline at end of file
+__all__ = ["Procedure", "ProcedureHistory", "ConsultationSummary", "PromptTemplate", "SummaryCacheEntry", "SummaryTelemetry", "SummaryJob"]
\ No newline at end of file
@@ -19,6 +19,7 @@ class Procedure(Base):
     precautions = Column(Text)
     price_info = Column(Text)
     additional_info = Column(JSON)  # RTF에서 파싱된 추가 정보
+    aliases = Column(JSON)  # 상담 중 언급 추출용 다른 이름 (일본어 가타카나명, 브랜드/제품명 등)
     last_updated = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     updated_by = Column(String(100))
     version = Column(Integer, default=1)
@@ -1,12 +1,16 @@
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, JSON, Boolean
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, JSON, Boolean, Float, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import validates
 from sqlalchemy.sql import func
 from ..core.database import Base
+from ..services.prompt_builder import parse_template
+from ..services.summary_sections import parse_sections
 
 class ConsultationSummary(Base):
     __tablename__ = "consultation_summaries"
     
     id = Column(Integer, primary_key=True, index=True)
-    consultation_date = Column(Date, index=True)
+    consultation_date = Column(Date, nullable=False)  # 목록 키셋 페이지네이션 정렬 키 (NULL이면 커서 비교에서 빠짐)
     original_text = Column(Text, nullable=False)  # 일본어 원문
     summary_text = Column(Text, nullable=False)   # 한국어 요약
     prompt_template_id = Column(Integer, index=True)
@@ -14,9 +18,21 @@ class ConsultationSummary(Base):
     consultant_name = Column(String(100))  # 상담자 이름
     customer_name = Column(String(100))    # 고객 이름
     consultation_title = Column(String(255))  # 상담명
+    generation_metrics = Column(JSON)  # AI 생성 계측 (제공자, 모델, 첫 토큰 시간, 토큰 수 등)
+    sections = Column(JSONB)  # 요약 항목별 본문 (customer_info, decisions 등, GIN 인덱스)
     created_by = Column(String(100))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
+    __table_args__ = (
+        Index("idx_summaries_date_id", consultation_date, id),  # 목록 키셋 페이지네이션 (상담일, ID)
+    )
+    
+    @validates("summary_text")
+    def validate_summary_text(self, key, value):
+        # 요약 본문이 바뀔 때마다 항목별 본문도 함께 갱신 (조회 시 본문을 다시 파싱하지 않도록)
+        self.sections = parse_sections(value)
+        return value
+
 class PromptTemplate(Base):
     __tablename__ = "prompt_templates"
     
@@ -29,4 +45,74 @@ class PromptTemplate(Base):
     is_active = Column(Boolean, default=True, index=True)
     created_from_guide = Column(Boolean, default=True)  # guide.md 기반 여부
     last_updated_from_guide = Column(DateTime(timezone=True))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    @validates("template_text")
+    def validate_template_text(self, key, value):
+        # 자리표시자/중괄호 오류가 있는 템플릿은 저장 시점에 거절 (TemplateCompileError)
+        parse_template(value)
+        return value
+
+class SummaryCacheEntry(Base):
+    __tablename__ = "summary_cache"
+    
+    cache_key = Column(String(64), primary_key=True)  # 원문/템플릿/모델/샘플링 파라미터 해시
+    summary_text = Column(Text, nullable=False)
+    model_used = Column(String(100))
+    prompt_template_id = Column(Integer)
+    template_version = Column(String(20))
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), index=True)
+
+class SummaryTelemetry(Base):
+    __tablename__ = "summary_telemetry"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    summary_id = Column(Integer, ForeignKey("consultation_summaries.id", ondelete="SET NULL"), index=True)
+    prompt_template_id = Column(Integer)
+    template_version = Column(String(20))
+    provider = Column(String(50))
+    model = Column(String(100))
+    language = Column(String(10))  # 녹취록 언어 판정 결과 (ja / ko / mixed)
+    streamed = Column(Boolean, default=False)
+    success = Column(Boolean, default=True)
+    error = Column(String(500))
+    queue_wait_ms = Column(Float)  # 승인 제어 대기 시간
+    ttft_ms = Column(Float)  # 첫 토큰까지 시간
+    total_ms = Column(Float)  # 전체 생성 시간
+    output_tokens_per_sec = Column(Float)  # 첫 토큰 이후 출력 속도
+    prompt_tokens = Column(Integer)
+    cached_tokens = Column(Integer)
+    completion_tokens = Column(Integer)
+    cost_usd = Column(Float)
+    preprocess_tokens_saved = Column(Integer)  # 녹취록 전처리로 줄인 예상 입력 토큰 수
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+class SummaryJob(Base):
+    __tablename__ = "summary_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(String(20), nullable=False, default="queued", index=True)  # queued, running, succeeded, failed
+    original_text = Column(Text, nullable=False)
+    consultation_date = Column(Date)
+    prompt_template_id = Column(Integer)
+    procedures_discussed = Column(JSON)
+    consultant_name = Column(String(100))
+    customer_name = Column(String(100))
+    consultation_title = Column(String(255))
+    force_refresh = Column(Boolean, default=False)
+    save_result = Column(Boolean, default=True)  # 완료 시 상담 요약으로 저장
+    created_by = Column(String(100))
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    available_at = Column(DateTime(timezone=True), server_default=func.now())  # 재시도 대기 후 다시 가져갈 수 있는 시각
+    locked_by = Column(String(100))  # 처리 중인 워커
+    locked_until = Column(DateTime(timezone=True))  # 가시성 타임아웃 (지나면 다른 워커가 다시 가져감)
+    summary_text = Column(Text)
+    summary_id = Column(Integer, ForeignKey("consultation_summaries.id", ondelete="SET NULL"))
+    telemetry_id = Column(Integer)
+    error = Column(String(500))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
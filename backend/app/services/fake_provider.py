@@ -0,0 +1,235 @@
+import asyncio
+import hashlib
+import logging
+import random
+import re
+from collections import OrderedDict
+from typing import Dict, Any, Optional, AsyncIterator, List
+from ..core.config import settings
+from .summary_provider import SummaryProvider, ProviderError, ProviderRateLimitError, failure_result
+from .token_estimator import token_estimator
+from .telemetry import mark_first_token
+
+logger = logging.getLogger(__name__)
+
+# 지연 프로필 프리셋 (FAKE_LLM_* 개별 설정이 있으면 덮어씀)
+LATENCY_PROFILES = {
+    "instant": {"ttft_ms": 0, "tokens_per_sec": 0, "jitter": "none", "jitter_scale": 0.0},
+    "fast": {"ttft_ms": 300, "tokens_per_sec": 150, "jitter": "uniform", "jitter_scale": 0.2},
+    "realistic": {"ttft_ms": 900, "tokens_per_sec": 60, "jitter": "lognormal", "jitter_scale": 0.35},
+    "slow": {"ttft_ms": 3000, "tokens_per_sec": 25, "jitter": "lognormal", "jitter_scale": 0.5},
+    "heavy_tail": {"ttft_ms": 900, "tokens_per_sec": 60, "jitter": "pareto", "jitter_scale": 2.5},
+}
+
+# 스트리밍할 한국어 요약 (실제 템플릿 출력 형식, 마크다운 포함)
+FAKE_SUMMARY = """## 1. 고객 정보 요약
+- **이름**: 다나카 님
+- **연령대**: 30대 후반 추정
+- **피부 타입**: 건조하고 민감한 편
+- **내원 목적 / 주요 피부 고민**: 이마와 눈가의 표정 주름, 볼 처짐
+
+## 2. 고객 성격 및 상담 태도
+- **말투**: 차분하고 정중함
+- **결정을 내리는 방식**: 충분히 설명을 듣고 신중하게 결정
+- **시술에 대한 태도**: 보톡스는 긍정적, 실 리프팅은 통증 때문에 망설임
+- **예민한 점**: 통증과 다운타임에 민감함
+
+## 3. 관심 시술 및 실제 제안 시술
+고객이 직접 언급한 시술:
+- 이마 보톡스, 눈가 보톡스
+
+상담자가 제안한 시술:
+- 보톡스 이마+눈가 패키지 (50유닛)
+- 울쎄라 300샷 (볼 처짐 개선)
+
+고객 반응:
+- 보톡스는 바로 진행 희망, 울쎄라는 가격 확인 후 보류
+
+## 4. 상담 결과 및 결정 사항
+실제 선택한 시술:
+- 보톡스 이마+눈가 패키지
+
+사전 약속:
+- 무통 크림 도포, 2주 후 무료 리터치
+
+## 5. 다음 상담 시 참고사항
+- 통증 민감도가 높아 마취 크림 충분히 사용
+- 울쎄라는 다음 방문 시 이벤트 가격으로 재안내
+
+## 6. 고객 워딩 및 인상적인 피드백
+- "자연스럽게 보였으면 좋겠어요"
+- "아픈 건 정말 싫어요"
+
+## 7. 상담자 전달력 및 커뮤니케이션 평가
+- 시술별 효과와 지속 기간을 구체적으로 설명함
+- 고객의 통증 우려에 공감하며 대안을 제시해 신뢰감을 줌"""
+
+# 한국어 기준 대략 토큰 단위로 나누기 (공백/문장부호 경계 + 2~3글자)
+TOKEN_SPLIT_PATTERN = re.compile(r'\s+|[^\s]{1,3}')
+
+# 호출 순번을 기억하는 원문 수 (오래 쓰지 않은 원문부터 잊음, 장시간 부하 테스트에서 메모리 고정)
+MAX_TRACKED_TEXTS = 10000
+
+class FakeSummaryProvider(SummaryProvider):
+    """
+    부하 테스트용 결정적 가짜 요약 제공자
+
+    같은 입력과 시드면 같은 지연/오류 패턴을 재현. 첫 토큰 시간, 초당 토큰 수,
+    지터 분포, 오류율, 429 주입을 설정으로 조절
+    """
+
+    name = "fake"
+    sampling_params = {}
+
+    def __init__(
+        self,
+        profile: str = "realistic",
+        ttft_ms: Optional[float] = None,
+        tokens_per_sec: Optional[float] = None,
+        jitter: Optional[str] = None,
+        jitter_scale: Optional[float] = None,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: int = 0
+    ):
+        preset = LATENCY_PROFILES.get(profile, LATENCY_PROFILES["realistic"])
+        self.profile = profile
+        self.ttft_ms = preset["ttft_ms"] if ttft_ms is None else ttft_ms
+        self.tokens_per_sec = preset["tokens_per_sec"] if tokens_per_sec is None else tokens_per_sec
+        self.jitter = preset["jitter"] if jitter is None else jitter
+        self.jitter_scale = preset["jitter_scale"] if jitter_scale is None else jitter_scale
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.seed = seed
+        self.use_real_api = True
+        self.model_name = f"fake-llm-{profile}"
+        self._tokens: List[str] = TOKEN_SPLIT_PATTERN.findall(FAKE_SUMMARY)
+        self._attempts: "OrderedDict[str, int]" = OrderedDict()
+
+    @classmethod
+    def from_settings(cls) -> "FakeSummaryProvider":
+        return cls(
+            profile=settings.FAKE_LLM_PROFILE,
+            ttft_ms=settings.FAKE_LLM_TTFT_MS,
+            tokens_per_sec=settings.FAKE_LLM_TOKENS_PER_SEC,
+            jitter=settings.FAKE_LLM_JITTER,
+            jitter_scale=settings.FAKE_LLM_JITTER_SCALE,
+            error_rate=settings.FAKE_LLM_ERROR_RATE,
+            rate_limit_rate=settings.FAKE_LLM_RATE_LIMIT_RATE,
+            seed=settings.FAKE_LLM_SEED
+        )
+
+    def _rng(self, japanese_text: str) -> random.Random:
+        """
+        시드 + 원문 + 같은 원문의 호출 순번으로 난수 생성기 생성
+
+        요청 순서와 무관하게 재현 가능하고, 같은 원문의 재시도는 다른 결과를 받음
+        """
+        text_hash = hashlib.sha256(japanese_text.encode("utf-8")).hexdigest()
+        attempt = self._attempts.pop(text_hash, 0)
+        self._attempts[text_hash] = attempt + 1
+        if len(self._attempts) > MAX_TRACKED_TEXTS:
+            self._attempts.popitem(last=False)
+        digest = hashlib.sha256(f"{self.seed}:{text_hash}:{attempt}".encode("utf-8")).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    def reset(self):
+        """
+        원문별 호출 순번 초기화 (부하 테스트 반복 시 첫 실행과 같은 패턴 재현)
+        """
+        self._attempts.clear()
+
+    def _jitter(self, rng: random.Random) -> float:
+        """
+        지연 배수 (평균 약 1)
+        """
+        if self.jitter == "uniform":
+            return max(0.0, rng.uniform(1 - self.jitter_scale, 1 + self.jitter_scale))
+        if self.jitter == "normal":
+            return max(0.0, rng.gauss(1.0, self.jitter_scale))
+        if self.jitter == "lognormal":
+            return rng.lognormvariate(-self.jitter_scale ** 2 / 2, self.jitter_scale)
+        if self.jitter == "exponential":
+            return rng.expovariate(1.0)
+        if self.jitter == "pareto":
+            # 꼬리가 두꺼운 분포 (jitter_scale = 형태 모수 alpha, 평균 1로 정규화)
+            alpha = max(self.jitter_scale, 1.01)
+            return rng.paretovariate(alpha) * (alpha - 1) / alpha
+        return 1.0
+
+    async def summarize_japanese_to_korean(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        stream: bool = False,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        가짜 요약 생성 (스트림을 끝까지 받아 실제 제공자와 같은 형식으로 반환)
+        """
+        if stream:
+            return self.stream_summary(japanese_text, prompt_template, template_key, plan)
+
+        try:
+            parts = []
+            usage_info = None
+            async for chunk in self.stream_summary(japanese_text, prompt_template, template_key, plan):
+                if chunk["type"] == "content":
+                    mark_first_token()
+                    parts.append(chunk["content"])
+                elif chunk["type"] == "usage":
+                    usage_info = chunk["usage"]
+
+            return {
+                "success": True,
+                "original_text": japanese_text,
+                "summary": self._clean_markdown("".join(parts)),
+                "source_language": "ja",
+                "target_language": "ko",
+                "model_used": self.model_name,
+                "tokens_used": usage_info
+            }
+        except Exception as e:
+            logger.error(f"가짜 제공자 호출 실패: {str(e)}")
+            return failure_result(japanese_text, e)
+
+    async def stream_summary(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        설정된 지연 프로필대로 가짜 요약을 토큰 단위로 스트리밍
+        """
+        rng = self._rng(japanese_text)
+
+        # 첫 토큰 전 대기 (이 시점에 429/오류 주입)
+        await asyncio.sleep(self.ttft_ms / 1000 * self._jitter(rng))
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            raise ProviderRateLimitError("가짜 제공자 요청 한도 초과 (429)", retry_after=1.0)
+        if roll < self.rate_limit_rate + self.error_rate:
+            raise ProviderError("가짜 제공자 오류 (500)", status_code=500)
+
+        max_tokens = plan["max_tokens"] if plan else len(self._tokens)
+        tokens = self._tokens[:max_tokens]
+        interval = 1 / self.tokens_per_sec if self.tokens_per_sec > 0 else 0.0
+
+        for index, token in enumerate(tokens):
+            if index and interval:
+                await asyncio.sleep(interval * self._jitter(rng))
+            yield {"type": "content", "content": token}
+
+        prompt_tokens = token_estimator.estimate(prompt_template) + token_estimator.estimate(japanese_text)
+        yield {
+            "type": "usage",
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(tokens),
+                "total_tokens": prompt_tokens + len(tokens),
+                "cached_tokens": 0
+            }
+        }
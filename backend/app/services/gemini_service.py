@@ -1,17 +1,68 @@
 import google.generativeai as genai
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, AsyncIterator, Tuple
 import logging
 from ..core.config import settings
+from .summary_provider import SummaryProvider, failure_result
+from .token_estimator import token_estimator
+from .prompt_builder import prompt_builder, DEFAULT_SOURCE_LANGUAGE
+from .telemetry import mark_first_token
 
 logger = logging.getLogger(__name__)
 
-class GeminiSummaryService:
-    def __init__(self):
+# 요약에 사용하는 모델
+MODEL_NAME = "gemini-1.5-pro"
+
+# 생성 파라미터 (요약 캐시 키에도 포함)
+GENERATION_CONFIG = {
+    "temperature": 0.2,  # 더 일관성 있는 요약을 위해 낮은 값
+    "max_output_tokens": 4000,  # Pro 모델이므로 더 많은 토큰 허용
+    "top_p": 0.8,
+    "top_k": 40,
+    "candidate_count": 1,
+    "stop_sequences": []
+}
+
+# 안전 설정 (모델 생성 시 한 번만 지정)
+SAFETY_SETTINGS = [
+    {
+        "category": "HARM_CATEGORY_HARASSMENT",
+        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
+    },
+    {
+        "category": "HARM_CATEGORY_HATE_SPEECH",
+        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
+    },
+    {
+        "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
+    },
+    {
+        "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
+        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
+    }
+]
+
+def create_generative_model() -> genai.GenerativeModel:
+    """
+    API 키를 설정하고 공유용 GenerativeModel 생성 (생성 파라미터/안전 설정 포함)
+    """
+    genai.configure(api_key=settings.GEMINI_API_KEY)
+    return genai.GenerativeModel(
+        MODEL_NAME,
+        generation_config=GENERATION_CONFIG,
+        safety_settings=SAFETY_SETTINGS
+    )
+
+class GeminiSummaryService(SummaryProvider):
+    name = "gemini"
+    model_name = MODEL_NAME
+    sampling_params = GENERATION_CONFIG
+
+    def __init__(self, model: Optional[genai.GenerativeModel] = None):
         self.use_real_api = bool(settings.GEMINI_API_KEY)
         
         if self.use_real_api:
-            genai.configure(api_key=settings.GEMINI_API_KEY)
-            self.model = genai.GenerativeModel('gemini-1.5-pro')
+            self.model = model or create_generative_model()
         else:
             logger.warning("GEMINI_API_KEY가 설정되지 않아 개발용 더미 응답을 사용합니다.")
             self.model = None
@@ -19,51 +70,35 @@ class GeminiSummaryService:
     async def summarize_japanese_to_korean(
         self, 
         japanese_text: str, 
-        prompt_template: str
-    ) -> Dict[str, Any]:
+        prompt_template: str,
+        stream: bool = False,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> Any:
         """
         일본어 상담 내용을 한국어로 요약
         """
+        if stream:
+            return self.stream_summary(japanese_text, prompt_template, template_key, plan)
+
+        source_language = self._source_language(plan)
         try:
             if not self.use_real_api:
                 # 개발용 더미 응답
-                return self._generate_dummy_response(japanese_text)
+                return self._generate_dummy_response(japanese_text, source_language)
             
-            # 프롬프트 템플릿에 일본어 텍스트 삽입
-            full_prompt = prompt_template.format(input_text=japanese_text)
+            # 일반 모드: 스트림을 끝까지 받아 전체 응답 처리 (OpenAI 경로와 같은 첫 토큰 시간/사용량 보고)
+            parts = []
+            usage_info = None
             
-            # Gemini API 호출 (최신 모델 최적화 설정)
-            response = self.model.generate_content(
-                full_prompt,
-                generation_config={
-                    "temperature": 0.2,  # 더 일관성 있는 요약을 위해 낮은 값
-                    "max_output_tokens": 4000,  # Pro 모델이므로 더 많은 토큰 허용
-                    "top_p": 0.8,
-                    "top_k": 40,
-                    "candidate_count": 1,
-                    "stop_sequences": []
-                },
-                safety_settings=[
-                    {
-                        "category": "HARM_CATEGORY_HARASSMENT",
-                        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-                    },
-                    {
-                        "category": "HARM_CATEGORY_HATE_SPEECH",
-                        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-                    },
-                    {
-                        "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-                    },
-                    {
-                        "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                        "threshold": "BLOCK_MEDIUM_AND_ABOVE"
-                    }
-                ]
-            )
+            async for chunk in self._stream_chunks(japanese_text, prompt_template, plan):
+                if chunk["type"] == "content":
+                    mark_first_token()
+                    parts.append(chunk["content"])
+                elif chunk["type"] == "usage":
+                    usage_info = chunk["usage"]
             
-            korean_summary = response.text
+            korean_summary = self._clean_markdown("".join(parts))
             
             logger.info(f"AI 요약 생성 성공: {len(japanese_text)} -> {len(korean_summary)} 글자")
             
@@ -71,20 +106,103 @@ class GeminiSummaryService:
                 "success": True,
                 "original_text": japanese_text,
                 "summary": korean_summary,
-                "source_language": "ja",
+                "source_language": source_language,
                 "target_language": "ko",
-                "model_used": "gemini-1.5-pro"
+                "model_used": MODEL_NAME,
+                "tokens_used": usage_info
             }
             
         except Exception as e:
             logger.error(f"Gemini API 호출 실패: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "original_text": japanese_text
-            }
+            return failure_result(japanese_text, e)
     
-    def _generate_dummy_response(self, japanese_text: str) -> Dict[str, Any]:
+    async def stream_summary(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        정규화된 청크 스트림 (OpenAI 경로와 같은 content/usage 형식)
+        """
+        if not self.use_real_api:
+            # 개발용 더미 응답은 한 청크로 전달
+            async for chunk in super().stream_summary(japanese_text, prompt_template, template_key, plan):
+                yield chunk
+            return
+
+        async for chunk in self._stream_chunks(japanese_text, prompt_template, plan):
+            yield chunk
+
+    async def _stream_chunks(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Gemini 스트리밍 응답을 정규화된 청크로 변환
+        """
+        full_prompt, prompt_tokens = await self._preflight(japanese_text, prompt_template, self._source_language(plan))
+
+        response = await self.model.generate_content_async(
+            full_prompt,
+            generation_config=self._generation_config(plan),
+            stream=True
+        )
+
+        parts = []
+        async for chunk in response:
+            text = chunk.text if chunk.parts else ""
+            if text:
+                parts.append(text)
+                yield {"type": "content", "content": text}
+
+        # 0.3.x SDK는 스트리밍 usage를 주지 않으므로 출력 토큰은 로컬 추정값 사용
+        completion_tokens = token_estimator.estimate("".join(parts))
+        yield {
+            "type": "usage",
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "cached_tokens": 0
+            }
+        }
+
+    @staticmethod
+    def _source_language(plan: Optional[Dict[str, Any]]) -> str:
+        """
+        사전 계획의 원문 언어 (계획이 없으면 기본 일본어 경로)
+        """
+        return plan["source_language"] if plan else DEFAULT_SOURCE_LANGUAGE
+
+    async def _preflight(self, japanese_text: str, prompt_template: str, source_language: str) -> Tuple[str, int]:
+        """
+        프롬프트 조립 및 사전 토큰 계산 (입력 한도 초과 시 호출 전에 거절)
+
+        반환값: (전체 프롬프트, 프롬프트 토큰 수)
+        """
+        # 원문 언어별 고정 지시문 + 컴파일된 템플릿의 고정 조각 사이에 상담 원문 삽입
+        # (ko 요약 전용 템플릿에는 번역 지시가 붙지 않음)
+        compiled = prompt_builder.compile(prompt_template, source_language)
+        full_prompt = compiled.prompts["system"] + compiled.render(input_text=japanese_text)
+
+        count = await self.model.count_tokens_async(full_prompt)
+        if count.total_tokens > settings.MAX_TRANSCRIPT_TOKENS:
+            raise ValueError(f"상담 내용이 너무 깁니다 ({count.total_tokens} 토큰, 최대 {settings.MAX_TRANSCRIPT_TOKENS} 토큰)")
+        return full_prompt, count.total_tokens
+
+    def _generation_config(self, plan: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        사전 계획의 출력 한도를 반영한 생성 파라미터
+        """
+        if not plan:
+            return self.sampling_params
+        return {**self.sampling_params, "max_output_tokens": plan["max_tokens"]}
+
+    def _generate_dummy_response(self, japanese_text: str, source_language: str = DEFAULT_SOURCE_LANGUAGE) -> Dict[str, Any]:
         """
         개발용 더미 응답 생성
         """
@@ -131,12 +249,12 @@ class GeminiSummaryService:
             "success": True,
             "original_text": japanese_text,
             "summary": dummy_summary.strip(),
-            "source_language": "ja",
+            "source_language": source_language,
             "target_language": "ko",
             "model_used": "dummy-for-development"
         }
     
-    def validate_api_key(self) -> bool:
+    async def validate_api_key(self) -> bool:
         """
         API 키 유효성 검증
         """
@@ -144,8 +262,8 @@ class GeminiSummaryService:
             return False
             
         try:
-            # 간단한 테스트 요청
-            response = self.model.generate_content(
+            # 간단한 테스트 요청 (이벤트 루프를 막지 않는 비동기 호출)
+            await self.model.generate_content_async(
                 "Hello",
                 generation_config={"max_output_tokens": 10}
             )
@@ -0,0 +1,362 @@
+import asyncio
+import logging
+import os
+import random
+import socket
+from datetime import timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models import ConsultationSummary, SummaryJob
+from .summary_provider import SummaryProvider, is_retryable_error
+from .summary_cache import summary_cache
+from .token_estimator import token_estimator
+from .transcript_preprocessor import transcript_preprocessor
+from .summary_generation import summary_cache_key, route_template, generate_cached_summary, attach_telemetry, discussed_procedures
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("succeeded", "failed")
+
+# 대기 중이거나 가시성 타임아웃이 지난 작업 1건을 잠그고 가져감 (다른 워커가 잠근 행은 건너뜀)
+CLAIM_SQL = text("""
+    WITH next_job AS (
+        SELECT id FROM summary_jobs
+        WHERE (status = 'queued' AND available_at <= now())
+           OR (status = 'running' AND locked_until < now())
+        ORDER BY available_at, id
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE summary_jobs AS job
+    SET status = 'running',
+        attempts = job.attempts + 1,
+        locked_by = :worker_id,
+        locked_until = now() + make_interval(secs => :visibility),
+        started_at = COALESCE(job.started_at, now())
+    FROM next_job
+    WHERE job.id = next_job.id
+    RETURNING job.id
+""")
+
+class SummaryJobQueue:
+    """
+    Postgres 기반 요약 생성 작업 큐
+
+    - 워커는 SELECT ... FOR UPDATE SKIP LOCKED로 작업을 가져가고 locked_until(가시성 타임아웃)을 하트비트로 연장
+    - 워커가 죽어 하트비트가 끊기면 타임아웃 후 다른 워커가 다시 가져감
+    - 일시적 오류는 지수 백오프(+지터) 후 max_attempts까지 재시도
+    - 상태 변경은 작업을 잠근 워커(locked_by)만 가능 (재할당된 작업을 이전 워커가 덮어쓰지 않음)
+    """
+
+    def __init__(
+        self,
+        visibility_timeout: float,
+        max_attempts: int,
+        retry_base: float,
+        retry_cap: float
+    ):
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_cap = retry_cap
+
+    def submit(self, db: Session, created_by: str = "system", **fields: Any) -> SummaryJob:
+        """
+        작업 등록 (워커가 가져갈 때까지 queued)
+        """
+        job = SummaryJob(status="queued", max_attempts=self.max_attempts, created_by=created_by, **fields)
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+
+    def claim(self, db: Session, worker_id: str) -> Optional[SummaryJob]:
+        """
+        다음 작업 1건을 잠그고 반환 (없으면 None)
+        """
+        row = db.execute(CLAIM_SQL, {"worker_id": worker_id, "visibility": self.visibility_timeout}).first()
+        db.commit()
+        if row is None:
+            return None
+        return db.get(SummaryJob, row[0])
+
+    def _owned(self, db: Session, job_id: int, worker_id: str):
+        return db.query(SummaryJob).filter(
+            SummaryJob.id == job_id,
+            SummaryJob.status == "running",
+            SummaryJob.locked_by == worker_id
+        )
+
+    def extend(self, db: Session, job_id: int, worker_id: str) -> bool:
+        """
+        가시성 타임아웃 연장 (하트비트). 이미 다른 워커에 재할당됐으면 False
+        """
+        updated = self._owned(db, job_id, worker_id).update(
+            {SummaryJob.locked_until: func.now() + timedelta(seconds=self.visibility_timeout)},
+            synchronize_session=False
+        )
+        db.commit()
+        return updated > 0
+
+    def complete(
+        self,
+        db: Session,
+        job: SummaryJob,
+        worker_id: str,
+        summary_text: str,
+        telemetry_id: Optional[int],
+        summary: Optional[ConsultationSummary] = None
+    ) -> bool:
+        """
+        완료 처리. summary가 있으면 상담 요약 저장과 완료 전환을 한 트랜잭션으로 커밋
+
+        작업을 이미 잃었으면(다른 워커에 재할당) 저장도 되돌리고 False. 저장 후 완료 전환 전에
+        워커가 죽거나 오류가 나 작업이 다시 처리되면서 요약이 중복 저장되지 않도록 함
+        """
+        if summary is not None:
+            db.add(summary)
+            db.flush()
+        updated = self._owned(db, job.id, worker_id).update(
+            {
+                SummaryJob.status: "succeeded",
+                SummaryJob.summary_text: summary_text,
+                SummaryJob.summary_id: summary.id if summary is not None else None,
+                SummaryJob.telemetry_id: telemetry_id,
+                SummaryJob.error: None,
+                SummaryJob.locked_by: None,
+                SummaryJob.locked_until: None,
+                SummaryJob.finished_at: func.now()
+            },
+            synchronize_session=False
+        )
+        if not updated:
+            db.rollback()
+            return False
+        db.commit()
+        return True
+
+    def retry_delay(self, attempts: int, retry_after: Optional[float] = None) -> float:
+        delay = min(self.retry_cap, self.retry_base * (2 ** max(0, attempts - 1)))
+        delay = random.uniform(delay / 2, delay)
+        return max(delay, min(retry_after or 0.0, self.retry_cap))
+
+    def fail(
+        self,
+        db: Session,
+        job: SummaryJob,
+        worker_id: str,
+        error: str,
+        retryable: bool = False,
+        retry_after: Optional[float] = None
+    ) -> bool:
+        """
+        실패 처리: 재시도 가능하고 시도 횟수가 남았으면 백오프 후 다시 queued, 아니면 failed
+        """
+        if retryable and job.attempts < job.max_attempts:
+            delay = self.retry_delay(job.attempts, retry_after)
+            values = {
+                SummaryJob.status: "queued",
+                SummaryJob.available_at: func.now() + timedelta(seconds=delay)
+            }
+            logger.warning(f"요약 작업 {job.id} 재시도 예약 ({job.attempts}/{job.max_attempts}, {delay:.1f}초 후): {error}")
+        else:
+            values = {SummaryJob.status: "failed", SummaryJob.finished_at: func.now()}
+            logger.error(f"요약 작업 {job.id} 실패 ({job.attempts}/{job.max_attempts}): {error}")
+
+        updated = self._owned(db, job.id, worker_id).update(
+            {**values, SummaryJob.error: error[:500], SummaryJob.locked_by: None, SummaryJob.locked_until: None},
+            synchronize_session=False
+        )
+        db.commit()
+        return updated > 0
+
+    def get_stats(self, db: Session) -> Dict[str, Any]:
+        """
+        상태별 작업 수와 가장 오래 기다린 작업의 대기 시간 (워커 확장 판단용)
+        """
+        counts = dict(
+            db.query(SummaryJob.status, func.count(SummaryJob.id)).group_by(SummaryJob.status).all()
+        )
+        oldest = db.query(func.min(SummaryJob.available_at)).filter(
+            SummaryJob.status == "queued",
+            SummaryJob.available_at <= func.now()
+        ).scalar()
+        oldest_wait = None
+        if oldest is not None:
+            oldest_wait = db.query(func.extract("epoch", func.now() - oldest)).scalar()
+        return {
+            "queued": counts.get("queued", 0),
+            "running": counts.get("running", 0),
+            "succeeded": counts.get("succeeded", 0),
+            "failed": counts.get("failed", 0),
+            "oldest_queued_seconds": round(float(oldest_wait), 1) if oldest_wait is not None else None
+        }
+
+async def process_job(
+    queue: SummaryJobQueue,
+    job: SummaryJob,
+    worker_id: str,
+    summary_service: SummaryProvider,
+    db: Session
+):
+    """
+    작업 1건 처리: 템플릿 조회 → 캐시 확인 → 토큰 예산 계획 → 생성 → (선택) 상담 요약 저장
+    """
+    if job.attempts > job.max_attempts:
+        # 처리 중 워커가 반복해서 사라진 작업 (가시성 타임아웃 초과)
+        queue.fail(db, job, worker_id, "가시성 타임아웃 초과로 최대 시도 횟수를 넘었습니다")
+        return
+
+    # 녹취록 전체를 훑는 전처리/토큰화는 스레드에서 (같은 루프의 다른 작업 슬롯을 막지 않도록)
+    prompt_text, preprocessing = await asyncio.to_thread(transcript_preprocessor.process, job.original_text)
+    template, detection = route_template(db, prompt_text, job.prompt_template_id)
+    if not template:
+        queue.fail(db, job, worker_id, "사용 가능한 프롬프트 템플릿이 없습니다")
+        return
+
+    cache_key = summary_cache_key(prompt_text, template, summary_service)
+    cached = None if job.force_refresh else summary_cache.get(cache_key, db)
+
+    telemetry_id = None
+    if cached:
+        summary_text = cached["summary"]
+    else:
+        plan = await asyncio.to_thread(token_estimator.plan, prompt_text, template.template_text, template.source_language)
+        if not plan["fits"]:
+            queue.fail(
+                db, job, worker_id,
+                f"상담 내용이 너무 깁니다. 약 {plan['transcript_tokens']} 토큰으로, 최대 {plan['limit_tokens']} 토큰까지 요약할 수 있습니다"
+            )
+            return
+
+        result = await generate_cached_summary(
+            prompt_text, template, summary_service, cache_key, plan, preprocessing, detection["language"]
+        )
+        if not result["success"]:
+            queue.fail(
+                db, job, worker_id, f"AI 요약 생성 실패: {result['error']}",
+                retryable=result.get("retryable", False),
+                retry_after=result.get("retry_after")
+            )
+            return
+        summary_text = result["summary"]
+        telemetry_id = result["telemetry"]["id"]
+
+    db_summary = None
+    if job.save_result:
+        db_summary = ConsultationSummary(
+            consultation_date=job.consultation_date or job.created_at.date(),
+            original_text=job.original_text,
+            summary_text=summary_text,
+            prompt_template_id=template.id,
+            procedures_discussed=discussed_procedures(db, job.procedures_discussed, job.original_text, summary_text),
+            consultant_name=job.consultant_name,
+            customer_name=job.customer_name,
+            consultation_title=job.consultation_title,
+            created_by=job.created_by
+        )
+
+    if not queue.complete(db, job, worker_id, summary_text, telemetry_id, db_summary):
+        logger.warning(f"요약 작업 {job.id} 완료 기록 실패: 이미 다른 워커에 재할당됨")
+        return
+
+    summary_id = db_summary.id if db_summary is not None else None
+    logger.info(f"요약 작업 {job.id} 완료 (시도 {job.attempts}회, 요약 ID {summary_id})")
+    if db_summary is not None:
+        # 작업은 이미 완료 상태라 계측 연결이 실패해도 재시도하지 않음
+        try:
+            attach_telemetry(db_summary, telemetry_id, db)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"요약 작업 {job.id} 계측 연결 실패: {str(e)}")
+
+class SummaryJobWorker:
+    """
+    요약 작업 워커 (summary_worker.py에서 실행, 웹 서버와 별도 프로세스)
+
+    concurrency개의 슬롯이 각자 큐를 폴링하며 작업을 가져가고, 처리 중에는
+    가시성 타임아웃의 1/3 간격으로 하트비트를 보냄
+    """
+
+    def __init__(
+        self,
+        queue: SummaryJobQueue,
+        summary_service: SummaryProvider,
+        concurrency: int,
+        poll_interval: float,
+        worker_id: Optional[str] = None
+    ):
+        self.queue = queue
+        self.summary_service = summary_service
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._stopping = asyncio.Event()
+        self.stats = {"processed": 0, "errors": 0}
+
+    def stop(self):
+        """
+        새 작업을 가져가지 않고 처리 중인 작업만 마치고 종료
+        """
+        self._stopping.set()
+
+    async def run(self):
+        logger.info(f"요약 작업 워커 시작: {self.worker_id} (동시 처리 {self.concurrency})")
+        await asyncio.gather(*(self._slot(index) for index in range(self.concurrency)))
+        logger.info(f"요약 작업 워커 종료: {self.worker_id} (처리 {self.stats['processed']}건)")
+
+    async def _slot(self, index: int):
+        while not self._stopping.is_set():
+            db = SessionLocal()
+            try:
+                job = self.queue.claim(db, self.worker_id)
+                if job is None:
+                    db.close()
+                    try:
+                        await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await self._run(job, db)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"요약 작업 워커 슬롯 {index} 오류: {str(e)}")
+                await asyncio.sleep(self.poll_interval)
+            finally:
+                db.close()
+
+    async def _run(self, job: SummaryJob, db: Session):
+        heartbeat = asyncio.create_task(self._heartbeat(job.id))
+        try:
+            await process_job(self.queue, job, self.worker_id, self.summary_service, db)
+        except Exception as e:
+            db.rollback()
+            self.queue.fail(db, job, self.worker_id, str(e), retryable=is_retryable_error(e))
+        finally:
+            heartbeat.cancel()
+            self.stats["processed"] += 1
+
+    async def _heartbeat(self, job_id: int):
+        # 하트비트는 별도 세션 사용 (처리 중인 세션의 트랜잭션과 분리)
+        while True:
+            await asyncio.sleep(self.queue.visibility_timeout / 3)
+            db = SessionLocal()
+            try:
+                if not self.queue.extend(db, job_id, self.worker_id):
+                    logger.warning(f"요약 작업 {job_id} 잠금을 잃었습니다 (다른 워커에 재할당)")
+                    return
+            except Exception as e:
+                logger.warning(f"요약 작업 {job_id} 하트비트 실패: {str(e)}")
+            finally:
+                db.close()
+
+# 프로세스 전체 공유 큐
+summary_job_queue = SummaryJobQueue(
+    visibility_timeout=settings.SUMMARY_JOB_VISIBILITY_SECONDS,
+    max_attempts=settings.SUMMARY_JOB_MAX_ATTEMPTS,
+    retry_base=settings.SUMMARY_JOB_RETRY_BASE_SECONDS,
+    retry_cap=settings.SUMMARY_JOB_RETRY_CAP_SECONDS
+)
@@ -0,0 +1,67 @@
+import logging
+import re
+from typing import Any, Dict
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 문자 체계별 패턴 (한자는 한국어/일본어 모두에 나오므로 판정에서 제외)
+KANA_PATTERN = re.compile(r'[\u3040-\u30ff\u31f0-\u31ff\uff66-\uff9f]')
+HANGUL_PATTERN = re.compile(r'[\uac00-\ud7af\u1100-\u11ff\u3130-\u318f]')
+
+# 판정 결과 (요약 경로)
+LANGUAGE_JA = "ja"
+LANGUAGE_KO = "ko"
+LANGUAGE_MIXED = "mixed"
+
+class LanguageDetector:
+    """
+    문자 체계 비율 기반 녹취록 언어 판정 (로컬, 모델 호출 없음)
+
+    가나와 한글 글자 수만 세어 한쪽이 dominant_ratio 이상이면 그 언어, 아니면 mixed.
+    판정할 글자가 min_chars보다 적으면 기본 경로(일본어 → 한국어 번역 요약)
+    긴 녹취록은 앞/중간/끝 구간만 표본으로 사용
+    """
+
+    def __init__(self, dominant_ratio: float = 0.9, min_chars: int = 20, sample_chars: int = 6000):
+        self.dominant_ratio = dominant_ratio
+        self.min_chars = min_chars
+        self.sample_chars = sample_chars
+
+    def _sample(self, text: str) -> str:
+        if len(text) <= self.sample_chars:
+            return text
+        window = self.sample_chars // 3
+        middle = (len(text) - window) // 2
+        return text[:window] + text[middle:middle + window] + text[-window:]
+
+    def detect(self, text: str) -> Dict[str, Any]:
+        """
+        반환: language (ja / ko / mixed), 가나/한글 글자 수, 한글 비율
+        """
+        sample = self._sample(text or "")
+        kana = len(KANA_PATTERN.findall(sample))
+        hangul = len(HANGUL_PATTERN.findall(sample))
+        total = kana + hangul
+
+        if total < self.min_chars:
+            language = LANGUAGE_JA
+        elif hangul / total >= self.dominant_ratio:
+            language = LANGUAGE_KO
+        elif kana / total >= self.dominant_ratio:
+            language = LANGUAGE_JA
+        else:
+            language = LANGUAGE_MIXED
+
+        return {
+            "language": language,
+            "kana_chars": kana,
+            "hangul_chars": hangul,
+            "hangul_ratio": round(hangul / total, 3) if total else 0.0
+        }
+
+# 프로세스 전체 공유 인스턴스
+language_detector = LanguageDetector(
+    dominant_ratio=settings.LANGUAGE_DETECT_DOMINANT_RATIO,
+    min_chars=settings.LANGUAGE_DETECT_MIN_CHARS
+)
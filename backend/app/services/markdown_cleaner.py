@@ -0,0 +1,208 @@
+import re
+from typing import List
+
+# 공백/마크다운 기호가 없는 일반 텍스트 구간 (한 번에 처리하는 빠른 경로)
+PLAIN_RUN = re.compile(r'[^*_\n]+')
+EXTRA_NEWLINES = re.compile(r'\n{3,}')
+RULE_CHARS = "-*"
+EMPHASIS_CHARS = "*_"
+MAX_HEADER_LEVEL = 6
+
+class StreamingMarkdownCleaner:
+    """
+    스트리밍 델타를 받는 즉시 마크다운 기호를 제거하는 단일 패스 상태 기계
+
+    기존 정규식 8단계(clean_markdown_regex)와 같은 규칙을 한 글자씩 적용
+    - 줄 머리 #{1,6} 및 뒤 공백 제거
+    - 같은 줄 안의 **굵게**, *기울임*, __굵게__, _기울임_ 기호 제거
+      (짝이 없는 ** / __는 제거, 짝이 없는 * / _는 그대로)
+    - ---, *** 처럼 -/*만 3개 이상인 줄은 빈 줄로
+    - 3개 이상 연속 줄바꿈은 2개로, 앞뒤 공백 제거
+
+    청크 경계에서 애매한 부분(** 앞쪽 *, 닫히지 않은 강조 구간, 줄 머리의 -/*,
+    끝부분 공백)만 잠시 보류하므로, 어떻게 나눠 넣어도 출력 합계가 같음
+    """
+
+    def __init__(self, raw: bool = False):
+        # raw=True: 강조 구간 내부 정리용 (줄/공백 처리 없이 인라인 규칙만 적용)
+        self._raw = raw
+        self._line_start = not raw
+        self._hashes = 0
+        self._rule_buf = ""
+        self._pending = ""
+        self._marker = None
+        self._held: List[str] = []
+        self._ws = ""
+        self._started = raw
+        self._parts: List[str] = []
+
+    @property
+    def text(self) -> str:
+        """
+        지금까지 내보낸 정리된 텍스트 전체
+        """
+        return "".join(self._parts)
+
+    def feed(self, delta: str) -> str:
+        """
+        원문 델타를 넣고 새로 확정된 정리 텍스트 델타를 반환 (없으면 빈 문자열)
+        """
+        out: List[str] = []
+        index, length = 0, len(delta)
+        while index < length:
+            if not self._line_start and not self._pending:
+                match = PLAIN_RUN.match(delta, index)
+                if match:
+                    self._text(match.group(), out)
+                    index = match.end()
+                    continue
+            self._char(delta[index], out)
+            index += 1
+        return self._commit(out)
+
+    def finish(self) -> str:
+        """
+        스트림 종료: 보류 중인 부분을 확정하고 마지막 델타 반환 (끝부분 공백은 버림)
+        """
+        out: List[str] = []
+        self._end_line(out)
+        self._ws = ""
+        return self._commit(out)
+
+    def _commit(self, out: List[str]) -> str:
+        delta = "".join(out)
+        if delta:
+            self._parts.append(delta)
+        return delta
+
+    def _char(self, ch: str, out: List[str]):
+        if self._line_start:
+            if ch == "#" and not self._rule_buf and self._hashes < MAX_HEADER_LEVEL:
+                self._hashes += 1
+                return
+            if self._hashes:
+                if ch in " \t":
+                    return
+                self._hashes = 0
+            elif ch in RULE_CHARS:
+                self._rule_buf += ch
+                return
+            elif ch == "\n" and len(self._rule_buf) >= 3:
+                # 수평선 줄은 빈 줄로
+                self._rule_buf = ""
+                self._inline("\n", out)
+                return
+            self._line_start = False
+            prefix, self._rule_buf = self._rule_buf, ""
+            for c in prefix:
+                self._inline(c, out)
+        self._inline(ch, out)
+
+    def _inline(self, ch: str, out: List[str]):
+        if self._pending:
+            pending, self._pending = self._pending, ""
+            if ch == pending:
+                self._marker_token(pending * 2, out)
+                return
+            self._marker_token(pending, out)
+        if ch in EMPHASIS_CHARS:
+            self._pending = ch
+            return
+        if ch == "\n":
+            self._close_emphasis(out)
+            self._emit("\n", out)
+            self._line_start = not self._raw
+            self._hashes = 0
+            return
+        self._text(ch, out)
+
+    def _text(self, text: str, out: List[str]):
+        if self._marker:
+            self._held.append(text)
+        else:
+            self._emit(text, out)
+
+    def _marker_token(self, token: str, out: List[str]):
+        if self._marker is None:
+            self._marker = token
+            self._held = []
+        elif token == self._marker:
+            inner = self._clean_inline("".join(self._held))
+            self._marker = None
+            self._held = []
+            self._emit(inner, out)
+        else:
+            self._held.append(token)
+
+    def _close_emphasis(self, out: List[str]):
+        """
+        줄 끝까지 닫히지 않은 강조 구간 확정
+        """
+        if self._marker is None:
+            return
+        marker = self._marker if len(self._marker) == 1 else ""
+        inner = self._clean_inline("".join(self._held))
+        self._marker = None
+        self._held = []
+        self._emit(marker + inner, out)
+
+    def _end_line(self, out: List[str]):
+        if self._line_start:
+            prefix, self._rule_buf = self._rule_buf, ""
+            if len(prefix) < 3:
+                self._line_start = False
+                for c in prefix:
+                    self._inline(c, out)
+        if self._pending:
+            pending, self._pending = self._pending, ""
+            self._marker_token(pending, out)
+        self._close_emphasis(out)
+
+    def _emit(self, text: str, out: List[str]):
+        if self._raw:
+            out.append(text)
+            return
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                return
+        body = text.rstrip()
+        if not body:
+            self._ws += text
+            return
+        if self._ws:
+            out.append(EXTRA_NEWLINES.sub("\n\n", self._ws))
+        out.append(body)
+        self._started = True
+        self._ws = text[len(body):]
+
+    @classmethod
+    def _clean_inline(cls, text: str) -> str:
+        if not any(c in text for c in EMPHASIS_CHARS):
+            return text
+        cleaner = cls(raw=True)
+        cleaner.feed(text)
+        cleaner.finish()
+        return cleaner.text
+
+def clean_markdown(text: str) -> str:
+    """
+    완성된 텍스트 정리 (스트리밍 정리 결과와 항상 동일)
+    """
+    cleaner = StreamingMarkdownCleaner()
+    cleaner.feed(text)
+    cleaner.finish()
+    return cleaner.text
+
+def clean_markdown_regex(text: str) -> str:
+    """
+    기존 정규식 8단계 정리 (벤치마크 비교용)
+    """
+    text = re.sub(r'^#{1,6}\s*', '', text, flags=re.MULTILINE)
+    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
+    text = re.sub(r'\*(.*?)\*', r'\1', text)
+    text = re.sub(r'__(.*?)__', r'\1', text)
+    text = re.sub(r'_(.*?)_', r'\1', text)
+    text = re.sub(r'^[-*]{3,}$', '', text, flags=re.MULTILINE)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
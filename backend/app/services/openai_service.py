@@ -1,29 +1,77 @@
-from openai import OpenAI
-from typing import Dict, Any, Optional
+from openai import AsyncOpenAI
+from typing import Dict, Any, Optional, AsyncIterator, Awaitable, Callable, Tuple
+import asyncio
 import logging
+import time
 from ..core.config import settings
+from .prompt_builder import prompt_builder, prompt_cache_stats, language_prompts
+from .transcript_chunker import split_transcript
+from .token_estimator import token_estimator
+from .telemetry import mark_first_token, record_queue_wait
+from .summary_provider import SummaryProvider, failure_result, provider_error_status
+from .rate_limiter import ProviderAdmission, admission_outcome
 
 logger = logging.getLogger(__name__)
 
-class OpenAISummaryService:
-    def __init__(self):
+# 요약에 사용하는 모델 (최신 GPT-4.1 mini 모델)
+MODEL_NAME = "gpt-4.1-mini-2025-04-14"
+
+# 샘플링 파라미터 (요약 캐시 키에도 포함)
+SAMPLING_PARAMS = {
+    "temperature": 0.3,  # 빠른 응답을 위해 조정
+    "max_tokens": 2000   # 토큰 수 줄여서 속도 향상
+}
+
+# 긴 녹취록 map 단계의 구간별 최대 출력 토큰
+MAP_MAX_TOKENS = 800
+
+# 프로세스 전체에서 공유하는 비동기 클라이언트 (요청마다 새로 만들지 않음)
+_shared_client: Optional[AsyncOpenAI] = None
+
+def get_async_client() -> Optional[AsyncOpenAI]:
+    """
+    공유 AsyncOpenAI 클라이언트 반환 (최초 호출 시 생성)
+    """
+    global _shared_client
+    if _shared_client is None and settings.OPENAI_API_KEY:
+        _shared_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return _shared_client
+
+class OpenAISummaryService(SummaryProvider):
+    name = "openai"
+    model_name = MODEL_NAME
+    sampling_params = SAMPLING_PARAMS
+
+    def __init__(self, client: Optional[AsyncOpenAI] = None):
         self.use_real_api = bool(settings.OPENAI_API_KEY)
-        
+        # 긴 녹취록의 구간(map)/reduce 호출을 각각 승인하는 승인 제어 (레지스트리가 설정, 없으면 바로 호출)
+        self.admission: Optional[ProviderAdmission] = None
+
         if self.use_real_api:
-            self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            self.client = client or get_async_client()
         else:
             logger.error("OPENAI_API_KEY가 설정되지 않았습니다.")
             self.client = None
-    
+
     async def summarize_japanese_to_korean(
-        self, 
-        japanese_text: str, 
+        self,
+        japanese_text: str,
         prompt_template: str,
-        stream: bool = False
-    ) -> Dict[str, Any]:
+        stream: bool = False,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> Any:
         """
         일본어 상담 내용을 한국어로 요약
+
+        stream=True 이면 정규화된 청크({"type": "content" | "usage", ...})를
+        내보내는 비동기 제너레이터를 반환
+        template_key는 템플릿 버전별 프롬프트 캐시 통계 집계에 사용 (예: "3:v2.2")
+        plan은 token_estimator.plan() 결과 (없으면 여기서 계산)
         """
+        if stream:
+            return self.stream_summary(japanese_text, prompt_template, template_key, plan)
+
         try:
             if not self.use_real_api:
                 # API 키가 없으면 명확한 오류 반환
@@ -32,125 +80,227 @@ class OpenAISummaryService:
                     "error": "OpenAI API 키가 설정되지 않았습니다. 관리자에게 문의하세요.",
                     "original_text": japanese_text
                 }
-            
-            # 프롬프트 템플릿에 일본어 텍스트 삽입
-            full_prompt = prompt_template.format(input_text=japanese_text)
-            
-            # 간소화된 시스템 프롬프트 (속도 최적화)
-            system_content = "당신은 일본어를 한국어로 번역하고 의료/미용 상담 내용을 요약하는 전문가입니다.\n\n" + prompt_template
-
-            # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model="gpt-4.1-mini-2025-04-14",  # 최신 GPT-4.1 mini 모델
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": system_content
-                    },
-                    {
-                        "role": "user", 
-                        "content": f"다음 일본어 상담 내용을 요약해주세요:\n\n{japanese_text}"
-                    }
-                ],
-                temperature=0.3,  # 빠른 응답을 위해 조정
-                max_tokens=2000,  # 토큰 수 줄여서 속도 향상
-                stream=stream  # 스트리밍 옵션
-            )
-            
-            if stream:
-                # 스트리밍 모드: 제너레이터로 청크 반환
-                return response
-            else:
-                # 일반 모드: 전체 응답 처리
-                korean_summary = ""
-                usage_info = None
-                
-                for chunk in response:
-                    if chunk.choices[0].delta.content is not None:
-                        korean_summary += chunk.choices[0].delta.content
-                    
-                    # 마지막 청크에서 usage 정보 가져오기
-                    if hasattr(chunk, 'usage') and chunk.usage:
-                        usage_info = chunk.usage
-                
-                # 마크다운 기호 제거
-                korean_summary = self._clean_markdown(korean_summary)
-            
+
+            # 일반 모드: 스트림을 끝까지 받아 전체 응답 처리
+            parts = []
+            usage_info = None
+
+            async for chunk in self._stream_chunks(japanese_text, prompt_template, template_key, plan):
+                if chunk["type"] == "content":
+                    mark_first_token()
+                    parts.append(chunk["content"])
+                elif chunk["type"] == "usage":
+                    usage_info = chunk["usage"]
+
+            # 마크다운 기호 제거
+            korean_summary = self._clean_markdown("".join(parts))
+
             # 토큰 사용량 로깅 (usage 정보가 있는 경우만)
             if usage_info:
-                logger.info(f"OpenAI API 사용: 입력 {usage_info.prompt_tokens} 토큰, 출력 {usage_info.completion_tokens} 토큰, 총 {usage_info.total_tokens} 토큰")
-            
+                logger.info(f"OpenAI API 사용: 입력 {usage_info['prompt_tokens']} 토큰, 출력 {usage_info['completion_tokens']} 토큰, 총 {usage_info['total_tokens']} 토큰")
+
             logger.info(f"AI 요약 생성 성공: {len(japanese_text)} -> {len(korean_summary)} 글자")
-            
+
             return {
                 "success": True,
                 "original_text": japanese_text,
                 "summary": korean_summary,
                 "source_language": "ja",
                 "target_language": "ko",
-                "model_used": "gpt-4.1-mini-2025-04-14",
-                "tokens_used": {
-                    "prompt_tokens": usage_info.prompt_tokens if usage_info else 0,
-                    "completion_tokens": usage_info.completion_tokens if usage_info else 0,
-                    "total_tokens": usage_info.total_tokens if usage_info else 0,
-                    "cached_tokens": getattr(
-                        getattr(usage_info, 'prompt_tokens_details', None), 
-                        'cached_tokens', 
-                        0
-                    ) if usage_info else 0
-                }
+                "model_used": self.model_name,
+                "tokens_used": usage_info or self._usage_to_dict(None)
             }
-            
+
         except Exception as e:
             logger.error(f"OpenAI API 호출 실패: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "original_text": japanese_text
-            }
-    
-    
-    def validate_api_key(self) -> bool:
+            return failure_result(japanese_text, e)
+
+    async def stream_summary(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        정규화된 청크 스트림 (OpenAI 스트리밍 응답 그대로 전달)
+        """
+        if not self.use_real_api:
+            raise RuntimeError("OpenAI API 키가 설정되지 않았습니다. 관리자에게 문의하세요.")
+        async for chunk in self._stream_chunks(japanese_text, prompt_template, template_key, plan):
+            yield chunk
+
+    async def _stream_chunks(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        OpenAI 스트리밍 응답을 정규화된 청크로 변환
+        """
+        # 호출 전 토큰 예산 계획 (출력 한도, 처리 모드)
+        plan = plan or await asyncio.to_thread(token_estimator.plan, japanese_text, prompt_template)
+        if not plan["fits"]:
+            raise ValueError(f"상담 내용이 너무 깁니다 (약 {plan['transcript_tokens']} 토큰, 최대 {plan['limit_tokens']} 토큰)")
+
+        # 원문 언어별 고정 프롬프트 (ja: 번역 요약, ko: 요약 전용)
+        source_language = plan["source_language"]
+        prompts = language_prompts(source_language)
+        input_text, user_prefix, map_usage = japanese_text, None, None
+
+        # 긴 녹취록: 구간별 메모를 병렬로 만든 뒤(map) 템플릿으로 통합(reduce)
+        if plan["mode"] == "map_reduce":
+            input_text, map_usage = await self._map_transcript(japanese_text, prompts["map_system"], source_language)
+            user_prefix = prompts["reduce_user"]
+
+        # 고정 접두어 + 정규화된 템플릿을 앞에 두어 제공자 프롬프트 캐시 적중 유도
+        messages, prompt_cache_key = prompt_builder.build_messages(prompt_template, input_text, user_prefix, source_language)
+
+        chunks = self._completion_chunks(messages, prompt_cache_key, plan["max_tokens"], template_key)
+        if plan["mode"] == "map_reduce" and self.admission is not None:
+            estimated = sum(token_estimator.estimate(message["content"]) for message in messages) + plan["max_tokens"]
+            chunks = self.admission.stream(estimated, chunks)
+
+        async for chunk in chunks:
+            if chunk["type"] == "usage" and map_usage:
+                usage = chunk["usage"]
+                chunk = {"type": "usage", "usage": {key: usage[key] + map_usage[key] for key in usage}}
+            yield chunk
+
+    async def _completion_chunks(
+        self,
+        messages: list,
+        prompt_cache_key: str,
+        max_tokens: int,
+        template_key: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        스트리밍 호출 1건을 정규화된 청크로 변환
+        """
+        # OpenAI API 호출 (이벤트 루프를 막지 않는 비동기 스트리밍)
+        response = await self.client.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            **{**self.sampling_params, "max_tokens": max_tokens},
+            stream=True,
+            stream_options={"include_usage": True},  # 마지막 청크에 usage 포함
+            extra_body={"prompt_cache_key": prompt_cache_key}
+        )
+
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content is not None:
+                yield {"type": "content", "content": chunk.choices[0].delta.content}
+
+            # 마지막 청크에서 usage 정보 가져오기
+            if getattr(chunk, 'usage', None):
+                usage = self._usage_to_dict(chunk.usage)
+                prompt_cache_stats.record(
+                    template_key or prompt_cache_key,
+                    usage["prompt_tokens"],
+                    usage["cached_tokens"]
+                )
+                yield {"type": "usage", "usage": usage}
+
+    async def _map_transcript(
+        self,
+        japanese_text: str,
+        map_system_prompt: str,
+        source_language: str
+    ) -> Tuple[str, Dict[str, int]]:
+        """
+        긴 녹취록을 화자/문장 경계로 나눠 구간별 메모를 동시 생성 (동시성 제한)
+
+        반환값: (구간 메모를 합친 reduce 입력, map 단계 토큰 사용량 합계)
+        """
+        chunks = split_transcript(japanese_text, settings.TRANSCRIPT_CHUNK_CHARS)
+        semaphore = asyncio.Semaphore(settings.MAP_REDUCE_CONCURRENCY)
+
+        map_system_tokens = token_estimator.estimate(map_system_prompt)
+
+        async def summarize_chunk(chunk: str) -> Tuple[str, Dict[str, int]]:
+            async with semaphore:
+                response = await self._admitted(
+                    map_system_tokens + token_estimator.estimate(chunk) + MAP_MAX_TOKENS,
+                    lambda: self.client.chat.completions.create(
+                        model=self.model_name,
+                        messages=[
+                            {"role": "system", "content": map_system_prompt},
+                            {"role": "user", "content": chunk}
+                        ],
+                        temperature=self.sampling_params["temperature"],
+                        max_tokens=MAP_MAX_TOKENS,
+                        extra_body={"prompt_cache_key": f"forte-summary-map-{source_language}"}
+                    )
+                )
+            return response.choices[0].message.content or "", self._usage_to_dict(response.usage)
+
+        results = await asyncio.gather(*(summarize_chunk(chunk) for chunk in chunks))
+
+        notes = "\n\n".join(
+            f"[구간 {index + 1}/{len(results)}]\n{text.strip()}"
+            for index, (text, _) in enumerate(results)
+        )
+        usage = self._usage_to_dict(None)
+        for _, chunk_usage in results:
+            usage = {key: usage[key] + chunk_usage[key] for key in usage}
+
+        logger.info(f"긴 녹취록 map 단계 완료: {len(japanese_text)} 글자 -> {len(chunks)}개 구간, 메모 {len(notes)} 글자")
+        return notes, usage
+
+    async def _admitted(self, estimated_tokens: int, request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        스트리밍이 아닌 호출 1건을 승인 제어를 거쳐 실행 (분당 한도/동시성 창 공유)
+        """
+        if self.admission is None:
+            return await request()
+
+        async with self.admission.admit(estimated_tokens) as ticket:
+            record_queue_wait(self.name, ticket.queue_wait)
+            try:
+                response = await request()
+            except Exception as e:
+                ticket.outcome = admission_outcome(provider_error_status(e))
+                raise
+            ticket.outcome = "success"
+            ticket.latency = time.monotonic() - ticket.admitted_at
+            ticket.latency_kind = "call"
+            if response.usage:
+                ticket.actual_tokens = response.usage.total_tokens
+            return response
+
+    @staticmethod
+    def _usage_to_dict(usage_info: Any) -> Dict[str, int]:
+        """
+        OpenAI usage 객체를 토큰 사용량 dict로 변환
+        """
+        return {
+            "prompt_tokens": usage_info.prompt_tokens if usage_info else 0,
+            "completion_tokens": usage_info.completion_tokens if usage_info else 0,
+            "total_tokens": usage_info.total_tokens if usage_info else 0,
+            "cached_tokens": (getattr(
+                getattr(usage_info, 'prompt_tokens_details', None),
+                'cached_tokens',
+                0
+            ) or 0) if usage_info else 0
+        }
+
+    async def validate_api_key(self) -> bool:
         """
         API 키 유효성 검증
         """
         if not self.use_real_api:
             return False
-    
-    def _clean_markdown(self, text: str) -> str:
-        """
-        마크다운 기호 제거 및 텍스트 정리
-        """
-        import re
-        
-        # 헤더 기호 제거 (### ## #)
-        text = re.sub(r'^#{1,6}\s*', '', text, flags=re.MULTILINE)
-        
-        # 볼드/이탤릭 기호 제거 (**text**, *text*, __text__, _text_)
-        text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-        text = re.sub(r'\*(.*?)\*', r'\1', text)
-        text = re.sub(r'__(.*?)__', r'\1', text)
-        text = re.sub(r'_(.*?)_', r'\1', text)
-        
-        # 수평선 제거 (---, ***)
-        text = re.sub(r'^[-*]{3,}$', '', text, flags=re.MULTILINE)
-        
-        # 여러 개의 연속된 줄바꿈을 2개로 제한
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        
-        # 앞뒤 공백 제거
-        text = text.strip()
-        
-        return text
-            
+
         try:
             # 간단한 테스트 요청
-            response = self.client.chat.completions.create(
-                model="gpt-4.1-mini-2025-04-14",
+            await self.client.chat.completions.create(
+                model=MODEL_NAME,
                 messages=[{"role": "user", "content": "Hello"}],
                 max_tokens=5
             )
             return True
         except Exception as e:
             logger.error(f"OpenAI API 키 유효성 검증 실패: {str(e)}")
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,61 @@
+import base64
+import json
+from datetime import date
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+# 다음 페이지 커서를 돌려주는 응답 헤더 (목록 응답 본문 형식은 그대로 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    정렬 키 값 → 불투명 커서 (URL 안전 base64)
+    """
+    payload = json.dumps(
+        [value.isoformat() if isinstance(value, date) else value for value in values],
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple:
+    """
+    커서 → 정렬 키 값 (형식이 맞지 않으면 ValueError)
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(types) or None in values:
+            raise ValueError
+        return tuple(
+            date.fromisoformat(value) if value_type is date else value_type(value)
+            for value, value_type in zip(values, types)
+        )
+    except (ValueError, TypeError):
+        raise ValueError("잘못된 페이지 커서입니다")
+
+def keyset_page(
+    query: Query,
+    columns: Sequence,
+    after: Optional[Tuple],
+    limit: int,
+    descending: bool = False
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    키셋 페이지 조회 (정렬 키가 커서 다음인 행부터 limit개)
+
+    OFFSET처럼 앞 페이지 행을 읽고 버리지 않으므로 깊은 페이지도 첫 페이지와 비용이 같고,
+    조회 중 새 행이 들어와도 페이지가 밀리지 않음. columns는 유일한 조합이어야 하고
+    (마지막은 id 등), 같은 순서의 복합 인덱스가 있어야 인덱스 범위 스캔으로 처리됨.
+    다음 페이지가 없으면 커서는 None
+    """
+    if after is not None:
+        key = tuple_(*columns)
+        query = query.filter(key < tuple_(*after) if descending else key > tuple_(*after))
+
+    order = [column.desc() if descending else column for column in columns]
+    rows = query.order_by(*order).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor([getattr(rows[-1], column.key) for column in columns])
@@ -0,0 +1,221 @@
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Text, cast, event, func, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..models import Procedure
+
+logger = logging.getLogger(__name__)
+
+# 이름 사이 구분자 (공백, 가운뎃점, 하이픈 등)는 영문/숫자 사이에서만 공백 하나로 남기고 제거
+# ("アイ・オリジオ" = "アイオリジオ", "실 리프팅" = "실리프팅", "thread lift"는 띄어쓰기 유지)
+SEPARATOR_PATTERN = re.compile(r'[\s・·\-_/]+')
+NON_WORD_SPACE = re.compile(r' (?![a-z0-9])|(?<![a-z0-9]) ')
+
+# 이보다 짧은 이름은 다른 단어 안에서 우연히 일치하기 쉬워 등록하지 않음
+MIN_NAME_CHARS = 2
+
+def normalize_name(text: str) -> str:
+    """
+    매칭용 정규화 (NFKC 폭 통일, 대소문자 무시, 구분자 제거)
+    """
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return NON_WORD_SPACE.sub("", SEPARATOR_PATTERN.sub(" ", text))
+
+def _is_ascii_word(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+class AhoCorasick:
+    """
+    다중 패턴 문자열 매칭 오토마톤
+
+    구축 O(패턴 길이 합), 검색 O(텍스트 길이 + 일치 수)
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, Any]]] = [[]]  # 노드에서 끝나는 (패턴 길이, 값)
+
+        for pattern, value in patterns:
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append([])
+                node = next_node
+            self._outputs[node].append((len(pattern), value))
+
+        # 너비 우선으로 실패 링크 계산, 실패 링크 쪽 출력도 합쳐 둠
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+
+    @property
+    def size(self) -> int:
+        return len(self._goto)
+
+    def iter(self, text: str):
+        """
+        (시작 위치, 끝 위치, 값) 순회 (겹치는 일치 포함)
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, value in outputs[node]:
+                yield index - length + 1, index + 1, value
+
+class ProcedureMatcher:
+    """
+    시술 카탈로그 기반 녹취록/요약의 시술 언급 추출
+
+    - 한국어명, 영문명, aliases(일본어 가타카나명, 브랜드/제품명, 다른 표기)를 한 오토마톤에 등록
+    - 띄어쓰기/가운뎃점 차이는 무시 ("실 리프팅" = "실리프팅", 영문 이름은 붙여 쓴 표기도 등록)
+    - 영문 이름은 앞뒤가 영문/숫자가 아닐 때만 일치 (단어 경계)
+    - 같은 위치에서 겹치면 가장 긴 이름 우선 ("아이 오리지오"는 오리지오가 아닌 아이 오리지오)
+    - 시술이 바뀌면 ORM 이벤트로 즉시, 다른 프로세스의 변경은 refresh_interval마다 지문으로 확인해 다시 구축
+    """
+
+    def __init__(self, refresh_interval: float):
+        self.refresh_interval = refresh_interval
+        self._automaton: Optional[AhoCorasick] = None
+        self._fingerprint: Optional[Tuple] = None
+        self._names = 0
+        self._checked_at = 0.0
+        self._stale = True
+        self._lock = threading.Lock()
+        self.stats = {"builds": 0, "checks": 0, "matches": 0}
+
+    def invalidate(self):
+        """
+        다음 조회 때 지문 확인 강제 (시술 생성/수정/삭제 시)
+        """
+        self._stale = True
+
+    @staticmethod
+    def procedure_names(procedure: Procedure) -> List[str]:
+        names = [procedure.korean_name, procedure.english_name, *(procedure.aliases or [])]
+        return [name for name in names if isinstance(name, str) and name.strip()]
+
+    @staticmethod
+    def _fingerprint_query(db: Session) -> Tuple:
+        # aliases는 마이그레이션 스크립트가 SQL로 직접 채우기도 해 수정 시각/버전만으로는 변경을 놓침
+        row = db.query(
+            func.count(Procedure.id),
+            func.max(Procedure.last_updated),
+            func.sum(Procedure.version),
+            func.md5(func.string_agg(cast(Procedure.aliases, Text), aggregate_order_by(literal_column("'|'"), Procedure.id)))
+        ).filter(Procedure.is_active == True).first()
+        return tuple(row) if row else ()
+
+    @staticmethod
+    def build_automaton(procedures: Iterable[Procedure]) -> Tuple[AhoCorasick, int]:
+        patterns = {}
+        for procedure in procedures:
+            for name in ProcedureMatcher.procedure_names(procedure):
+                normalized = normalize_name(name)
+                for variant in {normalized, normalized.replace(" ", "")}:
+                    if len(variant) >= MIN_NAME_CHARS:
+                        # 서로 다른 시술이 같은 이름을 쓰면 먼저 등록된(번호가 빠른) 시술
+                        patterns.setdefault(variant, procedure.id)
+        return AhoCorasick(patterns.items()), len(patterns)
+
+    def load(self, db: Session):
+        """
+        시술 카탈로그로 오토마톤 구축 (앱 시작 시)
+        """
+        with self._lock:
+            self._refresh(db)
+
+    def _refresh(self, db: Session):
+        self.stats["checks"] += 1
+        self._stale = False
+        self._checked_at = time.monotonic()
+
+        fingerprint = self._fingerprint_query(db)
+        if self._automaton is not None and fingerprint == self._fingerprint:
+            return
+
+        procedures = db.query(Procedure).filter(Procedure.is_active == True).order_by(Procedure.procedure_number).all()
+        self._automaton, self._names = self.build_automaton(procedures)
+        self._fingerprint = fingerprint
+        self.stats["builds"] += 1
+        logger.info(f"시술 매처 구축: 시술 {len(procedures)}개, 이름 {self._names}개, 노드 {self._automaton.size}개")
+
+    def _ensure(self, db: Session) -> AhoCorasick:
+        with self._lock:
+            if self._automaton is None or self._stale or time.monotonic() - self._checked_at >= self.refresh_interval:
+                self._refresh(db)
+            return self._automaton
+
+    @staticmethod
+    def find(automaton: AhoCorasick, text: str) -> List[int]:
+        """
+        텍스트에 언급된 시술 ID (처음 언급된 순서)
+        """
+        text = normalize_name(text)
+        candidates = sorted(automaton.iter(text), key=lambda match: (match[0], -(match[1] - match[0])))
+
+        found: List[int] = []
+        covered_until = 0
+        for start, end, procedure_id in candidates:
+            if start < covered_until:
+                continue
+            # 영문 이름은 단어 중간에서 일치하지 않도록
+            if _is_ascii_word(text[start]) and start > 0 and _is_ascii_word(text[start - 1]):
+                continue
+            if _is_ascii_word(text[end - 1]) and end < len(text) and _is_ascii_word(text[end]):
+                continue
+            covered_until = end
+            if procedure_id not in found:
+                found.append(procedure_id)
+        return found
+
+    def match(self, db: Session, *texts: Optional[str]) -> List[int]:
+        """
+        여러 텍스트(원문, 요약 등)에서 언급된 시술 ID 합집합 (처음 언급된 순서)
+        """
+        automaton = self._ensure(db)
+        found: List[int] = []
+        for text in texts:
+            if not text:
+                continue
+            for procedure_id in self.find(automaton, text):
+                if procedure_id not in found:
+                    found.append(procedure_id)
+        self.stats["matches"] += 1
+        return found
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "names": self._names,
+            "nodes": self._automaton.size if self._automaton else 0
+        }
+
+# 프로세스 전체 공유 매처
+procedure_matcher = ProcedureMatcher(refresh_interval=settings.PROCEDURE_MATCHER_REFRESH_SECONDS)
+
+# 같은 프로세스의 시술 쓰기는 즉시 무효화
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(Procedure, _event, lambda mapper, connection, target: procedure_matcher.invalidate())
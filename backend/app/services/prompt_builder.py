@@ -0,0 +1,243 @@
+import hashlib
+import re
+import string
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+# 모든 요청에서 바이트 단위로 동일해야 하는 고정 시스템 프롬프트 접두어
+SYSTEM_PREFIX = "당신은 일본어를 한국어로 번역하고 의료/미용 상담 내용을 요약하는 전문가입니다.\n\n"
+
+# 사용자 메시지 접두어 (가변 원문은 항상 프롬프트 맨 끝에 위치)
+USER_PREFIX = "다음 일본어 상담 내용을 요약해주세요:\n\n"
+
+# 긴 녹취록 map 단계: 구간별 사실 메모 추출용 시스템 프롬프트
+MAP_SYSTEM_PROMPT = (
+    "당신은 일본어 의료/미용 상담 녹취록을 한국어로 정리하는 전문가입니다.\n"
+    "아래는 긴 상담 녹취록의 일부 구간입니다. 이 구간에 나온 고객 정보, 고객의 말투와 태도, "
+    "언급되거나 제안된 시술과 가격, 결정 사항, 보류 사항, 고객의 인상적인 발언(원문 인용 포함), "
+    "상담자의 설명 방식을 빠짐없이 한국어 메모로 정리하세요.\n"
+    "형식을 꾸미지 말고 사실만 간결한 목록으로 작성하세요."
+)
+
+# 긴 녹취록 reduce 단계: 구간 메모를 템플릿 형식으로 통합할 때의 사용자 메시지 접두어
+REDUCE_USER_PREFIX = "다음은 긴 일본어 상담 녹취록을 구간별로 정리한 한국어 메모입니다. 전체 상담 내용으로 간주하여 요약해주세요:\n\n"
+
+# 템플릿 원문 언어(PromptTemplate.source_language)별 고정 프롬프트
+# ja: 일본어 → 한국어 번역 요약 (기본), ko: 한국어/혼합 상담의 요약 전용 (번역 지시 없음)
+DEFAULT_SOURCE_LANGUAGE = "ja"
+LANGUAGE_PROMPTS = {
+    "ja": {
+        "system": SYSTEM_PREFIX,
+        "user": USER_PREFIX,
+        "map_system": MAP_SYSTEM_PROMPT,
+        "reduce_user": REDUCE_USER_PREFIX
+    },
+    "ko": {
+        "system": "당신은 의료/미용 상담 내용을 요약하는 전문가입니다. 상담은 한국어로 진행되었고 일본어가 일부 섞여 있을 수 있습니다. 번역문은 쓰지 말고 바로 한국어로 요약하세요.\n\n",
+        "user": "다음 상담 내용을 요약해주세요:\n\n",
+        "map_system": (
+            "당신은 의료/미용 상담 녹취록을 한국어로 정리하는 전문가입니다.\n"
+            "아래는 긴 상담 녹취록의 일부 구간입니다. 이 구간에 나온 고객 정보, 고객의 말투와 태도, "
+            "언급되거나 제안된 시술과 가격, 결정 사항, 보류 사항, 고객의 인상적인 발언(원문 인용 포함), "
+            "상담자의 설명 방식을 빠짐없이 한국어 메모로 정리하세요.\n"
+            "형식을 꾸미지 말고 사실만 간결한 목록으로 작성하세요."
+        ),
+        "reduce_user": "다음은 긴 상담 녹취록을 구간별로 정리한 메모입니다. 전체 상담 내용으로 간주하여 요약해주세요:\n\n"
+    }
+}
+
+def language_prompts(source_language: Optional[str]) -> Dict[str, str]:
+    """
+    원문 언어별 고정 프롬프트 (등록되지 않은 언어는 기본 일본어 경로)
+    """
+    return LANGUAGE_PROMPTS.get(source_language or DEFAULT_SOURCE_LANGUAGE, LANGUAGE_PROMPTS[DEFAULT_SOURCE_LANGUAGE])
+
+# 템플릿에 허용되는 자리표시자 → 시스템 프롬프트(고정부)에 들어갈 표현
+# 원문은 항상 사용자 메시지로 보내므로 시스템 프롬프트에는 자리표시자 대신 참조 문구를 넣음
+TEMPLATE_PLACEHOLDERS = {
+    "input_text": "(사용자 메시지로 전달되는 상담 내용)"
+}
+REQUIRED_PLACEHOLDERS = ("input_text",)
+
+class TemplateCompileError(ValueError):
+    """
+    잘못된 프롬프트 템플릿 (짝이 없는 중괄호, 선언되지 않은 자리표시자 등)
+    """
+
+def parse_template(text: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    템플릿을 (고정 텍스트, 자리표시자 이름 또는 None) 구간 목록으로 분해하고 검증
+
+    - 중괄호 문법 오류, 위치 인자({}), 속성/인덱스 접근, 변환/형식 지정은 거절
+    - TEMPLATE_PLACEHOLDERS에 없는 이름은 거절, 필수 자리표시자는 정확히 한 번
+    - 리터럴 중괄호는 {{ }}로 이스케이프
+    """
+    try:
+        parsed = list(string.Formatter().parse(text))
+    except ValueError as e:
+        raise TemplateCompileError(f"템플릿 중괄호 오류: {str(e)} (리터럴 중괄호는 {{{{ }}}}로 입력)")
+
+    segments: List[Tuple[str, Optional[str]]] = []
+    counts: Dict[str, int] = {}
+    for literal, field, format_spec, conversion in parsed:
+        if field is not None:
+            if field == "" or not field.isidentifier():
+                raise TemplateCompileError(f"허용되지 않는 자리표시자: {{{field}}}")
+            if format_spec or conversion:
+                raise TemplateCompileError(f"자리표시자에 형식 지정을 쓸 수 없습니다: {{{field}}}")
+            if field not in TEMPLATE_PLACEHOLDERS:
+                raise TemplateCompileError(
+                    f"선언되지 않은 자리표시자: {{{field}}} (허용: {', '.join(TEMPLATE_PLACEHOLDERS)})"
+                )
+            counts[field] = counts.get(field, 0) + 1
+        segments.append((literal, field))
+
+    for name in REQUIRED_PLACEHOLDERS:
+        if counts.get(name, 0) != 1:
+            raise TemplateCompileError(f"자리표시자 {{{name}}}는 정확히 한 번 있어야 합니다 (현재 {counts.get(name, 0)}번)")
+    return segments
+
+class CompiledTemplate:
+    """
+    템플릿 렌더링 계획 (생성/활성화 시 한 번 컴파일)
+
+    - segments: 고정 텍스트와 자리표시자 순서
+    - system_content / cache_key: 자리표시자를 참조 문구로 바꾼 고정 시스템 프롬프트와 제공자 캐시 키
+      (시스템/사용자 접두어는 source_language별 LANGUAGE_PROMPTS)
+    - static_prefix: 첫 자리표시자 앞까지 미리 렌더링한 텍스트
+    - static_tokens: 고정부 토큰 수 (token_estimator가 한 번 측정해 기록)
+    요청마다는 render()로 고정 조각 사이에 값만 끼워 넣음
+    """
+
+    def __init__(self, template_text: str, source_language: str = DEFAULT_SOURCE_LANGUAGE):
+        self.segments = parse_template(template_text)
+        self.placeholders = tuple(field for _, field in self.segments if field is not None)
+        self.source_language = source_language
+        self.prompts = language_prompts(source_language)
+        self.user_prefix = self.prompts["user"]
+
+        static = "".join(
+            literal + (TEMPLATE_PLACEHOLDERS[field] if field else "") for literal, field in self.segments
+        )
+        self.system_content = self.prompts["system"] + canonicalize_template(static)
+        self.cache_key = "forte-summary-" + hashlib.sha256(self.system_content.encode("utf-8")).hexdigest()[:16]
+
+        first_field = next(index for index, (_, field) in enumerate(self.segments) if field is not None)
+        self.static_prefix = "".join(literal for literal, _ in self.segments[:first_field + 1])
+        self._tail = self.segments[first_field + 1:]
+        self._first_field = self.segments[first_field][1]
+        self.static_tokens: Optional[int] = None
+
+    def render(self, **values: str) -> str:
+        """
+        고정 조각 사이에 값을 끼워 넣어 전체 프롬프트 생성
+        """
+        parts = [self.static_prefix, values[self._first_field]]
+        for literal, field in self._tail:
+            parts.append(literal)
+            if field is not None:
+                parts.append(values[field])
+        return "".join(parts)
+
+def canonicalize_template(text: str) -> str:
+    """
+    템플릿 공백 정규화 (NFC, 줄바꿈 통일, 줄 끝 공백 제거, 3줄 이상 빈 줄 축약)
+    """
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    text = "\n".join(line.rstrip() for line in text.split("\n"))
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+class PromptBuilder:
+    """
+    프롬프트 조립 계층
+
+    템플릿별 정규화된 시스템 프롬프트를 한 번만 만들어 두고, 고정 접두어 +
+    템플릿을 앞에, 원문을 맨 뒤에 배치해 제공자 측 프롬프트 캐시 적중을 극대화
+    """
+
+    def __init__(self, max_templates: int = 64):
+        self.max_templates = max_templates
+        self._compiled: "OrderedDict[str, CompiledTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compile(self, template_text: str, source_language: Optional[str] = None) -> CompiledTemplate:
+        """
+        템플릿 컴파일 (원문 언어 + 본문 해시 기준 LRU 캐시, 잘못된 템플릿은 TemplateCompileError)
+        """
+        source_language = source_language or DEFAULT_SOURCE_LANGUAGE
+        raw_key = source_language + ":" + hashlib.sha256(template_text.encode("utf-8")).hexdigest()
+        with self._lock:
+            compiled = self._compiled.get(raw_key)
+            if compiled is not None:
+                self._compiled.move_to_end(raw_key)
+                return compiled
+
+        compiled = CompiledTemplate(template_text, source_language)
+
+        with self._lock:
+            self._compiled[raw_key] = compiled
+            while len(self._compiled) > self.max_templates:
+                self._compiled.popitem(last=False)
+        return compiled
+
+    def system_prompt(self, template_text: str, source_language: Optional[str] = None) -> Tuple[str, str]:
+        """
+        (고정 시스템 프롬프트, 프롬프트 캐시 키) 반환
+        """
+        compiled = self.compile(template_text, source_language)
+        return compiled.system_content, compiled.cache_key
+
+    def build_messages(
+        self,
+        template_text: str,
+        input_text: str,
+        user_prefix: Optional[str] = None,
+        source_language: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], str]:
+        """
+        (chat messages, 프롬프트 캐시 키) 반환 (user_prefix가 없으면 원문 언어별 기본 접두어)
+        """
+        compiled = self.compile(template_text, source_language)
+        messages = [
+            {"role": "system", "content": compiled.system_content},
+            {"role": "user", "content": (compiled.user_prefix if user_prefix is None else user_prefix) + input_text}
+        ]
+        return messages, compiled.cache_key
+
+class PromptCacheStats:
+    """
+    템플릿 버전별 제공자 프롬프트 캐시 적중률 (cached_tokens / prompt_tokens)
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, template_key: str, prompt_tokens: int, cached_tokens: int):
+        with self._lock:
+            entry = self._stats.setdefault(
+                template_key, {"requests": 0, "prompt_tokens": 0, "cached_tokens": 0}
+            )
+            entry["requests"] += 1
+            entry["prompt_tokens"] += prompt_tokens or 0
+            entry["cached_tokens"] += cached_tokens or 0
+
+    def get_stats(self, template_key: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            items = {
+                key: {
+                    **entry,
+                    "cached_ratio": round(entry["cached_tokens"] / entry["prompt_tokens"], 4)
+                    if entry["prompt_tokens"] else 0.0
+                }
+                for key, entry in self._stats.items()
+                if template_key is None or key == template_key
+            }
+        return items
+
+# 프로세스 전체 공유 인스턴스
+prompt_builder = PromptBuilder()
+prompt_cache_stats = PromptCacheStats()
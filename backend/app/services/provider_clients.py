@@ -0,0 +1,149 @@
+import asyncio
+import httpx
+import logging
+from typing import Optional
+from fastapi import HTTPException
+from openai import AsyncOpenAI
+from ..core.config import settings
+from .openai_service import OpenAISummaryService, MODEL_NAME as OPENAI_MODEL_NAME
+from .summary_provider import SummaryProvider
+from .gemini_service import GeminiSummaryService, create_generative_model
+from .provider_router import ProviderRouter
+from .fake_provider import FakeSummaryProvider
+from .rate_limiter import ProviderAdmission, AdmittedProvider
+from .resilience import DeadlineProvider, ResilientProvider, CircuitBreaker, RetryBudget
+
+logger = logging.getLogger(__name__)
+
+class ProviderClientRegistry:
+    """
+    AI 제공자 클라이언트 레지스트리
+
+    앱 lifespan 동안 커넥션 풀(keep-alive)을 유지하고, 요청마다
+    클라이언트/TLS 연결을 새로 만들지 않도록 서비스 인스턴스를 공유
+    """
+
+    def __init__(self):
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self.openai_client: Optional[AsyncOpenAI] = None
+        self.openai_service: Optional[OpenAISummaryService] = None
+        self.gemini_service: Optional[GeminiSummaryService] = None
+        self.router: Optional[ProviderRouter] = None
+
+    async def startup(self):
+        """
+        클라이언트 생성 및 커넥션 사전 연결
+        """
+        if settings.OPENAI_API_KEY:
+            self.http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY
+                ),
+                timeout=httpx.Timeout(settings.OPENAI_TIMEOUT, connect=10.0)
+            )
+            self.openai_client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=self.http_client
+            )
+            await self._warmup_openai()
+
+        self.openai_service = OpenAISummaryService(client=self.openai_client)
+
+        # Gemini는 API 키 설정과 모델 생성을 한 번만 수행
+        gemini_model = create_generative_model() if settings.GEMINI_API_KEY else None
+        self.gemini_service = GeminiSummaryService(model=gemini_model)
+
+        # 설정된 우선순위대로 제공자를 묶은 라우터
+        providers = {
+            self.openai_service.name: self.openai_service,
+            self.gemini_service.name: self.gemini_service
+        }
+        if FakeSummaryProvider.name in settings.LLM_PROVIDER_ORDER:
+            providers[FakeSummaryProvider.name] = FakeSummaryProvider.from_settings()
+            logger.warning("가짜 LLM 제공자가 활성화되었습니다 (부하 테스트용)")
+        order = [name.strip() for name in settings.LLM_PROVIDER_ORDER.split(",") if name.strip() in providers]
+        self.router = ProviderRouter(
+            [self._wrap(providers[name]) for name in order],
+            hedge=settings.LLM_HEDGE_ENABLED,
+            hedge_min_delay=settings.LLM_HEDGE_MIN_DELAY_MS / 1000
+        )
+
+        logger.info("AI 제공자 클라이언트 레지스트리 초기화 완료")
+
+    @staticmethod
+    def _wrap(provider: SummaryProvider) -> ResilientProvider:
+        """
+        제공자 래핑: 재시도/회로 차단 → 승인 제어(분당 한도 + AIMD 창) → 응답 기한 → 제공자
+        """
+        deadline = DeadlineProvider(
+            provider,
+            first_token_timeout=settings.LLM_FIRST_TOKEN_TIMEOUT,
+            idle_timeout=settings.LLM_STREAM_IDLE_TIMEOUT,
+            request_timeout=settings.LLM_REQUEST_TIMEOUT
+        )
+        rpm = getattr(settings, f"{provider.name.upper()}_RPM", 0)
+        tpm = getattr(settings, f"{provider.name.upper()}_TPM", 0)
+        admission = ProviderAdmission(
+            provider.name,
+            rpm=rpm,
+            tpm=tpm,
+            initial_concurrency=settings.LLM_INITIAL_CONCURRENCY,
+            min_concurrency=settings.LLM_MIN_CONCURRENCY,
+            max_concurrency=settings.LLM_MAX_CONCURRENCY,
+            max_wait=settings.LLM_ADMISSION_MAX_WAIT
+        )
+        # 긴 녹취록을 구간별로 나눠 호출하는 제공자는 구간/reduce 호출을 직접 승인
+        self_admitted = hasattr(provider, "admission")
+        if self_admitted:
+            provider.admission = admission
+        return ResilientProvider(
+            AdmittedProvider(deadline, admission, self_admitted_map_reduce=self_admitted),
+            CircuitBreaker(settings.LLM_BREAKER_FAILURE_THRESHOLD, settings.LLM_BREAKER_RECOVERY_SECONDS),
+            RetryBudget(settings.LLM_RETRY_BUDGET_RATIO),
+            max_attempts=settings.LLM_MAX_ATTEMPTS,
+            backoff_base=settings.LLM_BACKOFF_BASE,
+            backoff_cap=settings.LLM_BACKOFF_CAP,
+            probe_timeout=settings.LLM_FIRST_TOKEN_TIMEOUT
+        )
+
+    async def shutdown(self):
+        """
+        커넥션 풀 정리
+        """
+        if self.openai_client:
+            await self.openai_client.close()
+        self.http_client = None
+        self.openai_client = None
+        self.openai_service = None
+        self.gemini_service = None
+        self.router = None
+        logger.info("AI 제공자 클라이언트 레지스트리 종료")
+
+    async def _warmup_openai(self):
+        """
+        토큰을 소모하지 않는 요청으로 TLS 연결을 미리 맺어 keep-alive 풀에 적재
+        """
+        count = settings.OPENAI_WARMUP_CONNECTIONS
+        if count <= 0:
+            return
+
+        results = await asyncio.gather(
+            *(self.openai_client.models.retrieve(OPENAI_MODEL_NAME) for _ in range(count)),
+            return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures:
+            logger.warning(f"OpenAI 커넥션 사전 연결 일부 실패: {str(failures[0])}")
+        else:
+            logger.info(f"OpenAI 커넥션 {count}개 사전 연결 완료")
+
+# 프로세스 전체 공유 레지스트리
+provider_registry = ProviderClientRegistry()
+
+# FastAPI 의존성
+def get_summary_provider() -> ProviderRouter:
+    if provider_registry.router is None:
+        raise HTTPException(status_code=503, detail="AI 제공자 클라이언트가 초기화되지 않았습니다")
+    return provider_registry.router
@@ -0,0 +1,271 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
+from .summary_provider import SummaryProvider, ProviderError
+from .telemetry import record_provider
+
+logger = logging.getLogger(__name__)
+
+class LatencyTracker:
+    """
+    제공자별 최근 지연시간 롤링 윈도우 (첫 토큰 시간, 전체 시간)
+    """
+
+    def __init__(self, window: int = 200):
+        self.ttft = deque(maxlen=window)
+        self.total = deque(maxlen=window)
+        self.successes = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.hedge_wins = 0
+
+    def record_success(self, ttft: Optional[float], total: float):
+        if ttft is not None:
+            self.ttft.append(ttft)
+        self.total.append(total)
+        self.successes += 1
+        self.consecutive_errors = 0
+
+    def record_error(self):
+        self.errors += 1
+        self.consecutive_errors += 1
+
+    @staticmethod
+    def percentile(samples, p: float) -> Optional[float]:
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, int(round(p / 100 * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        def ms(value):
+            return round(value * 1000, 1) if value is not None else None
+        return {
+            "successes": self.successes,
+            "errors": self.errors,
+            "consecutive_errors": self.consecutive_errors,
+            "hedge_wins": self.hedge_wins,
+            "ttft_ms": {f"p{p}": ms(self.percentile(self.ttft, p)) for p in (50, 95, 99)},
+            "total_ms": {f"p{p}": ms(self.percentile(self.total, p)) for p in (50, 95, 99)}
+        }
+
+class ProviderRouter(SummaryProvider):
+    """
+    여러 요약 제공자(OpenAI, Gemini)를 묶는 라우터
+
+    - 설정 순서를 기본으로, 연속 오류가 난 제공자는 뒤로 미룸
+    - 첫 토큰 전 오류가 나면 다음 제공자로 장애 조치
+    - hedge 사용 시 p95 기반 기한 안에 첫 토큰이 없으면 다음 제공자에도 요청하고
+      먼저 첫 토큰을 낸 쪽을 채택, 나머지는 취소
+    """
+
+    name = "router"
+
+    def __init__(
+        self,
+        providers: List[SummaryProvider],
+        hedge: bool = False,
+        hedge_min_delay: float = 1.5,
+        demote_after_errors: int = 3,
+        window: int = 200
+    ):
+        self.providers = providers
+        self.hedge = hedge
+        self.hedge_min_delay = hedge_min_delay
+        self.demote_after_errors = demote_after_errors
+        self.latency = {provider.name: LatencyTracker(window) for provider in providers}
+
+        # 캐시 키용 모델/파라미터: 라우팅 구성이 바뀌면 키도 바뀜
+        self.model_name = "router:" + ",".join(provider.model_name for provider in providers)
+        self.sampling_params = providers[0].sampling_params if providers else {}
+
+    @property
+    def is_available(self) -> bool:
+        return any(provider.is_available for provider in self.providers)
+
+    def _ordered(self) -> List[SummaryProvider]:
+        """
+        사용 가능한 제공자를 우선순위대로 정렬 (연속 오류 제공자는 뒤로)
+        """
+        available = [provider for provider in self.providers if provider.is_available]
+        healthy = [p for p in available if self.latency[p.name].consecutive_errors < self.demote_after_errors]
+        degraded = [p for p in available if p not in healthy]
+        return healthy + degraded
+
+    def _hedge_delay(self, provider: SummaryProvider) -> float:
+        p95 = LatencyTracker.percentile(self.latency[provider.name].ttft, 95)
+        return max(self.hedge_min_delay, p95 or 0.0)
+
+    async def summarize_japanese_to_korean(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        stream: bool = False,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        일본어 상담 내용을 한국어로 요약 (실패 시 다음 제공자로 장애 조치)
+        """
+        if stream:
+            return self.stream_summary(japanese_text, prompt_template, template_key, plan)
+
+        providers = self._ordered()
+        if not providers:
+            return {
+                "success": False,
+                "error": "사용 가능한 AI 제공자가 없습니다. 관리자에게 문의하세요.",
+                "status_code": 503,
+                "retry_after": None,
+                "retryable": True,
+                "original_text": japanese_text
+            }
+
+        result = None
+        for provider in providers:
+            started = time.monotonic()
+            result = await provider.summarize_japanese_to_korean(
+                japanese_text,
+                prompt_template,
+                template_key=template_key,
+                plan=plan
+            )
+            if result["success"]:
+                self.latency[provider.name].record_success(None, time.monotonic() - started)
+                record_provider(provider.name, provider.model_name)
+                result["provider"] = provider.name
+                return result
+
+            self.latency[provider.name].record_error()
+            logger.warning(f"{provider.name} 요약 실패, 다음 제공자로 전환: {result['error']}")
+
+        return result
+
+    async def stream_summary(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        정규화된 청크 스트림 (첫 토큰 전 장애 조치, 선택적 hedge)
+        """
+        candidates = self._ordered()
+        if not candidates:
+            raise ProviderError("사용 가능한 AI 제공자가 없습니다. 관리자에게 문의하세요.", status_code=503)
+
+        started = time.monotonic()
+        provider, stream, first_chunk = await self._first_chunk(
+            candidates, japanese_text, prompt_template, template_key, plan, started
+        )
+        ttft = time.monotonic() - started
+        tracker = self.latency[provider.name]
+        record_provider(provider.name, provider.model_name)
+
+        try:
+            if first_chunk is not None:
+                yield first_chunk
+            async for chunk in stream:
+                yield chunk
+        except Exception:
+            tracker.record_error()
+            raise
+
+        tracker.record_success(ttft, time.monotonic() - started)
+
+    async def _first_chunk(
+        self,
+        candidates: List[SummaryProvider],
+        japanese_text: str,
+        prompt_template: str,
+        template_key: Optional[str],
+        plan: Optional[Dict[str, Any]],
+        started: float
+    ) -> Tuple[SummaryProvider, AsyncIterator[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        첫 청크를 가장 먼저 내놓는 제공자를 선택
+
+        반환값: (채택된 제공자, 해당 스트림, 첫 청크 - 빈 스트림이면 None)
+        """
+        pending: Dict[asyncio.Task, Tuple[SummaryProvider, AsyncIterator[Dict[str, Any]]]] = {}
+        remaining = list(candidates)
+        last_error: Optional[BaseException] = None
+        hedged = False
+
+        def launch():
+            provider = remaining.pop(0)
+            stream = provider.stream_summary(japanese_text, prompt_template, template_key, plan)
+            task = asyncio.ensure_future(stream.__anext__())
+            pending[task] = (provider, stream)
+
+        launch()
+        try:
+            while pending:
+                timeout = None
+                if self.hedge and remaining:
+                    primary = next(iter(pending.values()))[0]
+                    timeout = max(0.0, self._hedge_delay(primary) - (time.monotonic() - started))
+
+                done, _ = await asyncio.wait(pending.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # hedge 기한 초과: 다음 제공자에도 동시에 요청
+                    logger.info(f"첫 토큰 지연으로 hedge 요청 시작: {remaining[0].name}")
+                    hedged = True
+                    launch()
+                    continue
+
+                for task in done:
+                    provider, stream = pending.pop(task)
+                    try:
+                        first_chunk = task.result()
+                    except StopAsyncIteration:
+                        first_chunk = None
+                    except Exception as e:
+                        last_error = e
+                        self.latency[provider.name].record_error()
+                        logger.warning(f"{provider.name} 스트리밍 시작 실패, 다음 제공자로 전환: {str(e)}")
+                        if remaining and not pending:
+                            launch()
+                        continue
+
+                    if hedged and provider is not candidates[0]:
+                        self.latency[provider.name].hedge_wins += 1
+                    return provider, stream, first_chunk
+
+            raise last_error or RuntimeError("AI 제공자 응답을 받지 못했습니다")
+        finally:
+            # 채택되지 않은 요청 취소
+            for task, (provider, stream) in pending.items():
+                task.cancel()
+                asyncio.ensure_future(self._close_quietly(task, stream))
+
+    @staticmethod
+    async def _close_quietly(task: asyncio.Task, stream: AsyncIterator[Dict[str, Any]]):
+        try:
+            await task
+        except BaseException:
+            pass
+        try:
+            await stream.aclose()
+        except Exception:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "hedge": self.hedge,
+            "hedge_min_delay_ms": round(self.hedge_min_delay * 1000),
+            "order": [provider.name for provider in self._ordered()],
+            "providers": {
+                provider.name: {
+                    **self.latency[provider.name].snapshot(),
+                    "admission": provider.admission.get_stats() if getattr(provider, "admission", None) else None,
+                    "resilience": provider.get_stats() if hasattr(provider, "breaker") else None
+                }
+                for provider in self.providers
+            }
+        }
@@ -0,0 +1,304 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, AsyncIterator
+from .summary_provider import SummaryProvider, ProviderError, provider_error_status, failure_result
+from .token_estimator import token_estimator
+from .telemetry import record_queue_wait
+
+logger = logging.getLogger(__name__)
+
+def admission_outcome(status_code: Optional[int]) -> str:
+    """
+    실패한 호출의 창 조정 결과 (429만 rate_limited)
+    """
+    return "rate_limited" if status_code == 429 else "error"
+
+class TokenBucket:
+    """
+    분당 한도(요청 수 / 토큰 수)용 토큰 버킷
+
+    대기자는 도착 순서대로 처리되며, rate_per_minute가 0이면 제한 없음
+    """
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = float(rate_per_minute)
+        self.rate = rate_per_minute / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0):
+        if self.rate <= 0:
+            return
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def refund(self, amount: float):
+        """
+        예약했지만 실제로 쓰지 않은 양 반환
+        """
+        if self.rate <= 0 or amount <= 0:
+            return
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+class AIMDLimiter:
+    """
+    AIMD(가산 증가 / 승산 감소) 동시 실행 창
+
+    성공하면 창을 조금씩 넓히고, 429나 지연 급증 시 창을 줄임.
+    지연 기준선은 종류별로 따로 유지 (스트림의 첫 토큰 지연과 비스트림 호출 전체 시간을 섞지 않음)
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 64,
+        decrease_factor: float = 0.5,
+        latency_factor: float = 2.0,
+        cooldown: float = 1.0
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.waiting = 0
+        self._latency_ewma: Dict[str, float] = {}
+        self._last_decrease = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._cond:
+            self.waiting += 1
+            try:
+                await self._cond.wait_for(lambda: self.in_flight < max(self.minimum, int(self.limit)))
+            finally:
+                self.waiting -= 1
+            self.in_flight += 1
+
+    async def release(self, outcome: str, latency: Optional[float] = None, latency_kind: str = "first_token"):
+        """
+        outcome: success / rate_limited / error / cancelled
+        latency_kind: first_token (스트림 첫 토큰까지) / call (비스트림 호출 전체)
+        """
+        async with self._cond:
+            self.in_flight -= 1
+            if outcome == "rate_limited":
+                self._decrease(self.decrease_factor)
+            elif outcome == "success":
+                baseline = self._latency_ewma.get(latency_kind)
+                if latency is not None and baseline is not None and latency > baseline * self.latency_factor:
+                    self._decrease(0.9)
+                else:
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                if latency is not None:
+                    self._latency_ewma[latency_kind] = latency if baseline is None \
+                        else 0.9 * baseline + 0.1 * latency
+            self._cond.notify_all()
+
+    def _decrease(self, factor: float):
+        # 한 번의 429 폭주로 창이 바닥까지 줄지 않도록 감소 간격 유지
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self.limit = max(self.minimum, self.limit * factor)
+        self._last_decrease = now
+
+class AdmissionTicket:
+    """
+    승인된 호출 1건의 결과 기록 (창 조정/토큰 환급에 사용)
+    """
+
+    def __init__(self, queue_wait: float):
+        self.queue_wait = queue_wait
+        self.admitted_at = time.monotonic()
+        self.outcome = "cancelled"
+        self.latency: Optional[float] = None
+        self.latency_kind = "first_token"
+        self.actual_tokens: Optional[int] = None
+
+class ProviderAdmission:
+    """
+    제공자별 승인 제어 (분당 요청 수 + 분당 토큰 수 버킷 + AIMD 동시 실행 창)
+
+    한도를 넘으면 실패시키지 않고 대기열에서 기다리게 함
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rpm: int,
+        tpm: int,
+        initial_concurrency: int,
+        min_concurrency: int,
+        max_concurrency: int,
+        max_wait: float
+    ):
+        self.name = name
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.limiter = AIMDLimiter(initial_concurrency, min_concurrency, max_concurrency)
+        self.max_wait = max_wait
+        self.stats = {"admitted": 0, "rate_limited": 0, "queue_timeouts": 0, "queue_wait_total": 0.0}
+
+    async def _acquire(self, estimated_tokens: int, acquired: Dict[str, float]):
+        await self.requests.acquire(1)
+        acquired["requests"] = 1
+        await self.tokens.acquire(estimated_tokens)
+        acquired["tokens"] = estimated_tokens
+        await self.limiter.acquire()
+
+    @asynccontextmanager
+    async def admit(self, estimated_tokens: int) -> AsyncIterator[AdmissionTicket]:
+        started = time.monotonic()
+        acquired = {"requests": 0, "tokens": 0}
+        try:
+            await asyncio.wait_for(self._acquire(estimated_tokens, acquired), timeout=self.max_wait)
+        except asyncio.TimeoutError:
+            # 실행되지 못한 요청이 분당 한도를 태우지 않도록 이미 가져간 만큼 반환
+            self.requests.refund(acquired["requests"])
+            self.tokens.refund(acquired["tokens"])
+            self.stats["queue_timeouts"] += 1
+            raise ProviderError(f"{self.name} 요청 대기 시간 초과 (처리량 한도)", status_code=503)
+
+        ticket = AdmissionTicket(time.monotonic() - started)
+        self.stats["admitted"] += 1
+        self.stats["queue_wait_total"] += ticket.queue_wait
+        try:
+            yield ticket
+        finally:
+            if ticket.outcome == "rate_limited":
+                self.stats["rate_limited"] += 1
+            await self.limiter.release(ticket.outcome, ticket.latency, ticket.latency_kind)
+            if ticket.actual_tokens is not None:
+                self.tokens.refund(estimated_tokens - ticket.actual_tokens)
+
+    async def stream(self, estimated_tokens: int, chunks: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        승인 후 정규화된 청크 스트림 전달 (첫 토큰 지연, 실제 토큰 수, 결과를 창 조정/환급에 반영)
+        """
+        async with self.admit(estimated_tokens) as ticket:
+            record_queue_wait(self.name, ticket.queue_wait)
+            try:
+                async for chunk in chunks:
+                    if ticket.latency is None and chunk["type"] == "content":
+                        ticket.latency = time.monotonic() - ticket.admitted_at
+                    elif chunk["type"] == "usage":
+                        ticket.actual_tokens = chunk["usage"]["total_tokens"]
+                    yield chunk
+                ticket.outcome = "success"
+            except Exception as e:
+                ticket.outcome = admission_outcome(provider_error_status(e))
+                raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        admitted = self.stats["admitted"]
+        return {
+            "concurrency_limit": round(self.limiter.limit, 2),
+            "in_flight": self.limiter.in_flight,
+            "waiting": self.limiter.waiting,
+            "admitted": admitted,
+            "rate_limited": self.stats["rate_limited"],
+            "queue_timeouts": self.stats["queue_timeouts"],
+            "avg_queue_wait_ms": round(self.stats["queue_wait_total"] / admitted * 1000, 1) if admitted else 0.0
+        }
+
+class AdmittedProvider(SummaryProvider):
+    """
+    요약 제공자를 승인 제어로 감싼 래퍼 (인터페이스는 원래 제공자와 동일)
+
+    self_admitted_map_reduce: 제공자가 긴 녹취록의 구간(map) 호출과 reduce 호출을 같은 승인 제어로
+    각각 승인하는 경우 (바깥에서 한 번 더 승인하면 창 슬롯을 붙잡은 채 구간 호출이 기다리게 됨)
+    """
+
+    def __init__(self, provider: SummaryProvider, admission: ProviderAdmission, self_admitted_map_reduce: bool = False):
+        self.provider = provider
+        self.admission = admission
+        self.self_admitted_map_reduce = self_admitted_map_reduce
+        self.name = provider.name
+        self.model_name = provider.model_name
+        self.sampling_params = provider.sampling_params
+
+    @property
+    def is_available(self) -> bool:
+        return self.provider.is_available
+
+    @staticmethod
+    def _estimate_tokens(japanese_text: str, prompt_template: str, plan: Optional[Dict[str, Any]]) -> int:
+        if plan:
+            return plan["prompt_tokens"] + plan["max_tokens"]
+        return token_estimator.estimate(prompt_template) + token_estimator.estimate(japanese_text)
+
+    def _admitted_inside(self, plan: Optional[Dict[str, Any]]) -> bool:
+        return self.self_admitted_map_reduce and plan is not None and plan["mode"] == "map_reduce"
+
+    async def summarize_japanese_to_korean(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        stream: bool = False,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        if stream:
+            return self.stream_summary(japanese_text, prompt_template, template_key, plan)
+
+        if self._admitted_inside(plan):
+            return await self.provider.summarize_japanese_to_korean(
+                japanese_text,
+                prompt_template,
+                template_key=template_key,
+                plan=plan
+            )
+
+        try:
+            async with self.admission.admit(self._estimate_tokens(japanese_text, prompt_template, plan)) as ticket:
+                record_queue_wait(self.name, ticket.queue_wait)
+                result = await self.provider.summarize_japanese_to_korean(
+                    japanese_text,
+                    prompt_template,
+                    template_key=template_key,
+                    plan=plan
+                )
+                ticket.latency = time.monotonic() - ticket.admitted_at
+                ticket.latency_kind = "call"
+                if result["success"]:
+                    ticket.outcome = "success"
+                    if result.get("tokens_used"):
+                        ticket.actual_tokens = result["tokens_used"]["total_tokens"]
+                else:
+                    ticket.outcome = admission_outcome(result.get("status_code"))
+                result["queue_wait"] = ticket.queue_wait
+                return result
+        except ProviderError as e:
+            return failure_result(japanese_text, e)
+
+    async def stream_summary(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        chunks = self.provider.stream_summary(japanese_text, prompt_template, template_key, plan)
+        if not self._admitted_inside(plan):
+            chunks = self.admission.stream(self._estimate_tokens(japanese_text, prompt_template, plan), chunks)
+        async for chunk in chunks:
+            yield chunk
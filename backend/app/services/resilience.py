@@ -0,0 +1,387 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Any, Optional, AsyncIterator
+from .summary_provider import (
+    SummaryProvider,
+    ProviderError,
+    is_retryable_error,
+    provider_error_status,
+    provider_retry_after,
+    failure_result
+)
+from .prompt_builder import DEFAULT_SOURCE_LANGUAGE
+from .token_estimator import token_estimator
+
+logger = logging.getLogger(__name__)
+
+# 반열림 상태에서 보내는 최소 탐침 요청 (출력 1토큰)
+# 탐침도 실제 요청과 같은 템플릿 컴파일을 거치므로 {input_text} 자리표시자가 꼭 한 번 있어야 함
+PROBE_TEXT = "こんにちは"
+PROBE_TEMPLATE = "{input_text}\n\n한 단어로 답하세요."
+
+def probe_plan() -> Dict[str, Any]:
+    """
+    탐침 요청 계획 (실제 요청과 같은 계획기로 만들어 제공자가 읽는 키가 항상 맞도록, 출력만 1토큰)
+    """
+    return {**token_estimator.plan(PROBE_TEXT, PROBE_TEMPLATE, DEFAULT_SOURCE_LANGUAGE), "max_tokens": 1}
+
+async def _close_quietly(stream: AsyncIterator[Dict[str, Any]]):
+    try:
+        await stream.aclose()
+    except Exception:
+        pass
+
+class RetryBudget:
+    """
+    재시도 예산 (요청마다 ratio만큼 적립, 재시도마다 1 차감)
+
+    제공자 장애 시 재시도가 부하를 몇 배로 키우지 않도록 전체 재시도 비율을 제한
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max(max_tokens, 1.0)
+        self.tokens = self.max_tokens
+
+    def deposit(self):
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+class DecorrelatedJitterBackoff:
+    """
+    Decorrelated jitter 백오프: sleep = min(cap, uniform(base, prev * 3))
+
+    Retry-After가 있으면 그보다 짧게 기다리지 않음
+    """
+
+    def __init__(self, base: float, cap: float, rng: Optional[random.Random] = None):
+        self.base = base
+        self.cap = cap
+        self.rng = rng or random.Random()
+        self._previous = base
+
+    def next_delay(self, retry_after: Optional[float] = None) -> float:
+        delay = min(self.cap, self.rng.uniform(self.base, self._previous * 3))
+        self._previous = delay
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.cap))
+        return delay
+
+class CircuitBreaker:
+    """
+    제공자별 회로 차단기 (closed → open → half_open → closed)
+
+    - 연속 장애가 failure_threshold에 도달하면 open: recovery_timeout 동안 즉시 실패
+    - 이후 half_open: 한 요청만 최소 탐침을 먼저 보내 성공하면 closed로 복귀
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self.probe_lock = asyncio.Lock()
+        self.stats = {"opened": 0, "rejected": 0, "probes": 0, "probe_failures": 0}
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.recovery_timeout:
+            return "open"
+        return "half_open"
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.opened_at is None and self.consecutive_failures >= self.failure_threshold:
+            self.trip()
+
+    def trip(self):
+        self.opened_at = time.monotonic()
+        self.stats["opened"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            **self.stats
+        }
+
+class DeadlineProvider(SummaryProvider):
+    """
+    응답이 멈춘 제공자를 기한 안에 끊는 래퍼 (504)
+
+    클라이언트 타임아웃(수 분)까지 워커를 붙잡지 않도록 첫 토큰, 청크 간 대기,
+    비스트리밍 전체 시간에 각각 기한을 둠. 승인 대기 시간은 포함하지 않도록
+    AdmittedProvider 안쪽에 둠
+    """
+
+    def __init__(
+        self,
+        provider: SummaryProvider,
+        first_token_timeout: float = 30.0,
+        idle_timeout: float = 30.0,
+        request_timeout: float = 180.0
+    ):
+        self.provider = provider
+        self.first_token_timeout = first_token_timeout
+        self.idle_timeout = idle_timeout
+        self.request_timeout = request_timeout
+        self.name = provider.name
+        self.model_name = provider.model_name
+        self.sampling_params = provider.sampling_params
+        self.timeouts = 0
+
+    @property
+    def is_available(self) -> bool:
+        return self.provider.is_available
+
+    def _timeout_error(self, timeout: float) -> ProviderError:
+        self.timeouts += 1
+        return ProviderError(f"{self.name} 응답 대기 시간 초과 ({timeout:.0f}초)", status_code=504)
+
+    async def summarize_japanese_to_korean(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        stream: bool = False,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        if stream:
+            return self.stream_summary(japanese_text, prompt_template, template_key, plan)
+
+        try:
+            return await asyncio.wait_for(
+                self.provider.summarize_japanese_to_korean(
+                    japanese_text,
+                    prompt_template,
+                    template_key=template_key,
+                    plan=plan
+                ),
+                timeout=self.request_timeout
+            )
+        except asyncio.TimeoutError:
+            error = self._timeout_error(self.request_timeout)
+            logger.warning(str(error))
+            return failure_result(japanese_text, error)
+
+    async def stream_summary(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        stream = self.provider.stream_summary(japanese_text, prompt_template, template_key, plan)
+        timeout = self.first_token_timeout
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(stream.__anext__(), timeout=timeout)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    raise self._timeout_error(timeout)
+                timeout = self.idle_timeout
+                yield chunk
+        finally:
+            await _close_quietly(stream)
+
+class ResilientProvider(SummaryProvider):
+    """
+    요약 제공자를 재시도/회로 차단으로 감싼 래퍼
+
+    - 일시적 오류는 재시도 예산 안에서 decorrelated jitter 백오프로 재시도 (Retry-After 준수)
+    - 스트리밍은 첫 토큰 전까지만 재시도 (이미 보낸 토큰을 중복 전송하지 않음)
+    - 회로가 열린 제공자는 is_available=False가 되어 라우터가 건너뜀
+
+    재시도마다 승인 제어를 다시 거치도록 AdmittedProvider 바깥에 둠
+    """
+
+    def __init__(
+        self,
+        provider: SummaryProvider,
+        breaker: CircuitBreaker,
+        budget: RetryBudget,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 20.0,
+        probe_timeout: float = 30.0
+    ):
+        self.provider = provider
+        self.breaker = breaker
+        self.budget = budget
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.probe_timeout = probe_timeout
+        self.name = provider.name
+        self.model_name = provider.model_name
+        self.sampling_params = provider.sampling_params
+        self.stats = {"retries": 0, "retry_budget_exhausted": 0}
+
+    @property
+    def is_available(self) -> bool:
+        return self.provider.is_available and self.breaker.state != "open"
+
+    @property
+    def admission(self):
+        # 라우터 통계에서 승인 제어 상태를 그대로 노출
+        return getattr(self.provider, "admission", None)
+
+    def _record_failure(self, status_code: Optional[int]):
+        # 429는 승인 제어가 다루므로 장애로 세지 않음
+        if status_code != 429:
+            self.breaker.record_failure()
+
+    async def _ensure_closed(self):
+        """
+        회로 상태 확인: open이면 즉시 실패, half_open이면 최소 탐침으로 복구 확인
+        """
+        if self.breaker.state == "closed":
+            return
+        if self.breaker.state == "open" or self.breaker.probing:
+            self.breaker.stats["rejected"] += 1
+            raise ProviderError(f"{self.name} 회로 차단 중 (장애 감지)", status_code=503)
+
+        async with self.breaker.probe_lock:
+            if self.breaker.state != "half_open":
+                return
+            self.breaker.probing = True
+            self.breaker.stats["probes"] += 1
+            try:
+                stream = self.provider.stream_summary(PROBE_TEXT, PROBE_TEMPLATE, None, probe_plan())
+                try:
+                    await asyncio.wait_for(stream.__anext__(), timeout=self.probe_timeout)
+                except StopAsyncIteration:
+                    pass
+                finally:
+                    await _close_quietly(stream)
+            except Exception as e:
+                self.breaker.stats["probe_failures"] += 1
+                self.breaker.trip()
+                logger.warning(f"{self.name} 회로 탐침 실패, 차단 유지: {str(e)}")
+                raise ProviderError(f"{self.name} 회로 차단 중 (탐침 실패)", status_code=503)
+            finally:
+                self.breaker.probing = False
+            self.breaker.record_success()
+            logger.info(f"{self.name} 회로 탐침 성공, 차단 해제")
+
+    def _next_delay(self, backoff: DecorrelatedJitterBackoff, attempt: int, retry_after: Optional[float]) -> Optional[float]:
+        """
+        다음 재시도까지 대기 시간 (재시도하지 않으면 None)
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if retry_after is not None and retry_after > self.backoff_cap:
+            # 한참 뒤에나 풀리는 한도면 기다리지 않고 라우터가 다른 제공자로 넘기게 함
+            return None
+        if not self.budget.withdraw():
+            self.stats["retry_budget_exhausted"] += 1
+            return None
+        self.stats["retries"] += 1
+        return backoff.next_delay(retry_after)
+
+    async def summarize_japanese_to_korean(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        stream: bool = False,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        if stream:
+            return self.stream_summary(japanese_text, prompt_template, template_key, plan)
+
+        self.budget.deposit()
+        backoff = DecorrelatedJitterBackoff(self.backoff_base, self.backoff_cap)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                await self._ensure_closed()
+            except ProviderError as e:
+                return failure_result(japanese_text, e)
+
+            result = await self.provider.summarize_japanese_to_korean(
+                japanese_text,
+                prompt_template,
+                template_key=template_key,
+                plan=plan
+            )
+            if result["success"]:
+                self.breaker.record_success()
+                return result
+            if not result.get("retryable"):
+                return result
+
+            self._record_failure(result.get("status_code"))
+            delay = self._next_delay(backoff, attempt, result.get("retry_after"))
+            if delay is None:
+                return result
+            logger.warning(f"{self.name} 요약 실패, {delay:.1f}초 후 재시도 ({attempt}/{self.max_attempts}): {result['error']}")
+            await asyncio.sleep(delay)
+
+    async def stream_summary(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        self.budget.deposit()
+        backoff = DecorrelatedJitterBackoff(self.backoff_base, self.backoff_cap)
+        attempt = 0
+        while True:
+            attempt += 1
+            await self._ensure_closed()
+            stream = self.provider.stream_summary(japanese_text, prompt_template, template_key, plan)
+            try:
+                first_chunk = await stream.__anext__()
+                break
+            except StopAsyncIteration:
+                first_chunk = None
+                break
+            except Exception as e:
+                await _close_quietly(stream)
+                if not is_retryable_error(e):
+                    raise
+                self._record_failure(provider_error_status(e))
+                delay = self._next_delay(backoff, attempt, provider_retry_after(e))
+                if delay is None:
+                    raise
+                logger.warning(f"{self.name} 스트리밍 시작 실패, {delay:.1f}초 후 재시도 ({attempt}/{self.max_attempts}): {str(e)}")
+                await asyncio.sleep(delay)
+
+        try:
+            if first_chunk is not None:
+                yield first_chunk
+                async for chunk in stream:
+                    yield chunk
+        except Exception as e:
+            if is_retryable_error(e):
+                self._record_failure(provider_error_status(e))
+            raise
+        finally:
+            await _close_quietly(stream)
+        self.breaker.record_success()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "circuit": self.breaker.get_stats(),
+            "retry_budget": round(self.budget.tokens, 2),
+            **self.stats
+        }
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class StreamBroadcast:
+    """
+    하나의 업스트림 스트림을 N명의 구독자에게 팬아웃
+
+    업스트림은 별도 태스크로 끝까지 소비되며, 생성된 청크를 보관하므로
+    늦게 합류한 구독자도 처음부터 동일한 청크를 받음
+    """
+
+    def __init__(self, source: AsyncIterator[Any]):
+        self._chunks: List[Any] = []
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._cond = asyncio.Condition()
+        self.subscribers = 0
+        self.task = asyncio.create_task(self._pump(source))
+
+    async def _pump(self, source: AsyncIterator[Any]):
+        try:
+            async for chunk in source:
+                async with self._cond:
+                    self._chunks.append(chunk)
+                    self._cond.notify_all()
+        except Exception as e:
+            self._error = e
+        finally:
+            async with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+    async def subscribe(self, start: int = 0) -> AsyncIterator[Any]:
+        """
+        start 번째 청크부터 구독
+        """
+        self.subscribers += 1
+        index = start
+        while True:
+            async with self._cond:
+                await self._cond.wait_for(lambda: len(self._chunks) > index or self._done)
+                batch = self._chunks[index:]
+                finished = self._done
+
+            for chunk in batch:
+                yield chunk
+            index += len(batch)
+
+            if finished and index >= len(self._chunks):
+                if self._error is not None:
+                    raise self._error
+                return
+
+class InFlightRegistry:
+    """
+    동일 키의 진행 중 생성 요청을 하나로 합치는 single-flight 레지스트리
+
+    키는 요약 캐시 키와 동일하게 사용 (원문/템플릿 버전/모델/샘플링 파라미터)
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self._streams: Dict[str, StreamBroadcast] = {}
+        self.stats = {"leaders": 0, "coalesced": 0, "stream_leaders": 0, "stream_coalesced": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키가 같은 호출이 진행 중이면 그 결과를 기다리고, 없으면 새로 실행
+
+        실제 호출은 태스크로 실행하므로 최초 요청자가 연결을 끊어도
+        나머지 대기자는 결과를 받음
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+            self.stats["leaders"] += 1
+        else:
+            self.stats["coalesced"] += 1
+            logger.info(f"진행 중인 요약 생성에 합류: {key[:12]}")
+
+        return await asyncio.shield(task)
+
+    def stream(
+        self,
+        key: str,
+        source_factory: Callable[[], AsyncIterator[Any]]
+    ) -> Tuple[AsyncIterator[Any], bool]:
+        """
+        진행 중인 업스트림 스트림에 구독자로 붙음 (없으면 새로 시작)
+
+        반환값: (구독 이터레이터, 새 업스트림을 시작했는지 여부)
+        """
+        broadcast = self._streams.get(key)
+        is_leader = broadcast is None
+        if is_leader:
+            broadcast = StreamBroadcast(source_factory())
+            self._streams[key] = broadcast
+            broadcast.task.add_done_callback(lambda _: self._streams.pop(key, None))
+            self.stats["stream_leaders"] += 1
+        else:
+            self.stats["stream_coalesced"] += 1
+            logger.info(f"진행 중인 스트리밍 요약에 합류: {key[:12]}")
+
+        return broadcast.subscribe(), is_leader
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            **self.stats,
+            "in_flight": len(self._calls),
+            "in_flight_streams": len(self._streams)
+        }
+
+# 프로세스 전체 공유 레지스트리
+summary_flights = InFlightRegistry()
@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+import json
+import time
+from typing import Any, AsyncIterator, List, Optional
+
+# 요약 스트리밍 SSE 프로토콜 버전 (meta 이벤트와 응답 헤더로 전달)
+PROTOCOL_VERSION = 2
+
+# 프록시가 SSE를 버퍼링/압축하지 않도록 하는 응답 헤더
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+    "X-Summary-Stream-Version": str(PROTOCOL_VERSION),
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Expose-Headers": "X-Summary-Stream-Version"
+}
+
+def sse_event(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    """
+    SSE 이벤트 1건 (data는 JSON)
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+class SummaryStreamEncoder:
+    """
+    요약 스트리밍 SSE 프로토콜 v2 인코더
+
+    이벤트 (data는 JSON, id는 지금까지 보낸 요약 글자 수 = 재개 지점)
+    - meta: 프로토콜 버전과 요약 메타데이터 (첫 이벤트)
+    - delta: {"text"} 새로 확정된 요약 조각만 전송 (누적 텍스트는 보내지 않음)
+    - checkpoint: {"offset", "sha256"} 일정 글자마다 지금까지 텍스트의 체크섬
+    - done: {"offset", "sha256", ...} 완료 (최종 요약 = delta 텍스트 합계)
+    - error: {"error"}
+    유휴 구간에는 프록시 유휴 타임아웃 방지용 주석(: ping)을 보냄
+    """
+
+    def __init__(
+        self,
+        coalesce_interval: float = 0.05,
+        heartbeat_interval: float = 15.0,
+        checkpoint_chars: int = 1000,
+        offset: int = 0
+    ):
+        self.coalesce_interval = coalesce_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.checkpoint_chars = checkpoint_chars
+        self.offset = offset
+        self._digest = hashlib.sha256()
+        self._next_checkpoint = offset + checkpoint_chars
+
+    @staticmethod
+    def _frame(event: str, data: dict, event_id: Optional[int] = None) -> str:
+        return sse_event(event, data, event_id)
+
+    @staticmethod
+    def heartbeat() -> str:
+        return ": ping\n\n"
+
+    def meta(self, **fields: Any) -> str:
+        return self._frame("meta", {"protocol": PROTOCOL_VERSION, **fields}, self.offset)
+
+    def checksum(self) -> str:
+        return self._digest.hexdigest()
+
+    def seed(self, text: str):
+        """
+        이미 클라이언트가 받은 앞부분을 체크섬에 반영 (재개 시)
+        """
+        self._digest.update(text.encode("utf-8"))
+
+    def delta(self, text: str) -> str:
+        self.offset += len(text)
+        self._digest.update(text.encode("utf-8"))
+        frame = self._frame("delta", {"text": text}, self.offset)
+        if self.offset >= self._next_checkpoint:
+            self._next_checkpoint = self.offset + self.checkpoint_chars
+            frame += self._frame("checkpoint", {"offset": self.offset, "sha256": self.checksum()}, self.offset)
+        return frame
+
+    def done(self, **fields: Any) -> str:
+        return self._frame("done", {"offset": self.offset, "sha256": self.checksum(), **fields}, self.offset)
+
+    def error(self, message: str) -> str:
+        return self._frame("error", {"error": message}, self.offset)
+
+    async def frames(self, deltas: AsyncIterator[str]) -> AsyncIterator[str]:
+        """
+        델타 스트림을 SSE 프레임으로 변환
+
+        coalesce_interval 안에 도착한 작은 델타는 리스트 버퍼에 모아 한 프레임으로 보내고,
+        heartbeat_interval 동안 보낼 것이 없으면 ping 주석을 보냄
+        """
+        buffer: List[str] = []
+        last_sent = time.monotonic()
+        window_started: Optional[float] = None
+        pending = asyncio.ensure_future(deltas.__anext__())
+        try:
+            while True:
+                now = time.monotonic()
+                if buffer:
+                    timeout = max(0.0, window_started + self.coalesce_interval - now)
+                else:
+                    timeout = max(0.0, last_sent + self.heartbeat_interval - now)
+
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if pending in done:
+                    try:
+                        text = pending.result()
+                    except StopAsyncIteration:
+                        break
+                    pending = asyncio.ensure_future(deltas.__anext__())
+                    if text:
+                        if not buffer:
+                            window_started = time.monotonic()
+                        buffer.append(text)
+                    # 델타가 쉬지 않고 들어와도 창 길이마다 내보냄
+                    if not buffer or time.monotonic() - window_started < self.coalesce_interval:
+                        continue
+
+                if buffer:
+                    yield self.delta("".join(buffer))
+                    buffer = []
+                else:
+                    yield self.heartbeat()
+                last_sent = time.monotonic()
+
+            if buffer:
+                yield self.delta("".join(buffer))
+        finally:
+            if not pending.done():
+                pending.cancel()
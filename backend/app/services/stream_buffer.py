@@ -0,0 +1,282 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from ..core.config import settings
+
+try:
+    import redis.asyncio as redis_async
+except ImportError:  # 공유 백엔드는 선택 사항 (redis 패키지 + STREAM_BUFFER_REDIS_URL)
+    redis_async = None
+
+logger = logging.getLogger(__name__)
+
+# 원격 스트림 XREAD 대기 시간 (밀리초)
+REMOTE_READ_BLOCK_MS = 5000
+
+class StreamBuffer:
+    """
+    생성 스트림 1건의 정리된 요약 델타 버퍼
+
+    업스트림 생성은 클라이언트 연결과 무관하게 끝까지 진행되고, 재접속한 클라이언트는
+    글자 오프셋(SSE 이벤트 id)부터 다시 읽음
+    """
+
+    def __init__(self, stream_id: str, meta: Dict[str, Any], ttl_seconds: float):
+        self.stream_id = stream_id
+        self.meta = meta
+        self.ttl_seconds = ttl_seconds
+        self.pieces: List[str] = []
+        self.length = 0
+        self.done = False
+        self.result: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self.expires_at = time.monotonic() + ttl_seconds
+        self._cond = asyncio.Condition()
+
+    @property
+    def expired(self) -> bool:
+        return self.done and time.monotonic() > self.expires_at
+
+    async def append(self, text: str):
+        async with self._cond:
+            self.pieces.append(text)
+            self.length += len(text)
+            self._cond.notify_all()
+
+    async def close(self, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        async with self._cond:
+            self.done = True
+            self.result = result or {}
+            self.error = error
+            self.expires_at = time.monotonic() + self.ttl_seconds
+            self._cond.notify_all()
+
+    async def prefix(self, offset: int) -> str:
+        """
+        클라이언트가 이미 받은 앞부분 (재개 시 체크섬 이어가기용)
+        """
+        return "".join(self.pieces)[:offset]
+
+    async def read(self, offset: int = 0) -> AsyncIterator[str]:
+        """
+        offset 글자 이후의 델타를 생성이 끝날 때까지 전달
+        """
+        index, position = 0, 0
+        while True:
+            async with self._cond:
+                await self._cond.wait_for(lambda: len(self.pieces) > index or self.done)
+                batch = self.pieces[index:]
+                finished = self.done
+
+            for piece in batch:
+                end = position + len(piece)
+                if end > offset:
+                    yield piece[max(0, offset - position):]
+                position = end
+            index += len(batch)
+
+            if finished and index >= len(self.pieces):
+                return
+
+class RedisStreamMirror:
+    """
+    스트림 버퍼의 공유 백엔드 (Redis Streams)
+
+    여러 워커 프로세스로 실행할 때 다른 프로세스에 재접속해도 이어 받을 수 있도록
+    델타를 XADD로 복제하고, 버퍼가 없는 프로세스는 XREAD로 따라 읽음
+    """
+
+    def __init__(self, url: str, ttl_seconds: float):
+        self.client = redis_async.from_url(url, decode_responses=True)
+        self.ttl = int(ttl_seconds)
+
+    @staticmethod
+    def _key(stream_id: str) -> str:
+        return f"summary-stream:{stream_id}"
+
+    async def open(self, stream_id: str, meta: Dict[str, Any]):
+        await self.client.set(f"{self._key(stream_id)}:meta", json.dumps(meta, ensure_ascii=False), ex=self.ttl)
+
+    async def append(self, stream_id: str, text: str):
+        key = self._key(stream_id)
+        await self.client.xadd(key, {"t": text})
+        await self.client.expire(key, self.ttl)
+
+    async def close(self, stream_id: str, result: Dict[str, Any], error: Optional[str]):
+        key = self._key(stream_id)
+        await self.client.xadd(key, {"done": json.dumps({"result": result, "error": error}, ensure_ascii=False)})
+        await self.client.expire(key, self.ttl)
+
+    async def load(self, stream_id: str) -> Optional["RemoteStreamBuffer"]:
+        meta = await self.client.get(f"{self._key(stream_id)}:meta")
+        if meta is None:
+            return None
+        return RemoteStreamBuffer(self, stream_id, json.loads(meta))
+
+class RemoteStreamBuffer:
+    """
+    다른 프로세스가 생성 중인 스트림을 Redis에서 따라 읽는 읽기 전용 버퍼
+    """
+
+    def __init__(self, mirror: RedisStreamMirror, stream_id: str, meta: Dict[str, Any]):
+        self.mirror = mirror
+        self.stream_id = stream_id
+        self.meta = meta
+        self.result: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+
+    async def prefix(self, offset: int) -> str:
+        entries = await self.mirror.client.xrange(self.mirror._key(self.stream_id))
+        return "".join(fields.get("t", "") for _, fields in entries)[:offset]
+
+    async def read(self, offset: int = 0) -> AsyncIterator[str]:
+        """
+        done 항목까지 따라 읽음
+
+        생성 프로세스가 done을 쓰기 전에 죽으면 항목이 더 오지 않으므로, 키 TTL 동안
+        새 항목이 없거나 스트림/메타 키가 모두 만료되면 오류로 끝냄 (재개한 SSE가 ping만 보내며 멈추지 않도록)
+        """
+        key = self.mirror._key(self.stream_id)
+        last_id, position = "0-0", 0
+        idle_since = time.monotonic()
+        while True:
+            response = await self.mirror.client.xread({key: last_id}, block=REMOTE_READ_BLOCK_MS)
+            if not response:
+                if time.monotonic() - idle_since >= self.mirror.ttl or not await self.mirror.client.exists(key, f"{key}:meta"):
+                    self.error = "요약 생성이 중단되었습니다. 요약을 다시 생성해주세요"
+                    logger.warning(f"원격 스트림 {self.stream_id[:8]} 생성 중단 감지 (완료 항목 없음)")
+                    return
+                continue
+            idle_since = time.monotonic()
+            for _, entries in response:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    if "done" in fields:
+                        done = json.loads(fields["done"])
+                        self.result = done["result"] or {}
+                        self.error = done["error"]
+                        return
+                    piece = fields["t"]
+                    end = position + len(piece)
+                    if end > offset:
+                        yield piece[max(0, offset - position):]
+                    position = end
+
+class StreamBufferRegistry:
+    """
+    스트림 id별 버퍼 레지스트리 (프로세스 내 + 선택적 Redis 공유 백엔드)
+
+    완료된 버퍼는 TTL 동안 보관해 늦은 재접속도 LLM 재호출 없이 이어 받게 함
+    """
+
+    def __init__(self, ttl_seconds: float, max_streams: int, redis_url: str = ""):
+        self.ttl_seconds = ttl_seconds
+        self.max_streams = max_streams
+        self._buffers: Dict[str, StreamBuffer] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.mirror: Optional[RedisStreamMirror] = None
+        self.stats = {"streams": 0, "resumes": 0, "remote_resumes": 0, "evicted": 0}
+
+        if redis_url and redis_async is not None:
+            self.mirror = RedisStreamMirror(redis_url, ttl_seconds)
+        elif redis_url:
+            logger.warning("redis 패키지가 없어 스트림 버퍼를 프로세스 내에서만 보관합니다")
+
+    def _evict(self):
+        for stream_id in [sid for sid, buffer in self._buffers.items() if buffer.expired]:
+            del self._buffers[stream_id]
+            self.stats["evicted"] += 1
+
+        # 한도 초과 시 완료된 오래된 버퍼부터 제거 (진행 중인 스트림은 유지)
+        overflow = len(self._buffers) - self.max_streams
+        if overflow > 0:
+            finished = sorted(
+                (buffer for buffer in self._buffers.values() if buffer.done),
+                key=lambda buffer: buffer.expires_at
+            )
+            for buffer in finished[:overflow]:
+                del self._buffers[buffer.stream_id]
+                self.stats["evicted"] += 1
+
+    def start(
+        self,
+        meta: Dict[str, Any],
+        deltas: AsyncIterator[str],
+        result: Callable[[], Dict[str, Any]]
+    ) -> StreamBuffer:
+        """
+        새 스트림 버퍼를 만들고 델타 소비 태스크 시작
+
+        result: 생성 완료 후 done 이벤트에 담을 필드를 돌려주는 함수
+        """
+        self._evict()
+        stream_id = uuid.uuid4().hex
+        buffer = StreamBuffer(stream_id, {**meta, "stream_id": stream_id}, self.ttl_seconds)
+        self._buffers[stream_id] = buffer
+        self._tasks[stream_id] = asyncio.create_task(self._pump(buffer, deltas, result))
+        self._tasks[stream_id].add_done_callback(lambda _: self._tasks.pop(stream_id, None))
+        self.stats["streams"] += 1
+        return buffer
+
+    async def _pump(self, buffer: StreamBuffer, deltas: AsyncIterator[str], result: Callable[[], Dict[str, Any]]):
+        mirror = self.mirror
+
+        async def replicate(method: str, *args) -> bool:
+            # 공유 백엔드 장애가 생성 자체를 실패시키지 않도록 해당 스트림의 복제만 중단
+            try:
+                await getattr(mirror, method)(buffer.stream_id, *args)
+                return True
+            except Exception as e:
+                logger.warning(f"스트림 버퍼 공유 백엔드 기록 실패: {str(e)}")
+                return False
+
+        if mirror and not await replicate("open", buffer.meta):
+            mirror = None
+        try:
+            async for text in deltas:
+                if not text:
+                    continue
+                await buffer.append(text)
+                if mirror and not await replicate("append", text):
+                    mirror = None
+            done, error = result(), None
+        except Exception as e:
+            logger.error(f"스트리밍 요약 생성 실패 ({buffer.stream_id[:8]}): {str(e)}")
+            done, error = {}, str(e)
+
+        await buffer.close(done, error)
+        if mirror:
+            await replicate("close", done, error)
+
+    async def get(self, stream_id: str):
+        """
+        재접속용 버퍼 조회 (프로세스 내에 없으면 공유 백엔드, 없거나 만료되면 None)
+        """
+        buffer = self._buffers.get(stream_id)
+        if buffer is not None and not buffer.expired:
+            self.stats["resumes"] += 1
+            return buffer
+        if self.mirror:
+            remote = await self.mirror.load(stream_id)
+            if remote is not None:
+                self.stats["remote_resumes"] += 1
+                return remote
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "buffered": len(self._buffers),
+            "generating": len(self._tasks),
+            "shared_backend": "redis" if self.mirror else None
+        }
+
+# 프로세스 전체 공유 레지스트리
+summary_streams = StreamBufferRegistry(
+    ttl_seconds=settings.STREAM_BUFFER_TTL_SECONDS,
+    max_streams=settings.STREAM_BUFFER_MAX_STREAMS,
+    redis_url=settings.STREAM_BUFFER_REDIS_URL
+)
@@ -0,0 +1,165 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..models import SummaryCacheEntry
+
+logger = logging.getLogger(__name__)
+
+def normalize_text(text: str) -> str:
+    """
+    캐시 키용 원문 정규화 (유니코드 NFC, 줄바꿈 통일, 줄 끝 공백 제거)
+    """
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.strip().split("\n"))
+
+def build_cache_key(
+    original_text: str,
+    template_id: Optional[int],
+    template_version: Optional[str],
+    model: str,
+    sampling_params: Dict[str, Any]
+) -> str:
+    """
+    원문/템플릿 id·버전/모델/샘플링 파라미터로 콘텐츠 주소 캐시 키 생성
+    """
+    payload = json.dumps(
+        {
+            "text": normalize_text(original_text),
+            "template_id": template_id,
+            "template_version": template_version,
+            "model": model,
+            "sampling": sampling_params
+        },
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class SummaryResultCache:
+    """
+    요약 결과 캐시
+
+    1계층: 프로세스 내 LRU + TTL
+    2계층: Postgres summary_cache 테이블 (재시작/다중 인스턴스 간 공유)
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int, persist: bool = True):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.persist = persist
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def get(self, key: str, db: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+        """
+        캐시 조회 (메모리 -> DB 순)
+        """
+        now = time.monotonic()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                expires_at, value = item
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._entries[key]
+
+        value = self._get_persistent(key, db) if self.persist and db is not None else None
+        if value is not None:
+            self._count("db_hits")
+            self._put_memory(key, value)
+            return value
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Dict[str, Any], db: Optional[Session] = None):
+        """
+        캐시 저장 (메모리 + DB)
+        """
+        self._put_memory(key, value)
+        self._count("stores")
+        if self.persist and db is not None:
+            self._set_persistent(key, value, db)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            memory_entries = len(self._entries)
+        hits = stats["memory_hits"] + stats["db_hits"]
+        lookups = hits + stats["misses"]
+        return {
+            **stats,
+            "hits": hits,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": memory_entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds
+        }
+
+    def _count(self, name: str):
+        # 스레드풀/워커 스레드에서 동시에 호출되므로 통계도 잠금 안에서 갱신
+        with self._lock:
+            self.stats[name] += 1
+
+    def _put_memory(self, key: str, value: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def _get_persistent(self, key: str, db: Session) -> Optional[Dict[str, Any]]:
+        try:
+            entry = db.query(SummaryCacheEntry).filter(SummaryCacheEntry.cache_key == key).first()
+            if not entry:
+                return None
+            if entry.expires_at and entry.expires_at <= datetime.now(timezone.utc):
+                db.delete(entry)
+                db.commit()
+                return None
+            entry.hit_count = (entry.hit_count or 0) + 1
+            db.commit()
+            return {"summary": entry.summary_text, "model_used": entry.model_used}
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"요약 캐시 DB 조회 실패: {str(e)}")
+            return None
+
+    def _set_persistent(self, key: str, value: Dict[str, Any], db: Session):
+        try:
+            db.merge(SummaryCacheEntry(
+                cache_key=key,
+                summary_text=value["summary"],
+                model_used=value.get("model_used"),
+                prompt_template_id=value.get("prompt_template_id"),
+                template_version=value.get("template_version"),
+                hit_count=0,
+                expires_at=datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"요약 캐시 DB 저장 실패: {str(e)}")
+
+# 프로세스 전체 공유 캐시
+summary_cache = SummaryResultCache(
+    max_entries=settings.SUMMARY_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SUMMARY_CACHE_TTL_SECONDS,
+    persist=settings.SUMMARY_CACHE_PERSIST
+)
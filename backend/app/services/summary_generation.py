@@ -0,0 +1,144 @@
+import logging
+from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
+from ..core.database import SessionLocal
+from ..models import ConsultationSummary, PromptTemplate
+from .summary_provider import SummaryProvider
+from .summary_cache import summary_cache, build_cache_key
+from .single_flight import summary_flights
+from .telemetry import start_trace, telemetry_store
+from .template_registry import template_registry, CachedTemplate
+from .language_detector import language_detector, LANGUAGE_KO, LANGUAGE_MIXED
+from .prompt_builder import DEFAULT_SOURCE_LANGUAGE
+from .procedure_matcher import procedure_matcher
+
+logger = logging.getLogger(__name__)
+
+# 요약 생성 공통 로직 (HTTP 핸들러와 요약 작업 워커가 함께 사용)
+
+def summary_cache_key(original_text: str, template: PromptTemplate, summary_service: SummaryProvider) -> str:
+    """원문/템플릿 버전/모델/샘플링 파라미터 기준 요약 캐시 키"""
+    return build_cache_key(
+        original_text,
+        template.id,
+        template.version,
+        summary_service.model_name,
+        summary_service.sampling_params
+    )
+
+def template_key(template: PromptTemplate) -> str:
+    """템플릿 버전별 프롬프트 캐시 통계 키"""
+    return f"{template.id}:{template.version}"
+
+def cache_value(summary_text: str, template: PromptTemplate, summary_service: SummaryProvider) -> dict:
+    return {
+        "summary": summary_text,
+        "model_used": summary_service.model_name,
+        "prompt_template_id": template.id,
+        "template_version": template.version
+    }
+
+# 판정 언어별 템플릿 원문 언어 후보 (앞에서부터, 없으면 기본 일본어 번역 요약 템플릿)
+# 혼합 상담 전용 고정 프롬프트는 없으므로 한국어 요약 전용 템플릿으로 보냄
+LANGUAGE_TEMPLATE_CANDIDATES = {
+    LANGUAGE_KO: (LANGUAGE_KO,),
+    LANGUAGE_MIXED: (LANGUAGE_KO,),
+}
+
+def find_template(
+    db: Session,
+    template_id: Optional[int] = None,
+    active_only: bool = True,
+    source_language: Optional[str] = None
+) -> Optional[CachedTemplate]:
+    """지정한 활성 템플릿, 없으면 원문 언어별 가장 최근 활성 템플릿 (레지스트리 캐시에서 조회)"""
+    return template_registry.get(db, template_id, active_only=active_only, source_language=source_language)
+
+def route_template(
+    db: Session,
+    text: str,
+    template_id: Optional[int] = None,
+    active_only: bool = True
+) -> Tuple[Optional[CachedTemplate], dict]:
+    """
+    녹취록 언어 판정 후 템플릿 선택, (템플릿, 판정 결과) 반환
+
+    템플릿을 지정하지 않으면 한국어/혼합 상담은 요약 전용(source_language=ko) 템플릿으로 보내고,
+    해당 언어 템플릿이 없으면 기본 번역 요약 템플릿 사용. 지정한 템플릿은 그대로 사용
+    """
+    detection = language_detector.detect(text)
+    template = None
+    if template_id is not None:
+        template = find_template(db, template_id, active_only=active_only)
+    else:
+        for language in LANGUAGE_TEMPLATE_CANDIDATES.get(detection["language"], ()):
+            template = find_template(db, source_language=language)
+            if template:
+                break
+        template = template or find_template(db, source_language=DEFAULT_SOURCE_LANGUAGE)
+    return template, detection
+
+async def generate_cached_summary(
+    original_text: str,
+    template: PromptTemplate,
+    summary_service: SummaryProvider,
+    cache_key: str,
+    plan: Optional[dict] = None,
+    preprocessing: Optional[dict] = None,
+    language: Optional[str] = None
+) -> dict:
+    """
+    동일 키의 진행 중 생성에 합류하거나 새로 생성 후 캐시에 저장
+
+    original_text는 전처리된 녹취록, preprocessing은 transcript_preprocessor 보고서 (계측에 절감 토큰 기록),
+    language는 녹취록 언어 판정 결과 (언어 경로별 계측).
+    생성은 요청과 분리돼 먼저 요청한 쪽이 끊겨도 계속되므로 계측/캐시 저장은 별도 세션 사용
+    """
+    async def generate_and_cache():
+        tokens_saved = preprocessing.get("tokens_saved") if preprocessing else None
+        trace = start_trace(
+            template.id, template.version, streamed=False,
+            preprocess_tokens_saved=tokens_saved, language=language
+        )
+        result = await summary_service.summarize_japanese_to_korean(
+            japanese_text=original_text,
+            prompt_template=template.template_text,
+            template_key=template_key(template),
+            plan=plan
+        )
+        trace.finish(result["success"], result.get("tokens_used"), result.get("error"))
+        db = SessionLocal()
+        try:
+            row = telemetry_store.record(trace, db)
+            result["telemetry"] = {"id": row.id if row else None, **trace.metrics()}
+            if result["success"]:
+                summary_cache.set(cache_key, cache_value(result["summary"], template, summary_service), db)
+        finally:
+            db.close()
+        return result
+
+    return await summary_flights.do(cache_key, generate_and_cache)
+
+def discussed_procedures(db: Session, procedures_discussed: Optional[List[int]], *texts: Optional[str]) -> Optional[List[int]]:
+    """
+    직접 지정한 시술 목록이 있으면 그대로, 없으면 원문/요약에서 언급된 시술 ID 자동 추출
+
+    추출 실패가 요약 저장을 막지 않도록 로그만 남기고 None
+    """
+    if procedures_discussed is not None:
+        return procedures_discussed
+    try:
+        return procedure_matcher.match(db, *texts)
+    except Exception as e:
+        logger.warning(f"시술 언급 추출 실패: {str(e)}")
+        return None
+
+def attach_telemetry(db_summary: ConsultationSummary, telemetry_id: Optional[int], db: Session):
+    """저장된 상담 요약에 생성 계측 연결 (요약 행에도 지표 복사)"""
+    if not telemetry_id:
+        return
+    metrics = telemetry_store.attach(telemetry_id, db_summary.id, db)
+    if metrics:
+        db_summary.generation_metrics = metrics
+        db.commit()
+        db.refresh(db_summary)
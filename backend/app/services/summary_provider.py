@@ -0,0 +1,144 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, AsyncIterator
+from .markdown_cleaner import clean_markdown
+
+class ProviderError(Exception):
+    """
+    요약 제공자 호출 오류
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+class ProviderRateLimitError(ProviderError):
+    """
+    요약 제공자 요청 한도 초과 (HTTP 429)
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message, status_code=429, retry_after=retry_after)
+
+def provider_error_status(error: BaseException) -> Optional[int]:
+    """
+    제공자 예외에서 HTTP 상태 코드 추출 (OpenAI: status_code, Google API: code)
+    """
+    status = getattr(error, "status_code", None)
+    if status is None:
+        code = getattr(error, "code", None)
+        status = code if isinstance(code, int) else None
+    return status
+
+def provider_retry_after(error: BaseException) -> Optional[float]:
+    """
+    제공자 예외에서 Retry-After(초) 추출
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        return float(retry_after)
+
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        value = headers.get("retry-after-ms")
+        if value:
+            try:
+                return float(value) / 1000
+            except ValueError:
+                pass
+        value = headers.get("retry-after")
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+# 재시도하면 성공할 수 있는 상태 코드 (타임아웃, 충돌, 요청 한도, 서버 오류)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    일시적 오류인지 여부 (상태 코드가 없으면 연결/타임아웃 오류로 보고 재시도,
+    입력 오류(ValueError 등)와 설정 오류(RuntimeError)는 제외)
+    """
+    status = provider_error_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+    return not isinstance(error, (ValueError, TypeError, RuntimeError))
+
+def failure_result(japanese_text: str, error: BaseException) -> Dict[str, Any]:
+    """
+    실패 응답 dict (상위 계층의 재시도/승인 제어가 쓸 상태 코드 포함)
+    """
+    return {
+        "success": False,
+        "error": str(error),
+        "status_code": provider_error_status(error),
+        "retry_after": provider_retry_after(error),
+        "retryable": is_retryable_error(error),
+        "original_text": japanese_text
+    }
+
+class SummaryProvider(ABC):
+    """
+    요약 제공자 공통 인터페이스
+
+    스트리밍 청크는 제공자와 무관하게 다음 형식으로 정규화
+    - {"type": "content", "content": str}
+    - {"type": "usage", "usage": {"prompt_tokens", "completion_tokens", "total_tokens", "cached_tokens"}}
+    """
+
+    name: str = ""
+    model_name: str = ""
+    sampling_params: Dict[str, Any] = {}
+
+    @property
+    def is_available(self) -> bool:
+        """
+        실제 API 호출이 가능한지 여부 (라우터가 장애 조치 대상 선정에 사용)
+        """
+        return bool(getattr(self, "use_real_api", False))
+
+    @abstractmethod
+    async def summarize_japanese_to_korean(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        stream: bool = False,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        일본어 상담 내용을 한국어로 요약 (stream=True면 정규화된 청크 제너레이터 반환)
+        """
+
+    async def stream_summary(
+        self,
+        japanese_text: str,
+        prompt_template: str,
+        template_key: Optional[str] = None,
+        plan: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        정규화된 청크 스트림 (기본 구현: 전체 응답을 한 청크로 전달)
+        """
+        result = await self.summarize_japanese_to_korean(
+            japanese_text,
+            prompt_template,
+            template_key=template_key,
+            plan=plan
+        )
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+
+        yield {"type": "content", "content": result["summary"]}
+        if result.get("tokens_used"):
+            yield {"type": "usage", "usage": result["tokens_used"]}
+
+    def _clean_markdown(self, text: str) -> str:
+        """
+        마크다운 기호 제거 및 텍스트 정리 (스트리밍 정리기와 같은 결과)
+        """
+        return clean_markdown(text)
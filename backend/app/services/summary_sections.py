@@ -0,0 +1,87 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+# 상담 요약 템플릿의 7개 항목 (키, 제목, 제목 판정 키워드)
+SUMMARY_SECTIONS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("customer_info", "고객 정보 요약", ("고객 정보",)),
+    ("attitude", "고객 성격 및 상담 태도", ("성격", "태도")),
+    ("procedures", "관심 시술 및 실제 제안 시술", ("관심 시술", "제안 시술")),
+    ("decisions", "상담 결과 및 결정 사항", ("결정 사항", "상담 결과")),
+    ("next_steps", "다음 상담 시 참고사항", ("다음 상담", "참고사항")),
+    ("quotes", "고객 워딩 및 인상적인 피드백", ("워딩", "피드백")),
+    ("communication", "상담자 전달력 및 커뮤니케이션 평가", ("전달력", "커뮤니케이션", "상담자 평가")),
+)
+SECTION_KEYS = tuple(key for key, _, _ in SUMMARY_SECTIONS)
+SECTION_TITLES = {key: title for key, title, _ in SUMMARY_SECTIONS}
+
+# 제목 줄: "## 1. 고객 정보 요약", "1) 고객 정보 요약 (150자 이내)", "🧑 고객 정보 요약"
+HEADER_PATTERN = re.compile(r'^#{0,6}\s*(?:(\d)\s*[.)]\s*)?(?:[^\w\s(\[]+\s*)?(?P<title>\S.{0,40})$')
+
+def _section_index(line: str) -> Optional[int]:
+    """
+    제목 줄이면 항목 번호(0부터), 아니면 None
+
+    번호가 붙은 줄은 번호와 키워드가 모두 맞아야 하고, 번호 없는 줄은 콜론이 없는 짧은 줄만 인정
+    (본문의 "1. 이마 보톡스", "상담자가 제안한 시술:" 같은 줄 제외)
+    """
+    match = HEADER_PATTERN.match(line.strip())
+    if not match:
+        return None
+    number, title = match.group(1), match.group("title")
+    if title[0] in "-•*" or (number is None and ":" in title):
+        return None
+    for index, (_, _, keywords) in enumerate(SUMMARY_SECTIONS):
+        if any(keyword in title for keyword in keywords):
+            if number is not None and int(number) != index + 1:
+                return None
+            return index
+    return None
+
+class SectionParser:
+    """
+    요약 텍스트를 7개 항목별 본문으로 나누는 줄 단위 파서
+
+    스트리밍 델타를 feed()로 받아 완성된 줄만 처리하므로 전체 요약을 다시 훑지 않음.
+    항목은 순서대로만 넘어감 (본문 안에서 앞 항목 키워드가 다시 나와도 제목으로 보지 않음)
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._current: Optional[int] = None
+        self._lines: Dict[int, List[str]] = {}
+
+    def _line(self, line: str):
+        index = _section_index(line)
+        if index is not None and (self._current is None or index > self._current):
+            self._current = index
+            self._lines[index] = []
+        elif self._current is not None:
+            self._lines[self._current].append(line)
+
+    def feed(self, delta: str):
+        self._buffer += delta
+        if "\n" not in delta:
+            return
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._line(line)
+
+    def finish(self) -> Dict[str, str]:
+        """
+        항목 키 → 본문 (제목이 없던 항목은 빠짐, 제목 앞 텍스트는 버림)
+        """
+        if self._buffer:
+            self._line(self._buffer)
+            self._buffer = ""
+        return {
+            SUMMARY_SECTIONS[index][0]: "\n".join(self._lines[index]).strip()
+            for index in sorted(self._lines)
+        }
+
+def parse_sections(text: Optional[str]) -> Dict[str, str]:
+    """
+    완성된 요약 텍스트를 항목별로 분리
+    """
+    parser = SectionParser()
+    parser.feed(text or "")
+    return parser.finish()
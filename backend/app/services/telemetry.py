@@ -0,0 +1,247 @@
+import logging
+import time
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, List
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from ..models import SummaryTelemetry
+
+logger = logging.getLogger(__name__)
+
+# 모델별 단가 (USD / 100만 토큰: 입력, 캐시된 입력, 출력). 목록에 없는 모델은 비용 미기록
+MODEL_PRICING = {
+    "gpt-4.1-mini-2025-04-14": (0.40, 0.10, 1.60),
+    "gemini-1.5-pro": (1.25, 0.3125, 5.00),
+}
+
+# 집계 대상 지표 (SummaryTelemetry 컬럼명)
+AGGREGATE_METRICS = ("queue_wait_ms", "ttft_ms", "total_ms", "output_tokens_per_sec")
+
+class GenerationTrace:
+    """
+    요약 생성 1건의 계측 기록
+
+    라우트에서 시작해 ContextVar로 전달되며, 승인 제어(대기 시간)와
+    라우터(채택 제공자/모델)가 같은 객체에 기록함
+    """
+
+    def __init__(
+        self,
+        prompt_template_id: Optional[int],
+        template_version: Optional[str],
+        streamed: bool,
+        preprocess_tokens_saved: Optional[int] = None,
+        language: Optional[str] = None
+    ):
+        self.prompt_template_id = prompt_template_id
+        self.template_version = template_version
+        self.streamed = streamed
+        self.preprocess_tokens_saved = preprocess_tokens_saved
+        self.language = language
+        self.started = time.monotonic()
+        self.first_token_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.queue_waits: Dict[str, float] = {}
+        self.provider: Optional[str] = None
+        self.model: Optional[str] = None
+        self.usage: Dict[str, int] = {}
+        self.success = False
+        self.error: Optional[str] = None
+
+    def record_queue_wait(self, provider: str, wait: float):
+        # 재시도마다 승인 대기를 다시 거치므로 누적
+        self.queue_waits[provider] = self.queue_waits.get(provider, 0.0) + wait
+
+    def mark_first_token(self):
+        if self.first_token_at is None:
+            self.first_token_at = time.monotonic()
+
+    def finish(self, success: bool, usage: Optional[Dict[str, int]] = None, error: Optional[str] = None):
+        self.finished_at = time.monotonic()
+        self.success = success
+        self.usage = usage or {}
+        self.error = error
+
+    @staticmethod
+    def _ms(seconds: Optional[float]) -> Optional[float]:
+        return round(seconds * 1000, 1) if seconds is not None else None
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        저장/응답용 지표 dict
+        """
+        finished = self.finished_at or time.monotonic()
+        completion_tokens = self.usage.get("completion_tokens")
+        queue_wait = self.queue_waits.get(self.provider) if self.provider else None
+
+        # 출력 속도는 첫 토큰 이후 구간 기준 (첫 토큰 시간이 없으면 전체 시간 기준)
+        generation_time = finished - (self.first_token_at or self.started)
+        tokens_per_sec = None
+        if completion_tokens and generation_time > 0:
+            tokens_per_sec = round(completion_tokens / generation_time, 2)
+
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "language": self.language,
+            "streamed": self.streamed,
+            "success": self.success,
+            "queue_wait_ms": self._ms(queue_wait),
+            "ttft_ms": self._ms(self.first_token_at - self.started) if self.first_token_at else None,
+            "total_ms": self._ms(finished - self.started),
+            "output_tokens_per_sec": tokens_per_sec,
+            "prompt_tokens": self.usage.get("prompt_tokens"),
+            "cached_tokens": self.usage.get("cached_tokens"),
+            "completion_tokens": completion_tokens,
+            "cost_usd": estimate_cost(self.model, self.usage),
+            "preprocess_tokens_saved": self.preprocess_tokens_saved
+        }
+
+current_trace: ContextVar[Optional[GenerationTrace]] = ContextVar("current_trace", default=None)
+
+def start_trace(
+    prompt_template_id: Optional[int],
+    template_version: Optional[str],
+    streamed: bool,
+    preprocess_tokens_saved: Optional[int] = None,
+    language: Optional[str] = None
+) -> GenerationTrace:
+    """
+    현재 컨텍스트(태스크)에 새 계측 기록 시작
+
+    preprocess_tokens_saved: 녹취록 전처리로 줄인 예상 토큰 수, language: 녹취록 언어 판정 결과 (ja / ko / mixed)
+    """
+    trace = GenerationTrace(prompt_template_id, template_version, streamed, preprocess_tokens_saved, language)
+    current_trace.set(trace)
+    return trace
+
+def record_queue_wait(provider: str, wait: float):
+    trace = current_trace.get()
+    if trace is not None:
+        trace.record_queue_wait(provider, wait)
+
+def record_provider(provider: str, model: str):
+    trace = current_trace.get()
+    if trace is not None:
+        trace.provider = provider
+        trace.model = model
+
+def mark_first_token():
+    trace = current_trace.get()
+    if trace is not None:
+        trace.mark_first_token()
+
+def estimate_cost(model: Optional[str], usage: Dict[str, int]) -> Optional[float]:
+    """
+    토큰 사용량 기준 예상 비용 (USD)
+    """
+    pricing = MODEL_PRICING.get(model or "")
+    if pricing is None or not usage:
+        return None
+    input_price, cached_price, output_price = pricing
+    cached = usage.get("cached_tokens") or 0
+    uncached = max(0, (usage.get("prompt_tokens") or 0) - cached)
+    cost = (uncached * input_price + cached * cached_price + (usage.get("completion_tokens") or 0) * output_price) / 1_000_000
+    return round(cost, 6)
+
+class TelemetryStore:
+    """
+    계측 기록 저장 및 템플릿 버전/모델별 지연시간 분위수 집계
+    """
+
+    def record(self, trace: GenerationTrace, db: Session, summary_id: Optional[int] = None) -> Optional[SummaryTelemetry]:
+        """
+        계측 기록 저장 (저장 실패가 요약 응답을 막지 않도록 로그만 남김)
+        """
+        metrics = trace.metrics()
+        try:
+            row = SummaryTelemetry(
+                summary_id=summary_id,
+                prompt_template_id=trace.prompt_template_id,
+                template_version=trace.template_version,
+                error=trace.error[:500] if trace.error else None,
+                **metrics
+            )
+            db.add(row)
+            db.commit()
+            db.refresh(row)
+            return row
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"요약 계측 기록 저장 실패: {str(e)}")
+            return None
+
+    def attach(self, telemetry_id: int, summary_id: int, db: Session) -> Optional[Dict[str, Any]]:
+        """
+        생성 후 따로 저장된 상담 요약에 계측 기록 연결, 요약 행에 복사할 지표 반환
+        """
+        row = db.query(SummaryTelemetry).filter(SummaryTelemetry.id == telemetry_id).first()
+        if not row:
+            return None
+        row.summary_id = summary_id
+        return {column: getattr(row, column) for column in (
+            "provider", "model", "language", "queue_wait_ms", "ttft_ms", "total_ms", "output_tokens_per_sec",
+            "prompt_tokens", "cached_tokens", "completion_tokens", "cost_usd", "preprocess_tokens_saved"
+        )}
+
+    def aggregate(self, db: Session, days: int = 7, streamed: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        템플릿 버전 x 모델 x 언어 경로별 p50/p95/p99 (PostgreSQL percentile_cont)
+        """
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        percentiles = []
+        for metric in AGGREGATE_METRICS:
+            column = getattr(SummaryTelemetry, metric)
+            for p in (50, 95, 99):
+                percentiles.append(func.percentile_cont(p / 100).within_group(column).label(f"{metric}_p{p}"))
+
+        query = db.query(
+            SummaryTelemetry.prompt_template_id,
+            SummaryTelemetry.template_version,
+            SummaryTelemetry.model,
+            SummaryTelemetry.language,
+            func.count(SummaryTelemetry.id).label("count"),
+            func.sum(SummaryTelemetry.prompt_tokens).label("prompt_tokens"),
+            func.sum(SummaryTelemetry.completion_tokens).label("completion_tokens"),
+            func.sum(SummaryTelemetry.cost_usd).label("cost_usd"),
+            func.sum(SummaryTelemetry.preprocess_tokens_saved).label("preprocess_tokens_saved"),
+            *percentiles
+        ).filter(
+            SummaryTelemetry.created_at >= since,
+            SummaryTelemetry.success == True
+        )
+        if streamed is not None:
+            query = query.filter(SummaryTelemetry.streamed == streamed)
+
+        rows = query.group_by(
+            SummaryTelemetry.prompt_template_id,
+            SummaryTelemetry.template_version,
+            SummaryTelemetry.model,
+            SummaryTelemetry.language
+        ).order_by(SummaryTelemetry.prompt_template_id, SummaryTelemetry.template_version).all()
+
+        def rounded(value):
+            return round(float(value), 1) if value is not None else None
+
+        return [
+            {
+                "prompt_template_id": row.prompt_template_id,
+                "template_version": row.template_version,
+                "model": row.model,
+                "language": row.language,
+                "count": row.count,
+                "prompt_tokens": row.prompt_tokens,
+                "completion_tokens": row.completion_tokens,
+                "cost_usd": round(float(row.cost_usd), 4) if row.cost_usd is not None else None,
+                "preprocess_tokens_saved": row.preprocess_tokens_saved,
+                **{
+                    metric: {f"p{p}": rounded(getattr(row, f"{metric}_p{p}")) for p in (50, 95, 99)}
+                    for metric in AGGREGATE_METRICS
+                }
+            }
+            for row in rows
+        ]
+
+# 프로세스 전체 공유 저장소
+telemetry_store = TelemetryStore()
@@ -0,0 +1,201 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..models import PromptTemplate
+from .prompt_builder import prompt_builder, TemplateCompileError, DEFAULT_SOURCE_LANGUAGE
+from .token_estimator import token_estimator
+
+logger = logging.getLogger(__name__)
+
+class CachedTemplate:
+    """
+    세션과 분리된 프롬프트 템플릿 스냅샷 (PromptTemplate 컬럼 + 컴파일된 렌더링 계획)
+
+    잘못된 템플릿이면 TemplateCompileError
+    """
+
+    def __init__(self, row: PromptTemplate, fingerprint: Tuple):
+        for column in PromptTemplate.__table__.columns:
+            setattr(self, column.name, getattr(row, column.name))
+        self.source_language = row.source_language or DEFAULT_SOURCE_LANGUAGE
+        self.fingerprint = fingerprint
+        self.compiled = prompt_builder.compile(row.template_text, self.source_language)
+        token_estimator.measure(self.compiled)
+
+class TemplateRegistry:
+    """
+    프롬프트 템플릿 레지스트리 캐시
+
+    - 활성 템플릿 전체를 시작 시 메모리에 적재하고 조회는 메모리에서 처리
+    - 비활성(과거 버전) 템플릿은 id로 조회된 것만 크기 제한 LRU에 보관
+    - refresh_interval마다 (id, version, is_active, md5(본문)) 지문만 조회해 바뀐 템플릿만 다시 읽음
+      (본문은 전송하지 않음, update_prompt_*.py 같은 외부 프로세스의 변경도 반영)
+    - 같은 프로세스에서 PromptTemplate을 쓰면 ORM 이벤트로 즉시 무효화
+    - 적재 시 템플릿을 컴파일하고, 컴파일에 실패한 버전은 제공하지 않음 (이전 정상 버전 유지)
+    - 기본 템플릿은 원문 언어(source_language)별로 따로 둠 (한국어 상담용 요약 전용 템플릿 등)
+    """
+
+    def __init__(self, refresh_interval: float, max_inactive: int):
+        self.refresh_interval = refresh_interval
+        self.max_inactive = max_inactive
+        self._active: Dict[int, CachedTemplate] = {}
+        self._inactive: "OrderedDict[int, CachedTemplate]" = OrderedDict()
+        self._rejected: Dict[int, Tuple] = {}  # 컴파일 실패한 (id → 지문), 같은 버전은 다시 읽지 않음
+        self._default_ids: Dict[str, int] = {}  # 원문 언어 → 기본 템플릿 id
+        self._checked_at = 0.0
+        self._stale = True
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "checks": 0, "reloads": 0, "rejected": 0, "evictions": 0}
+
+    def invalidate(self):
+        """
+        다음 조회 때 지문 확인 강제 (템플릿 생성/수정/삭제 시)
+        """
+        self._stale = True
+
+    def load(self, db: Session):
+        """
+        활성 템플릿 적재 (앱 시작 시)
+        """
+        with self._lock:
+            self._refresh(db)
+        logger.info(f"프롬프트 템플릿 레지스트리 적재: 활성 {len(self._active)}개")
+
+    def get(
+        self,
+        db: Session,
+        template_id: Optional[int] = None,
+        active_only: bool = True,
+        source_language: Optional[str] = None
+    ) -> Optional[CachedTemplate]:
+        """
+        템플릿 조회 (template_id가 없으면 source_language의 가장 최근 활성 템플릿, 기본 언어는 ja)
+
+        active_only=False면 비활성 템플릿도 id로 조회 (저장된 요약의 템플릿 확인용)
+        """
+        with self._lock:
+            if self._stale or time.monotonic() - self._checked_at >= self.refresh_interval:
+                self._refresh(db)
+
+            if template_id is None:
+                default_id = self._default_ids.get(source_language or DEFAULT_SOURCE_LANGUAGE)
+                template = self._active.get(default_id) if default_id is not None else None
+            else:
+                template = self._active.get(template_id)
+                if template is None and not active_only:
+                    template = self._get_inactive(db, template_id)
+
+            self.stats["hits" if template is not None else "misses"] += 1
+            return template
+
+    def _get_inactive(self, db: Session, template_id: int) -> Optional[CachedTemplate]:
+        template = self._inactive.get(template_id)
+        if template is not None:
+            self._inactive.move_to_end(template_id)
+            return template
+
+        row = db.query(PromptTemplate).filter(PromptTemplate.id == template_id).first()
+        if row is None:
+            return None
+        try:
+            template = self._snapshot(db, row)
+        except TemplateCompileError as e:
+            logger.error(f"프롬프트 템플릿 {template_id} 컴파일 실패: {str(e)}")
+            return None
+        self._inactive[template_id] = template
+        while len(self._inactive) > self.max_inactive:
+            self._inactive.popitem(last=False)
+            self.stats["evictions"] += 1
+        return template
+
+    @staticmethod
+    def _fingerprint_query(db: Session):
+        return db.query(
+            PromptTemplate.id,
+            PromptTemplate.version,
+            PromptTemplate.is_active,
+            func.md5(PromptTemplate.template_text),
+            PromptTemplate.created_at,
+            PromptTemplate.source_language
+        )
+
+    def _snapshot(self, db: Session, row: PromptTemplate) -> CachedTemplate:
+        fingerprint = self._fingerprint_query(db).filter(PromptTemplate.id == row.id).first()
+        return CachedTemplate(row, tuple(fingerprint))
+
+    def _refresh(self, db: Session):
+        """
+        지문 비교 후 새로 생기거나 바뀐 템플릿만 본문까지 다시 읽음
+        """
+        self.stats["checks"] += 1
+        self._stale = False
+        self._checked_at = time.monotonic()
+
+        query = self._fingerprint_query(db)
+        if self._inactive:
+            query = query.filter((PromptTemplate.is_active == True) | PromptTemplate.id.in_(list(self._inactive)))
+        else:
+            query = query.filter(PromptTemplate.is_active == True)
+        fingerprints = {row[0]: tuple(row) for row in query.all()}
+
+        # 지문이 바뀐 과거 버전은 버림 (다시 조회되면 새로 읽음)
+        for template_id in list(self._inactive):
+            if fingerprints.get(template_id) != self._inactive[template_id].fingerprint:
+                del self._inactive[template_id]
+
+        active = {template_id: fp for template_id, fp in fingerprints.items() if fp[2]}
+        changed = [
+            template_id for template_id, fp in active.items()
+            if self._rejected.get(template_id) != fp
+            and (template_id not in self._active or self._active[template_id].fingerprint != fp)
+        ]
+        if changed:
+            rows = db.query(PromptTemplate).filter(PromptTemplate.id.in_(changed)).all()
+            for row in rows:
+                try:
+                    self._active[row.id] = CachedTemplate(row, active[row.id])
+                    self._rejected.pop(row.id, None)
+                except TemplateCompileError as e:
+                    # 잘못된 버전은 트래픽에 쓰지 않음 (이전에 적재된 정상 버전이 있으면 유지)
+                    self._rejected[row.id] = active[row.id]
+                    self.stats["rejected"] += 1
+                    logger.error(f"프롬프트 템플릿 {row.id} (v{row.version}) 컴파일 실패, 제공하지 않음: {str(e)}")
+            self.stats["reloads"] += len(rows)
+            logger.info(f"프롬프트 템플릿 다시 적재: {sorted(changed)}")
+
+        for template_id in [tid for tid in self._active if tid not in active]:
+            del self._active[template_id]
+        # 기본 템플릿 = 원문 언어별로 가장 최근에 만든 활성 템플릿
+        defaults: Dict[str, int] = {}
+        for template_id, template in self._active.items():
+            created_at = active[template_id][4]
+            current = defaults.get(template.source_language)
+            if current is None or (created_at is not None, created_at) > (
+                active[current][4] is not None, active[current][4]
+            ):
+                defaults[template.source_language] = template_id
+        self._default_ids = defaults
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "active": len(self._active),
+            "inactive_cached": len(self._inactive),
+            "rejected_ids": sorted(self._rejected),
+            "default_template_ids": dict(self._default_ids)
+        }
+
+# 프로세스 전체 공유 레지스트리
+template_registry = TemplateRegistry(
+    refresh_interval=settings.TEMPLATE_CACHE_REFRESH_SECONDS,
+    max_inactive=settings.TEMPLATE_CACHE_MAX_INACTIVE
+)
+
+# 같은 프로세스의 템플릿 쓰기는 즉시 무효화
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(PromptTemplate, _event, lambda mapper, connection, target: template_registry.invalidate())
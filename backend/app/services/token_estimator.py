@@ -0,0 +1,153 @@
+import logging
+import re
+import threading
+from typing import Dict, Any, Iterable, Optional
+import numpy as np
+import pandas as pd
+from ..core.config import settings
+from .prompt_builder import prompt_builder, CompiledTemplate
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+except ImportError:  # 토크나이저 미설치 시 문자 종류 기반 추정으로 대체
+    tiktoken = None
+
+# gpt-4.1 계열 토크나이저 (처음 쓸 때 내려받으므로 배포 이미지는 TIKTOKEN_CACHE_DIR에 미리 받아 둠)
+TOKENIZER_ENCODING = "o200k_base"
+
+# 토크나이저를 쓸 수 없을 때의 문자 종류별 평균 토큰 수 (o200k_base 기준 실측 근사값)
+CHAR_CLASS_TOKEN_RATES = {
+    "cjk": (r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uff66-\uff9f]', 0.9),  # 가나/한자
+    "hangul": (r'[\uac00-\ud7af\u1100-\u11ff\u3130-\u318f]', 0.8),
+    "ascii_word": (r'[A-Za-z0-9]', 0.25),
+    "whitespace": (r'\s', 0.1),
+}
+OTHER_CHAR_TOKEN_RATE = 0.6  # 문장부호, 기호, 이모지 등
+
+# 요약 출력 토큰 한도 범위
+MIN_OUTPUT_TOKENS = 1500
+MAX_OUTPUT_TOKENS = 4000
+
+class TokenEstimator:
+    """
+    제공자 호출 전에 사용하는 로컬 토큰 수 추정기
+
+    tiktoken이 있으면 실제 토크나이저를, 없으면 문자 종류 비율 기반 추정을 사용.
+    토크나이저는 첫 추정 때 한 번만 로드하고, 실패하면 경고 후 문자 기반 추정으로 고정.
+    estimate_batch는 수천 건의 원문을 한 번에 계산하도록 벡터화되어 있음
+    """
+
+    def __init__(self):
+        self._encoding = None
+        self._encoding_loaded = False
+        self._encoding_lock = threading.Lock()
+        self._class_patterns = [(re.compile(pattern), rate) for pattern, rate in CHAR_CLASS_TOKEN_RATES.values()]
+
+    def _encoder(self):
+        if not self._encoding_loaded:
+            with self._encoding_lock:
+                if not self._encoding_loaded:
+                    self._encoding = self._load_encoding()
+                    self._encoding_loaded = True
+        return self._encoding
+
+    @staticmethod
+    def _load_encoding():
+        # 대체 추정은 요청 크기 판정(413)과 출력 한도가 환경마다 달라지므로 반드시 경고
+        if tiktoken is None:
+            logger.warning("tiktoken이 설치되지 않아 문자 기반 토큰 추정을 사용합니다 (근사값)")
+            return None
+        try:
+            return tiktoken.get_encoding(TOKENIZER_ENCODING)
+        except Exception as e:
+            logger.warning(
+                f"토크나이저 {TOKENIZER_ENCODING} 로드 실패, 문자 기반 토큰 추정을 사용합니다 "
+                f"(오프라인 환경은 TIKTOKEN_CACHE_DIR에 미리 받아 두세요): {str(e)}"
+            )
+            return None
+
+    @property
+    def method(self) -> str:
+        return "tiktoken" if self._encoder() is not None else "char-class"
+
+    def estimate(self, text: str) -> int:
+        """
+        단일 텍스트의 토큰 수 추정
+        """
+        if not text:
+            return 0
+        encoding = self._encoder()
+        if encoding is not None:
+            return len(encoding.encode_ordinary(text))
+
+        counted = 0
+        tokens = 0.0
+        for pattern, rate in self._class_patterns:
+            count = len(pattern.findall(text))
+            counted += count
+            tokens += count * rate
+        tokens += (len(text) - counted) * OTHER_CHAR_TOKEN_RATE
+        return int(np.ceil(tokens))
+
+    def estimate_batch(self, texts: Iterable[Optional[str]]) -> np.ndarray:
+        """
+        여러 텍스트의 토큰 수를 한 번에 추정 (용량 계획용)
+        """
+        series = pd.Series(list(texts), dtype="object").fillna("").astype(str)
+        if series.empty:
+            return np.zeros(0, dtype=np.int64)
+
+        encoding = self._encoder()
+        if encoding is not None:
+            encoded = encoding.encode_ordinary_batch(series.tolist())
+            return np.fromiter((len(tokens) for tokens in encoded), dtype=np.int64, count=len(encoded))
+
+        lengths = series.str.len().to_numpy(dtype=np.float64)
+        counted = np.zeros(len(series), dtype=np.float64)
+        tokens = np.zeros(len(series), dtype=np.float64)
+        for pattern, rate in CHAR_CLASS_TOKEN_RATES.values():
+            counts = series.str.count(pattern).to_numpy(dtype=np.float64)
+            counted += counts
+            tokens += counts * rate
+        tokens += (lengths - counted) * OTHER_CHAR_TOKEN_RATE
+        return np.ceil(tokens).astype(np.int64)
+
+    def measure(self, compiled: CompiledTemplate) -> int:
+        """
+        컴파일된 템플릿 고정부(시스템 프롬프트 + 사용자 접두어) 토큰 수 (한 번만 측정해 기록)
+        """
+        if compiled.static_tokens is None:
+            compiled.static_tokens = self.estimate(compiled.system_content) + self.estimate(compiled.user_prefix)
+        return compiled.static_tokens
+
+    def plan(self, transcript: str, template_text: str, source_language: Optional[str] = None) -> Dict[str, Any]:
+        """
+        요약 요청 사전 예산 계획
+
+        반환: 예상 프롬프트 토큰, 출력 max_tokens, 처리 모드(single / map_reduce), 허용 여부,
+        원문 언어(제공자가 언어별 고정 프롬프트를 고르는 데 사용)
+        """
+        compiled = prompt_builder.compile(template_text, source_language)
+        template_tokens = self.measure(compiled)
+        transcript_tokens = self.estimate(transcript)
+        prompt_tokens = template_tokens + transcript_tokens
+
+        # 긴 입력일수록 요약도 길어지므로 입력 크기에 비례해 출력 한도를 조정
+        max_tokens = int(np.clip(MIN_OUTPUT_TOKENS + transcript_tokens // 10, MIN_OUTPUT_TOKENS, MAX_OUTPUT_TOKENS))
+
+        return {
+            "prompt_tokens": prompt_tokens,
+            "template_tokens": template_tokens,
+            "transcript_tokens": transcript_tokens,
+            "max_tokens": max_tokens,
+            "mode": "map_reduce" if transcript_tokens > settings.LONG_TRANSCRIPT_THRESHOLD_TOKENS else "single",
+            "fits": transcript_tokens <= settings.MAX_TRANSCRIPT_TOKENS,
+            "limit_tokens": settings.MAX_TRANSCRIPT_TOKENS,
+            "source_language": compiled.source_language,
+            "method": self.method
+        }
+
+# 프로세스 전체 공유 인스턴스
+token_estimator = TokenEstimator()
@@ -0,0 +1,66 @@
+import re
+from typing import List
+
+# 화자 전환으로 보는 줄 시작 패턴 (예: "A:", "話者1：", "お客様:", "[相談員]")
+SPEAKER_TURN_PATTERN = re.compile(
+    r'^\s*(?:\[[^\]\n]{1,20}\]|[^\s:：\n]{1,12}\s*[:：])'
+)
+
+# 문장 경계 (일본어/영문 종결 부호 뒤)
+SENTENCE_END_PATTERN = re.compile(r'(?<=[。！？!?])')
+
+def split_turns(text: str) -> List[str]:
+    """
+    화자 전환 기준으로 발화 단위 분리
+    """
+    turns: List[str] = []
+    current: List[str] = []
+    for line in text.replace("\r\n", "\n").split("\n"):
+        if current and (not line.strip() or SPEAKER_TURN_PATTERN.match(line)):
+            turns.append("\n".join(current))
+            current = []
+        if line.strip():
+            current.append(line)
+    if current:
+        turns.append("\n".join(current))
+    return turns
+
+def split_sentences(text: str, max_chars: int) -> List[str]:
+    """
+    너무 긴 발화를 문장 경계 기준으로 분리 (문장 자체가 길면 고정 길이로 자름)
+    """
+    pieces: List[str] = []
+    for sentence in SENTENCE_END_PATTERN.split(text):
+        if not sentence:
+            continue
+        while len(sentence) > max_chars:
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        pieces.append(sentence)
+    return pieces
+
+def split_transcript(text: str, max_chars: int) -> List[str]:
+    """
+    녹취록을 max_chars 이하 청크로 분할
+
+    화자 전환 경계를 우선하고, 한 발화가 max_chars를 넘으면 문장 경계로 나눔
+    """
+    units: List[str] = []
+    for turn in split_turns(text):
+        if len(turn) <= max_chars:
+            units.append(turn)
+        else:
+            units.extend(split_sentences(turn, max_chars))
+
+    chunks: List[str] = []
+    current = ""
+    for unit in units:
+        candidate = f"{current}\n{unit}" if current else unit
+        if len(candidate) > max_chars and current:
+            chunks.append(current)
+            current = unit
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
@@ -0,0 +1,163 @@
+import logging
+import re
+import unicodedata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..core.config import settings
+from .token_estimator import token_estimator
+
+logger = logging.getLogger(__name__)
+
+# SRT 자막 시간 구간 줄 (예: 00:00:01,000 --> 00:00:04,000)
+SRT_RANGE_LINE = re.compile(r'^\s*\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d{1,3})?\s*-->\s*\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d{1,3})?\s*$')
+SRT_INDEX_LINE = re.compile(r'^\s*\d+\s*$')
+
+# 괄호로 감싼 타임스탬프 (예: [00:12:34], (12:34), 【00:12】) 와 줄 머리 타임스탬프
+BRACKETED_TIMESTAMP = re.compile(r'[\[(【〔]\s*\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d{1,3})?\s*[\])】〕]\s*')
+LEADING_TIMESTAMP = re.compile(r'^(\s*)\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d{1,3})?\s+', re.MULTILINE)
+
+# 화자 라벨 (예: "話者1:", "お客様 :", "[相談員]") - NFKC 후라 콜론은 반각
+COLON_LABEL = re.compile(r'^\s*([^\s:\n\[\]]{1,12})\s*:\s*')
+BRACKET_LABEL = re.compile(r'^\s*(\[[^\]\n]{1,20}\])\s*')
+
+# 일본어 필러 (뒤에 쉼표/공백/말줄임이 오거나 장음으로 늘인 경우만, "あの店"의 あの 같은 지시어는 유지)
+FILLER_PATTERN = re.compile(
+    r'(?<![\wー])'
+    r'(?:えー+っ?と|ええと|えっと|えー+|あのー+|そのー+|うーん|んー+|'
+    r'(?:あの|その|まあ|なんか|えと)(?=[、,\s…]))'
+    r'[ー~、,\s…・]*'
+)
+
+# 같은 구절 반복 (받아쓰기 엔진이 같은 말을 수십 번 반복하는 경우), 줄바꿈은 넘지 않음
+LOOP_PATTERN_TEMPLATE = r'([^\n]{{1,40}}?)(?:[、, \t]*\1){{{repeats},}}'
+
+MULTI_SPACE = re.compile(r'[ \t]+')
+EXTRA_BLANK_LINES = re.compile(r'\n{3,}')
+
+DEFAULT_STEPS = ("nfkc", "timestamps", "labels", "fillers", "loops")
+
+class TranscriptPreprocessor:
+    """
+    녹취록 전처리 (요약 제공자 호출 전, 토큰 절감)
+
+    단계 (TRANSCRIPT_PREPROCESS_STEPS로 선택, 순서는 고정)
+    - nfkc: 전각 영숫자/기호, 반각 가나 등 NFKC 폭 정규화
+    - timestamps: SRT 번호/시간 구간 줄, [00:12:34] 같은 타임스탬프 제거
+    - labels: 같은 화자가 연속하면 반복되는 라벨 제거 (화자가 바뀔 때만 라벨 유지)
+    - fillers: えー, あのー, えっと 같은 필러 제거
+    - loops: 같은 구절이 loop_min_repeats번 이상 연속 반복되면 한 번으로 축약
+    원문(original_text)은 그대로 저장하고, 전처리 결과는 프롬프트와 요약 캐시 키에만 사용
+    """
+
+    def __init__(self, steps: Optional[List[str]] = None, loop_min_repeats: int = 4):
+        steps = list(DEFAULT_STEPS if steps is None else steps)
+        unknown = [step for step in steps if step not in DEFAULT_STEPS]
+        if unknown:
+            logger.warning(f"알 수 없는 녹취록 전처리 단계 무시: {unknown}")
+        self.steps = [step for step in DEFAULT_STEPS if step in steps]
+        self.loop_min_repeats = max(2, loop_min_repeats)
+        self._loop_pattern = re.compile(LOOP_PATTERN_TEMPLATE.format(repeats=self.loop_min_repeats - 1))
+        self._handlers: Dict[str, Callable[[str], str]] = {
+            "nfkc": self._nfkc,
+            "timestamps": self._timestamps,
+            "labels": self._labels,
+            "fillers": self._fillers,
+            "loops": self._loops,
+        }
+
+    @staticmethod
+    def _nfkc(text: str) -> str:
+        return unicodedata.normalize("NFKC", text).replace("\r\n", "\n").replace("\r", "\n")
+
+    @staticmethod
+    def _timestamps(text: str) -> str:
+        lines = text.split("\n")
+        kept: List[str] = []
+        for index, line in enumerate(lines):
+            if SRT_RANGE_LINE.match(line):
+                continue
+            # 다음 줄이 시간 구간이면 SRT 번호 줄
+            if SRT_INDEX_LINE.match(line) and index + 1 < len(lines) and SRT_RANGE_LINE.match(lines[index + 1]):
+                continue
+            kept.append(line)
+        text = "\n".join(kept)
+        text = BRACKETED_TIMESTAMP.sub("", text)
+        return LEADING_TIMESTAMP.sub(r"\1", text)
+
+    @staticmethod
+    def _labels(text: str) -> str:
+        previous = None
+        lines: List[str] = []
+        for line in text.split("\n"):
+            if not line.strip():
+                # 빈 줄은 화자 구분을 끊지 않음
+                lines.append(line)
+                continue
+            match = BRACKET_LABEL.match(line) or COLON_LABEL.match(line)
+            if match is None:
+                lines.append(line)
+                continue
+            label, body = match.group(1), line[match.end():]
+            if label == previous:
+                lines.append(body)
+            else:
+                separator = " " if label.startswith("[") else ": "
+                lines.append(f"{label}{separator}{body}")
+                previous = label
+        return "\n".join(lines)
+
+    @staticmethod
+    def _fillers(text: str) -> str:
+        return FILLER_PATTERN.sub("", text)
+
+    def _loops(self, text: str) -> str:
+        def collapse(match: re.Match) -> str:
+            phrase = match.group(1)
+            # 숫자/영문 반복(1000, www 등)과 공백만 있는 구절은 그대로
+            if not phrase.strip() or phrase.isascii() and phrase.isalnum():
+                return match.group(0)
+            return phrase
+        return self._loop_pattern.sub(collapse, text)
+
+    @staticmethod
+    def _tidy(text: str) -> str:
+        text = "\n".join(MULTI_SPACE.sub(" ", line).strip() for line in text.split("\n"))
+        return EXTRA_BLANK_LINES.sub("\n\n", text).strip()
+
+    def process(self, text: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        (전처리된 녹취록, 보고서) 반환
+
+        보고서: 적용 단계, 단계별 제거 글자 수, 전후 글자/예상 토큰 수, 절감 토큰 수
+        """
+        if not self.steps:
+            tokens = token_estimator.estimate(text)
+            return text, {
+                "steps": [], "removed_chars": {}, "original_chars": len(text), "chars": len(text),
+                "original_tokens": tokens, "tokens": tokens, "tokens_saved": 0
+            }
+
+        removed: Dict[str, int] = {}
+        processed = text
+        for step in self.steps:
+            before = len(processed)
+            processed = self._handlers[step](processed)
+            removed[step] = before - len(processed)
+        processed = self._tidy(processed)
+
+        original_tokens = token_estimator.estimate(text)
+        tokens = token_estimator.estimate(processed)
+        return processed, {
+            "steps": self.steps,
+            "removed_chars": removed,
+            "original_chars": len(text),
+            "chars": len(processed),
+            "original_tokens": original_tokens,
+            "tokens": tokens,
+            "tokens_saved": max(0, original_tokens - tokens)
+        }
+
+# 프로세스 전체 공유 인스턴스
+transcript_preprocessor = TranscriptPreprocessor(
+    steps=[step.strip() for step in settings.TRANSCRIPT_PREPROCESS_STEPS.split(",") if step.strip()],
+    loop_min_repeats=settings.TRANSCRIPT_LOOP_MIN_REPEATS
+)
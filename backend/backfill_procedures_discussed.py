@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+기존 상담 요약의 procedures_discussed 일괄 채우기
+
+시술 카탈로그로 매처를 한 번 구축한 뒤 상담 요약 전체를 id 순서로 한 번만 훑으며
+원문과 요약에서 언급된 시술 ID를 추출해 배치 단위로 저장
+
+사용법:
+    python backfill_procedures_discussed.py              # 비어 있는 요약만 채움
+    python backfill_procedures_discussed.py --overwrite  # 이미 채워진 요약도 다시 추출
+    python backfill_procedures_discussed.py --dry-run    # 저장하지 않고 결과만 집계
+"""
+import sys
+import os
+import argparse
+import time
+from collections import Counter
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.models import ConsultationSummary, Procedure
+from app.services.procedure_matcher import ProcedureMatcher
+
+# 데이터베이스 설정
+engine = create_engine(settings.DATABASE_URL)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def backfill(args):
+    session = SessionLocal()
+    try:
+        procedures = session.query(Procedure).filter(Procedure.is_active == True).order_by(Procedure.procedure_number).all()
+        names = {procedure.id: procedure.korean_name for procedure in procedures}
+        automaton, name_count = ProcedureMatcher.build_automaton(procedures)
+        print(f"🔤 매처 구축: 시술 {len(procedures)}개, 이름 {name_count}개, 노드 {automaton.size}개")
+
+        scanned = updated = chars = 0
+        mentions = Counter()
+        last_id = 0
+        started = time.monotonic()
+
+        while True:
+            rows = session.query(
+                ConsultationSummary.id,
+                ConsultationSummary.original_text,
+                ConsultationSummary.summary_text,
+                ConsultationSummary.procedures_discussed
+            ).filter(ConsultationSummary.id > last_id).order_by(ConsultationSummary.id).limit(args.batch_size).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            changes = []
+            for row in rows:
+                scanned += 1
+                if row.procedures_discussed and not args.overwrite:
+                    continue
+                found = []
+                for text in (row.original_text, row.summary_text):
+                    if not text:
+                        continue
+                    chars += len(text)
+                    for procedure_id in ProcedureMatcher.find(automaton, text):
+                        if procedure_id not in found:
+                            found.append(procedure_id)
+                mentions.update(found)
+                if found != (row.procedures_discussed or []):
+                    changes.append({"id": row.id, "procedures_discussed": found})
+
+            if changes and not args.dry_run:
+                session.bulk_update_mappings(ConsultationSummary, changes)
+                session.commit()
+            updated += len(changes)
+            print(f"   ~ID {last_id}: {scanned}건 확인, {updated}건 변경")
+
+        elapsed = time.monotonic() - started
+        print(f"✅ 완료: {scanned}건 중 {updated}건 {'변경 예정 (dry-run)' if args.dry_run else '변경'}, "
+              f"{chars:,} 글자, {elapsed:.1f}초 ({chars / max(elapsed, 1e-9) / 1_000_000:.1f}M 글자/초)")
+        for procedure_id, count in mentions.most_common():
+            print(f"   {names.get(procedure_id, procedure_id)}: {count}건")
+
+    except Exception as e:
+        session.rollback()
+        print(f"❌ 오류 발생: {str(e)}")
+        raise
+    finally:
+        session.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기존 상담 요약의 논의 시술 일괄 채우기")
+    parser.add_argument("--batch-size", type=int, default=500, help="한 번에 읽고 저장할 요약 수")
+    parser.add_argument("--overwrite", action="store_true", help="이미 채워진 요약도 다시 추출")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 결과만 집계")
+    backfill(parser.parse_args())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+스트리밍 마크다운 정리기 vs 기존 정규식 정리 벤치마크
+
+- 완성본 1회 정리: 정규식 8단계 vs 단일 패스 상태 기계
+- 스트리밍 중 정리: 매 청크마다 누적 텍스트 전체를 정규식으로 다시 정리(O(n^2)) vs 델타만 처리
+- 청크 분할을 바꿔도 스트리밍 결과가 완성본 정리와 같은지 검증
+"""
+import sys
+import os
+import argparse
+import random
+import timeit
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.markdown_cleaner import StreamingMarkdownCleaner, clean_markdown, clean_markdown_regex
+from app.services.fake_provider import FAKE_SUMMARY, TOKEN_SPLIT_PATTERN
+
+def stream_incremental(chunks):
+    cleaner = StreamingMarkdownCleaner()
+    for chunk in chunks:
+        cleaner.feed(chunk)
+    cleaner.finish()
+    return cleaner.text
+
+def stream_regex(chunks):
+    accumulated = ""
+    cleaned = ""
+    for chunk in chunks:
+        accumulated += chunk
+        cleaned = clean_markdown_regex(accumulated)
+    return cleaned
+
+def random_chunks(text, rng):
+    chunks, index = [], 0
+    while index < len(text):
+        size = rng.randint(1, 8)
+        chunks.append(text[index:index + size])
+        index += size
+    return chunks
+
+def main(args):
+    text = "\n\n".join([FAKE_SUMMARY] * args.repeat)
+    chunks = TOKEN_SPLIT_PATTERN.findall(text)
+    print(f"📄 입력: {len(text):,} 글자, 청크 {len(chunks):,}개 (요약 {args.repeat}개 분량)")
+
+    # 결과 검증
+    rng = random.Random(args.seed)
+    expected = clean_markdown(text)
+    for _ in range(args.trials):
+        assert stream_incremental(random_chunks(text, rng)) == expected, "청크 분할에 따라 결과가 달라짐"
+    print(f"✅ 무작위 청크 분할 {args.trials}회: 스트리밍 결과 = 완성본 정리 결과")
+    print(f"   정규식 결과와 일치: {'예' if expected == clean_markdown_regex(text) else '아니오 (수평선 *** 등 경계 사례 차이)'}")
+
+    # 완성본 1회 정리
+    number = args.number
+    regex_full = timeit.timeit(lambda: clean_markdown_regex(text), number=number) / number
+    machine_full = timeit.timeit(lambda: clean_markdown(text), number=number) / number
+    print("⏱  완성본 1회 정리")
+    print(f"   정규식 8단계: {regex_full * 1000:.3f} ms")
+    print(f"   상태 기계:    {machine_full * 1000:.3f} ms")
+
+    # 스트리밍 중 정리 (청크마다 화면용 정리 텍스트 갱신)
+    stream_number = max(1, number // 20)
+    regex_stream = timeit.timeit(lambda: stream_regex(chunks), number=stream_number) / stream_number
+    machine_stream = timeit.timeit(lambda: stream_incremental(chunks), number=stream_number) / stream_number
+    print("⏱  스트리밍 중 정리 (청크마다)")
+    print(f"   정규식 누적 재정리: {regex_stream * 1000:.3f} ms")
+    print(f"   상태 기계 델타:     {machine_stream * 1000:.3f} ms ({regex_stream / machine_stream:.1f}배)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="마크다운 정리기 벤치마크")
+    parser.add_argument("--repeat", type=int, default=1, help="요약 본문 반복 횟수 (긴 요약 모의)")
+    parser.add_argument("--number", type=int, default=200, help="측정 반복 횟수")
+    parser.add_argument("--trials", type=int, default=200, help="무작위 청크 분할 검증 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    main(parser.parse_args())
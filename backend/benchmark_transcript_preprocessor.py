@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+녹취록 전처리 벤치마크 (요약 전 토큰 절감량)
+
+- --corpus 디렉터리의 .txt 녹취록(없으면 받아쓰기 잡음을 넣은 합성 녹취록)을 전처리
+- 단계별 제거 글자 수, 전후 예상 토큰 수, 절감률, 처리 속도 출력
+- 단계를 하나씩 끈 결과와 비교해 단계별 기여도 확인
+
+사용법:
+    python benchmark_transcript_preprocessor.py --corpus ./transcripts
+    python benchmark_transcript_preprocessor.py --count 50 --seed 1
+"""
+import sys
+import os
+import argparse
+import glob
+import random
+import timeit
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.transcript_preprocessor import TranscriptPreprocessor, DEFAULT_STEPS
+from app.services.token_estimator import token_estimator
+
+SPEAKERS = ["相談員", "お客様"]
+FILLERS = ["えー、", "あのー、", "えっと、", "まあ、", "うーん、", ""]
+SENTENCES = [
+    "ほうれい線が気になっていて、ヒアルロン酸を考えています。",
+    "ダウンタイムはどのくらいありますか。",
+    "ボトックスは３～６ヶ月ほど効果が持続します。",
+    "料金は１回あたり５５，０００円になります。",
+    "痛みが心配なので麻酔クリームを使えますか。",
+    "ＨＩＦＵとサーマクールの違いを教えてください。",
+    "前回の施術から２ヶ月経っています。",
+    "腫れは２、３日で落ち着くことが多いです。",
+]
+
+def synthetic_transcript(rng: random.Random, turns: int) -> str:
+    """SRT 번호/타임스탬프, 전각 문자, 반복 라벨, 필러, 받아쓰기 반복 구간을 넣은 합성 녹취록"""
+    lines = []
+    seconds = 0
+    speaker = rng.choice(SPEAKERS)
+    for index in range(1, turns + 1):
+        if rng.random() < 0.3:
+            speaker = rng.choice(SPEAKERS)
+        start, seconds = seconds, seconds + rng.randint(2, 9)
+        sentence = rng.choice(FILLERS) + rng.choice(SENTENCES)
+        if rng.random() < 0.05:
+            # 받아쓰기 엔진의 반복 구간
+            sentence = "はい、" * rng.randint(5, 20) + sentence
+        if rng.random() < 0.5:
+            lines.append(str(index))
+            lines.append(f"00:{start // 60:02d}:{start % 60:02d},000 --> 00:{seconds // 60:02d}:{seconds % 60:02d},000")
+            lines.append(f"{speaker}：{sentence}")
+            lines.append("")
+        else:
+            lines.append(f"[00:{start // 60:02d}:{start % 60:02d}] {speaker}：{sentence}")
+    return "\n".join(lines)
+
+def load_corpus(args):
+    if args.corpus:
+        paths = sorted(glob.glob(os.path.join(args.corpus, "*.txt")))
+        if not paths:
+            sys.exit(f"❌ {args.corpus}에 .txt 녹취록이 없습니다")
+        texts = []
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                texts.append(f.read())
+        return texts, f"{args.corpus} ({len(paths)}개)"
+    rng = random.Random(args.seed)
+    return [synthetic_transcript(rng, args.turns) for _ in range(args.count)], f"합성 녹취록 {args.count}개"
+
+def main(args):
+    texts, source = load_corpus(args)
+    original_chars = sum(len(text) for text in texts)
+    original_tokens = sum(token_estimator.estimate(text) for text in texts)
+    print(f"📄 입력: {source}, {original_chars:,} 글자, 약 {original_tokens:,} 토큰")
+
+    preprocessor = TranscriptPreprocessor(loop_min_repeats=args.loop_min_repeats)
+    removed = {step: 0 for step in preprocessor.steps}
+    tokens = 0
+    for text in texts:
+        _, report = preprocessor.process(text)
+        tokens += report["tokens"]
+        for step, count in report["removed_chars"].items():
+            removed[step] += count
+
+    saved = original_tokens - tokens
+    print(f"✂️  전체 단계: 약 {tokens:,} 토큰 (절감 {saved:,} 토큰, {saved / max(1, original_tokens) * 100:.1f}%)")
+    for step, count in removed.items():
+        print(f"   {step:<10} 제거 {count:,} 글자")
+
+    # 단계를 하나씩 뺐을 때 늘어나는 토큰 = 해당 단계 기여분
+    print("🔍 단계별 기여 (해당 단계만 끈 경우 늘어나는 토큰)")
+    for step in DEFAULT_STEPS:
+        without = TranscriptPreprocessor([s for s in DEFAULT_STEPS if s != step], args.loop_min_repeats)
+        step_tokens = sum(without.process(text)[1]["tokens"] for text in texts)
+        print(f"   {step:<10} +{step_tokens - tokens:,} 토큰")
+
+    number = args.number
+    elapsed = timeit.timeit(lambda: [preprocessor.process(text) for text in texts], number=number) / number
+    print(f"⏱  처리 속도: 코퍼스 1회 {elapsed * 1000:.2f} ms ({original_chars / max(elapsed, 1e-9) / 1_000_000:.1f}M 글자/초)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="녹취록 전처리 벤치마크")
+    parser.add_argument("--corpus", default=None, help="녹취록 .txt 파일 디렉터리 (없으면 합성 녹취록)")
+    parser.add_argument("--count", type=int, default=20, help="합성 녹취록 수")
+    parser.add_argument("--turns", type=int, default=300, help="합성 녹취록 발화 수")
+    parser.add_argument("--loop-min-repeats", type=int, default=4, help="반복 구간으로 볼 최소 반복 횟수")
+    parser.add_argument("--number", type=int, default=20, help="속도 측정 반복 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    main(parser.parse_args())
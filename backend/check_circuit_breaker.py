@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+회로 차단기 복구 점검 (실제 API 호출 없음)
+
+가짜 제공자를 실제 제공자처럼 템플릿을 컴파일하도록 감싼 뒤
+    1. 반열림 상태의 탐침이 성공하면 회로가 닫히는지
+    2. 제공자가 계속 실패하면 탐침 실패 후 회로가 다시 열리는지
+확인. 원문 언어 등 계획 키도 실제 제공자처럼 읽으므로 탐침 계획이 계획기 형식과 어긋나면 실패
+
+사용법:
+    python check_circuit_breaker.py
+"""
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.fake_provider import FakeSummaryProvider
+from app.services.prompt_builder import prompt_builder
+from app.services.token_estimator import token_estimator
+from app.services.resilience import CircuitBreaker, ResilientProvider, RetryBudget, PROBE_TEMPLATE
+
+SAMPLE_TEXT = "お客様：おでこのしわが気になっていて、ボトックスについて聞きたいです。"
+SAMPLE_TEMPLATE = "다음 상담 내용을 한국어로 요약하세요.\n\n{input_text}"
+
+class CompilingFakeProvider(FakeSummaryProvider):
+    """
+    실제 제공자처럼 요청마다 계획의 원문 언어로 템플릿을 컴파일하는 가짜 제공자
+    (잘못된 템플릿이나 계획 키가 빠지면 예외)
+    """
+
+    async def stream_summary(self, japanese_text, prompt_template, template_key=None, plan=None):
+        prompt_builder.build_messages(prompt_template, japanese_text, source_language=plan["source_language"])
+        async for chunk in super().stream_summary(japanese_text, prompt_template, template_key, plan):
+            yield chunk
+
+def build(error_rate: float) -> ResilientProvider:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+    return ResilientProvider(
+        CompilingFakeProvider(profile="instant", error_rate=error_rate),
+        breaker,
+        RetryBudget(),
+        max_attempts=1
+    )
+
+def half_open(provider: ResilientProvider):
+    """회로를 연 뒤 복구 대기 시간이 지난 것처럼 되돌림"""
+    provider.breaker.trip()
+    provider.breaker.opened_at -= provider.breaker.recovery_timeout
+    assert provider.breaker.state == "half_open", provider.breaker.state
+
+async def check():
+    prompt_builder.compile(PROBE_TEMPLATE)
+    print("✅ 탐침 템플릿 컴파일")
+
+    plan = token_estimator.plan(SAMPLE_TEXT, SAMPLE_TEMPLATE)
+
+    healthy = build(error_rate=0.0)
+    half_open(healthy)
+    result = await healthy.summarize_japanese_to_korean(SAMPLE_TEXT, SAMPLE_TEMPLATE, plan=plan)
+    assert result["success"], result
+    assert healthy.breaker.state == "closed", healthy.breaker.get_stats()
+    assert healthy.breaker.stats["probe_failures"] == 0, healthy.breaker.get_stats()
+    print(f"✅ 탐침 성공 후 회로 닫힘: {healthy.breaker.get_stats()}")
+
+    failing = build(error_rate=1.0)
+    half_open(failing)
+    result = await failing.summarize_japanese_to_korean(SAMPLE_TEXT, SAMPLE_TEMPLATE, plan=plan)
+    assert not result["success"] and result.get("status_code") == 503, result
+    assert failing.breaker.state == "open", failing.breaker.get_stats()
+    print(f"✅ 탐침 실패 후 회로 다시 열림: {failing.breaker.get_stats()}")
+
+if __name__ == "__main__":
+    asyncio.run(check())
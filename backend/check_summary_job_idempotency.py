@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+요약 작업 중복 저장 점검 (DATABASE_URL의 데이터베이스 사용, 실제 API 호출 없음)
+
+가짜 제공자로 작업을 처리하면서
+    1. 요약 저장 직후 오류가 나도 작업이 완료 상태로 남고 요약은 1건인지
+    2. 생성 중 작업이 다른 워커에 재할당되면 이전 워커는 저장하지 않고, 새 워커만 1건 저장하는지
+확인. 점검용 작업과 요약은 끝나면 삭제
+
+사용법:
+    python check_summary_job_idempotency.py
+"""
+import sys
+import os
+import uuid
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.database import SessionLocal
+from app.models import ConsultationSummary, SummaryJob
+from app.services import job_queue
+from app.services.fake_provider import FakeSummaryProvider
+from app.services.job_queue import SummaryJobWorker, summary_job_queue
+
+SAMPLE_TEXT = "お客様：おでこのしわが気になっていて、ボトックスについて聞きたいです。"
+
+class ReassigningFakeProvider(FakeSummaryProvider):
+    """
+    생성 도중 작업을 다른 워커에 넘기는 가짜 제공자 (가시성 타임아웃 후 재할당 재현)
+    """
+
+    def __init__(self, job_id: int, worker_id: str):
+        super().__init__(profile="instant")
+        self.job_id = job_id
+        self.worker_id = worker_id
+
+    async def stream_summary(self, japanese_text, prompt_template, template_key=None, plan=None):
+        take(self.job_id, self.worker_id)
+        async for chunk in super().stream_summary(japanese_text, prompt_template, template_key, plan):
+            yield chunk
+
+def take(job_id: int, worker_id: str):
+    """작업을 worker_id가 가져간 것처럼 잠금 (대기열의 다른 작업은 건드리지 않음)"""
+    db = SessionLocal()
+    try:
+        db.query(SummaryJob).filter(SummaryJob.id == job_id).update(
+            {
+                SummaryJob.status: "running",
+                SummaryJob.attempts: SummaryJob.attempts + 1,
+                SummaryJob.locked_by: worker_id
+            },
+            synchronize_session=False
+        )
+        db.commit()
+    finally:
+        db.close()
+
+def submit(db, marker: str) -> SummaryJob:
+    return summary_job_queue.submit(
+        db,
+        created_by="check",
+        original_text=f"{SAMPLE_TEXT}\n[{marker}]",
+        save_result=True,
+        force_refresh=True
+    )
+
+async def run(job_id: int, worker_id: str, provider: FakeSummaryProvider):
+    """워커 한 슬롯이 작업 1건을 처리하는 것과 같은 경로로 실행"""
+    db = SessionLocal()
+    try:
+        job = db.get(SummaryJob, job_id)
+        worker = SummaryJobWorker(summary_job_queue, provider, concurrency=1, poll_interval=0.1, worker_id=worker_id)
+        await worker._run(job, db)
+    finally:
+        db.close()
+
+def saved(db, job_id: int):
+    db.expire_all()
+    job = db.get(SummaryJob, job_id)
+    count = db.query(ConsultationSummary).filter(ConsultationSummary.original_text == job.original_text).count()
+    return job, count
+
+async def check_failure_after_save(db, marker: str):
+    job = submit(db, marker)
+    take(job.id, "check-a")
+
+    def fail_after_save(*args, **kwargs):
+        raise RuntimeError("저장 직후 오류 (점검)")
+
+    attach_telemetry = job_queue.attach_telemetry
+    job_queue.attach_telemetry = fail_after_save
+    try:
+        await run(job.id, "check-a", FakeSummaryProvider(profile="instant"))
+    finally:
+        job_queue.attach_telemetry = attach_telemetry
+
+    job, count = saved(db, job.id)
+    assert job.status == "succeeded" and job.summary_id is not None, (job.status, job.error)
+    assert count == 1, count
+    print(f"✅ 저장 직후 오류: 작업 {job.status}, 요약 {count}건")
+
+async def check_reassigned(db, marker: str):
+    job = submit(db, marker)
+    take(job.id, "check-a")
+
+    await run(job.id, "check-a", ReassigningFakeProvider(job.id, "check-b"))
+    job, count = saved(db, job.id)
+    assert job.status == "running" and job.locked_by == "check-b", (job.status, job.locked_by)
+    assert count == 0, count
+
+    await run(job.id, "check-b", FakeSummaryProvider(profile="instant"))
+    job, count = saved(db, job.id)
+    assert job.status == "succeeded", (job.status, job.error)
+    assert count == 1, count
+    print(f"✅ 생성 중 재할당: 작업 {job.status}, 요약 {count}건")
+
+async def check():
+    marker = f"중복 저장 점검 {uuid.uuid4().hex[:8]}"
+    db = SessionLocal()
+    try:
+        await check_failure_after_save(db, f"{marker} 1")
+        await check_reassigned(db, f"{marker} 2")
+    finally:
+        db.rollback()
+        db.query(SummaryJob).filter(SummaryJob.original_text.contains(marker)).delete(synchronize_session=False)
+        deleted = db.query(ConsultationSummary).filter(
+            ConsultationSummary.original_text.contains(marker)
+        ).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+        print(f"점검 데이터 정리 완료 (요약 {deleted}건)")
+
+if __name__ == "__main__":
+    asyncio.run(check())
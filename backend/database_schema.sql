@@ -17,6 +17,7 @@ CREATE TABLE procedures (
     precautions TEXT, -- 주의사항
     price_info TEXT, -- 가격 정보
     additional_info JSON, -- RTF에서 파싱된 추가 정보
+    aliases JSON, -- 상담 중 언급 추출용 다른 이름 (일본어 가타카나명, 브랜드/제품명 등)
     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_by VARCHAR(100), -- 수정자
     version INTEGER DEFAULT 1, -- 버전 관리
@@ -52,15 +53,81 @@ CREATE TABLE prompt_templates (
 -- 상담 요약 (간소화)
 CREATE TABLE consultation_summaries (
     id SERIAL PRIMARY KEY,
-    consultation_date DATE,
+    consultation_date DATE NOT NULL,
     original_text TEXT NOT NULL, -- 일본어 원문
     summary_text TEXT NOT NULL, -- 한국어 요약
     prompt_template_id INTEGER REFERENCES prompt_templates(id),
     procedures_discussed JSON, -- 논의된 시술 ID 목록
+    generation_metrics JSON, -- AI 생성 계측 (제공자, 모델, 첫 토큰 시간, 토큰 수 등)
+    sections JSONB, -- 요약 항목별 본문 (customer_info, attitude, procedures, decisions, next_steps, quotes, communication)
     created_by VARCHAR(100),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 요약 결과 캐시 (원문/템플릿 버전/모델/샘플링 파라미터 해시 기준)
+CREATE TABLE summary_cache (
+    cache_key VARCHAR(64) PRIMARY KEY,
+    summary_text TEXT NOT NULL,
+    model_used VARCHAR(100),
+    prompt_template_id INTEGER,
+    template_version VARCHAR(20),
+    hit_count INTEGER DEFAULT 0,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    expires_at TIMESTAMP WITH TIME ZONE -- 모델(DateTime(timezone=True))과 같게, 만료 비교는 UTC 기준
+);
+
+-- 요약 생성 계측 (요청별 지연시간/토큰/비용, 템플릿 버전·모델별 분위수 집계용)
+CREATE TABLE summary_telemetry (
+    id SERIAL PRIMARY KEY,
+    summary_id INTEGER REFERENCES consultation_summaries(id) ON DELETE SET NULL,
+    prompt_template_id INTEGER,
+    template_version VARCHAR(20),
+    provider VARCHAR(50),
+    model VARCHAR(100),
+    language VARCHAR(10), -- 녹취록 언어 판정 결과 (ja / ko / mixed)
+    streamed BOOLEAN DEFAULT FALSE,
+    success BOOLEAN DEFAULT TRUE,
+    error VARCHAR(500),
+    queue_wait_ms DOUBLE PRECISION,
+    ttft_ms DOUBLE PRECISION,
+    total_ms DOUBLE PRECISION,
+    output_tokens_per_sec DOUBLE PRECISION,
+    prompt_tokens INTEGER,
+    cached_tokens INTEGER,
+    completion_tokens INTEGER,
+    cost_usd DOUBLE PRECISION,
+    preprocess_tokens_saved INTEGER, -- 녹취록 전처리로 줄인 예상 입력 토큰 수
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 요약 생성 작업 큐 (워커가 FOR UPDATE SKIP LOCKED로 가져감)
+CREATE TABLE summary_jobs (
+    id SERIAL PRIMARY KEY,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued', -- queued, running, succeeded, failed
+    original_text TEXT NOT NULL,
+    consultation_date DATE,
+    prompt_template_id INTEGER,
+    procedures_discussed JSON,
+    consultant_name VARCHAR(100),
+    customer_name VARCHAR(100),
+    consultation_title VARCHAR(255),
+    force_refresh BOOLEAN DEFAULT FALSE,
+    save_result BOOLEAN DEFAULT TRUE,
+    created_by VARCHAR(100),
+    attempts INTEGER DEFAULT 0,
+    max_attempts INTEGER DEFAULT 3,
+    available_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    locked_by VARCHAR(100),
+    locked_until TIMESTAMP WITH TIME ZONE, -- 가시성 타임아웃
+    summary_text TEXT,
+    summary_id INTEGER REFERENCES consultation_summaries(id) ON DELETE SET NULL,
+    telemetry_id INTEGER,
+    error VARCHAR(500),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE
+);
+
 -- 사용자 관리 (간소화)
 CREATE TABLE users (
     id SERIAL PRIMARY KEY,
@@ -95,8 +162,14 @@ CREATE TABLE search_logs (
 CREATE INDEX idx_procedures_number ON procedures(procedure_number);
 CREATE INDEX idx_procedures_category ON procedures(category);
 CREATE INDEX idx_procedures_active ON procedures(is_active);
-CREATE INDEX idx_consultation_date ON consultation_summaries(consultation_date);
+CREATE INDEX idx_summaries_date_id ON consultation_summaries(consultation_date, id); -- 목록 키셋 페이지네이션 (상담일, ID)
+CREATE INDEX idx_summaries_sections ON consultation_summaries USING GIN (sections);
 CREATE INDEX idx_prompt_templates_active ON prompt_templates(is_active);
+CREATE INDEX idx_summary_cache_expires ON summary_cache(expires_at);
+CREATE INDEX idx_summary_telemetry_created ON summary_telemetry(created_at);
+CREATE INDEX idx_summary_telemetry_summary ON summary_telemetry(summary_id);
+CREATE INDEX idx_summary_jobs_queued ON summary_jobs(available_at, id) WHERE status = 'queued';
+CREATE INDEX idx_summary_jobs_running ON summary_jobs(locked_until) WHERE status = 'running';
 CREATE INDEX idx_search_logs_user_date ON search_logs(user_id, created_at);
 
 -- 기본 프롬프트 템플릿 삽입
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+저장된 상담 원문의 토큰 수를 일괄 추정하여 용량 계획 지표 출력
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+from app.core.config import settings
+from app.services.token_estimator import token_estimator
+
+# 데이터베이스 설정
+engine = create_engine(settings.DATABASE_URL)
+
+def estimate_capacity():
+    """전체 상담 원문 토큰 분포 및 처리 모드별 건수 계산"""
+    df = pd.read_sql(
+        "SELECT id, consultation_date, original_text FROM consultation_summaries",
+        engine
+    )
+
+    if df.empty:
+        print("❌ 저장된 상담 요약이 없습니다")
+        return
+
+    tokens = token_estimator.estimate_batch(df["original_text"])
+    long_mask = tokens > settings.LONG_TRANSCRIPT_THRESHOLD_TOKENS
+    oversize_mask = tokens > settings.MAX_TRANSCRIPT_TOKENS
+
+    print(f"📊 추정 방식: {token_estimator.method}")
+    print(f"   상담 건수: {len(df)}")
+    print(f"   원문 토큰 합계: {int(tokens.sum()):,}")
+    print(f"   평균 / p50 / p95 / p99 / 최대: "
+          f"{tokens.mean():,.0f} / {np.percentile(tokens, 50):,.0f} / {np.percentile(tokens, 95):,.0f} / "
+          f"{np.percentile(tokens, 99):,.0f} / {tokens.max():,}")
+    print(f"   map-reduce 대상 (> {settings.LONG_TRANSCRIPT_THRESHOLD_TOKENS:,} 토큰): {int(long_mask.sum())}건")
+    print(f"   한도 초과 (> {settings.MAX_TRANSCRIPT_TOKENS:,} 토큰): {int(oversize_mask.sum())}건")
+
+    # 월별 입력 토큰 추이
+    df["tokens"] = tokens
+    df["month"] = pd.to_datetime(df["consultation_date"]).dt.to_period("M")
+    monthly = df.groupby("month")["tokens"].agg(["count", "sum", "mean"])
+    print("\n📅 월별 입력 토큰")
+    for month, row in monthly.iterrows():
+        print(f"   {month}: {int(row['count'])}건, 합계 {int(row['sum']):,}, 평균 {row['mean']:,.0f}")
+
+if __name__ == "__main__":
+    print("🚀 상담 원문 토큰 용량 추정 중...")
+    estimate_capacity()
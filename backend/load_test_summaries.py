@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+요약 스트리밍 엔드포인트 부하 테스트
+
+실제 토큰을 쓰지 않도록 백엔드를 가짜 제공자로 실행한 뒤 사용:
+    LLM_PROVIDER_ORDER=fake FAKE_LLM_PROFILE=realistic uvicorn app.main:app
+    python load_test_summaries.py --requests 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import time
+import httpx
+
+SAMPLE_TEXT = """お客様：最近、おでこと目元のしわが気になっていて、ボトックスについて聞きたいです。
+相談員：はい、ボトックスは表情じわに効果的です。おでこと目元を一緒に施術するパッケージもございます。
+お客様：痛みはどのくらいありますか？ダウンタイムも心配です。
+相談員：麻酔クリームを使いますので、痛みはほとんどありません。ダウンタイムもほぼないです。"""
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+async def run_one(client: httpx.AsyncClient, base_url: str, index: int, unique: bool) -> dict:
+    """스트리밍 요청 1건 실행 후 첫 토큰 시간/전체 시간 측정"""
+    text = f"{SAMPLE_TEXT}\n(テスト {index})" if unique else SAMPLE_TEXT
+    started = time.monotonic()
+    ttft = None
+    status = "ok"
+    try:
+        async with client.stream(
+            "POST",
+            f"{base_url}/api/summaries/generate/stream",
+            json={"original_text": text, "force_refresh": unique}
+        ) as response:
+            if response.status_code != 200:
+                return {"status": f"http_{response.status_code}", "ttft": None, "total": time.monotonic() - started}
+            # SSE 프로토콜 v2: event 줄로 이벤트 종류 구분
+            event = None
+            async for line in response.aiter_lines():
+                if line.startswith("event: "):
+                    event = line[7:]
+                elif line.startswith("data: "):
+                    if event == "delta" and ttft is None:
+                        ttft = time.monotonic() - started
+                    elif event == "error":
+                        status = "error"
+    except httpx.HTTPError as e:
+        status = type(e).__name__
+    return {"status": status, "ttft": ttft, "total": time.monotonic() - started}
+
+async def main(args):
+    semaphore = asyncio.Semaphore(args.concurrency)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(timeout=300, limits=limits) as client:
+        async def bounded(index):
+            async with semaphore:
+                return await run_one(client, args.base_url, index, not args.same_text)
+
+        started = time.monotonic()
+        results = await asyncio.gather(*(bounded(i) for i in range(args.requests)))
+        elapsed = time.monotonic() - started
+
+    ok = [r for r in results if r["status"] == "ok"]
+    ttfts = [r["ttft"] * 1000 for r in ok if r["ttft"] is not None]
+    totals = [r["total"] * 1000 for r in ok]
+    statuses = {}
+    for r in results:
+        statuses[r["status"]] = statuses.get(r["status"], 0) + 1
+
+    print(f"📊 요청 {args.requests}건, 동시성 {args.concurrency}, 소요 {elapsed:.1f}초 ({args.requests / elapsed:.1f} req/s)")
+    print(f"   결과: {statuses}")
+    for label, values in (("첫 토큰(ms)", ttfts), ("전체(ms)", totals)):
+        print(f"   {label} p50 {percentile(values, 50):.0f} / p95 {percentile(values, 95):.0f} / p99 {percentile(values, 99):.0f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요약 스트리밍 부하 테스트")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--same-text", action="store_true", help="모든 요청에 같은 원문 사용 (캐시/합류 경로 측정)")
+    asyncio.run(main(parser.parse_args()))
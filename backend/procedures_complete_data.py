@@ -380,4 +380,29 @@ COMPLETE_PROCEDURES_DATA = [
             "safe": "매우 안전한 시술"
         }
     }
-]
\ No newline at end of file
+]
+
+# 상담 녹취록/요약에서 시술 언급을 찾기 위한 다른 이름 (시술 번호 → 이름 목록)
+# 한국어명/영문명은 자동으로 포함되므로 일본어 표기, 브랜드/제품명, 흔한 다른 표기만 기재
+# (다른 단어 안에 흔히 나오는 짧은 이름은 넣지 않음, 예: "온다")
+PROCEDURE_ALIASES = {
+    1: ["ボトックス", "ボツリヌス", "보툴리눔", "휴겔", "Hugel", "보톡"],
+    2: ["フィラー", "ヒアルロン酸注入", "히알루론산 필러", "레스틸렌", "Restylane", "쥬비덤", "Juvederm", "벨로테로", "Belotero"],
+    3: ["エランセ", "엘란쎄"],
+    4: ["ジュベルック", "주베룩"],
+    5: ["シルファーム", "실펌", "Sylfirm"],
+    6: ["オリジオ", "Oligio"],
+    7: ["アイオリジオ", "Eye Oligio"],
+    8: ["ウルセラ", "울세라", "Ultherapy"],
+    9: ["チタニウムリフト", "チタニウム", "티타늄"],
+    10: ["オンダリフト", "ONDA", "온다리프트"],
+    11: ["糸リフト", "スレッドリフト", "실리프트", "Thread Lift", "PDO실"],
+    12: ["エクソソーム", "엑소좀", "Exosome"],
+    13: ["バイオニクル"],
+    14: ["トゥルースカルプ", "트루스컬프"],
+    15: ["ポテンツァ", "포텐자", "Potenza"],
+    16: ["수광"],
+    17: ["水光注射", "물광"],
+    18: ["ハイフ", "HIFU", "하이푸"],
+    19: ["酸素トリートメント", "산소케어", "Oxygen"],
+}
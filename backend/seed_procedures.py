@@ -14,7 +14,7 @@ from app.models import Procedure
 from app.core.config import settings
 
 # 완전한 19개 시술 시드 데이터 (RTF 파일 분석 기반)
-from procedures_complete_data import COMPLETE_PROCEDURES_DATA
+from procedures_complete_data import COMPLETE_PROCEDURES_DATA, PROCEDURE_ALIASES
 
 # 데이터베이스 스키마에 맞게 변환
 PROCEDURE_SEED_DATA = []
@@ -33,7 +33,8 @@ for data in COMPLETE_PROCEDURES_DATA:
         "effects": data["effects"],
         "side_effects": data["side_effects"],
         "precautions": data["precautions"],
-        "additional_info": data["additional_info"]  # 딕셔너리 그대로 저장
+        "additional_info": data["additional_info"],  # 딕셔너리 그대로 저장
+        "aliases": PROCEDURE_ALIASES.get(data["procedure_number"], [])
     }
     PROCEDURE_SEED_DATA.append(procedure_data)
 
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+요약 생성 작업 워커 (웹 서버와 별도 프로세스)
+
+summary_jobs 테이블에서 FOR UPDATE SKIP LOCKED로 작업을 가져가 요약 서비스(제공자 라우터,
+캐시, 계측)로 처리. 워커 수/동시 처리 수를 웹 서버와 독립적으로 늘릴 수 있음
+
+사용법:
+    python summary_worker.py --concurrency 8
+SIGTERM/SIGINT를 받으면 새 작업을 가져가지 않고 처리 중인 작업만 마친 뒤 종료
+"""
+import sys
+import os
+import argparse
+import asyncio
+import logging
+import signal
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.services.provider_clients import provider_registry
+from app.services.job_queue import SummaryJobWorker, summary_job_queue
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+async def main(args):
+    await provider_registry.startup()
+    worker = SummaryJobWorker(
+        summary_job_queue,
+        provider_registry.router,
+        concurrency=args.concurrency,
+        poll_interval=args.poll_interval,
+        worker_id=args.worker_id
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await provider_registry.shutdown()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요약 생성 작업 워커")
+    parser.add_argument("--concurrency", type=int, default=settings.SUMMARY_JOB_CONCURRENCY, help="동시 처리 작업 수")
+    parser.add_argument("--poll-interval", type=float, default=settings.SUMMARY_JOB_POLL_SECONDS, help="빈 큐 폴링 간격 (초)")
+    parser.add_argument("--worker-id", default=None, help="워커 식별자 (기본: 호스트명:PID)")
+    asyncio.run(main(parser.parse_args()))
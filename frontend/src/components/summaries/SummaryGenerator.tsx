@@ -16,7 +16,7 @@ import {
   Clear as ClearIcon
 } from '@mui/icons-material';
 import { summariesApi } from '../../services/api';
-import { SummaryGenerateRequest, SummaryGenerateResponse } from '../../types';
+import { SummaryGenerateSaveRequest, SummaryGenerateResponse } from '../../types';
 
 interface SummaryGeneratorProps {
   onSummaryGenerated?: (summary: SummaryGenerateResponse) => void;
@@ -63,13 +63,17 @@ const SummaryGenerator: React.FC<SummaryGeneratorProps> = ({ onSummaryGenerated,
       // 현재 날짜와 시간을 자동으로 설정
       const currentDate = new Date().toISOString().split('T')[0];
       
-      const request: SummaryGenerateRequest = {
+      // 상담 정보를 함께 보내 생성 완료 시 서버에서 바로 저장 (원문 재전송 없음)
+      const request: SummaryGenerateSaveRequest = {
         original_text: originalText,
         consultation_date: currentDate,
-        prompt_template_id: undefined // 기본 템플릿 사용
+        prompt_template_id: undefined, // 기본 템플릿 사용
+        consultant_name: consultantName,
+        customer_name: clientName,
+        consultation_title: consultationTitle
       };
 
-      await summariesApi.generateSummaryStream(
+      await summariesApi.generateAndSaveSummaryStream(
         request,
         // onContent: 실시간으로 받은 내용 표시
         (content: string, accumulated: string) => {
@@ -85,7 +89,9 @@ const SummaryGenerator: React.FC<SummaryGeneratorProps> = ({ onSummaryGenerated,
             consultation_date: metadata.consultation_date,
             consultant_name: consultantName,
             customer_name: clientName,
-            consultation_title: consultationTitle
+            consultation_title: consultationTitle,
+            telemetry_id: metadata.telemetry_id,
+            summary_id: metadata.summary_id
           };
           
           setGeneratedSummary(enhancedResponse);
@@ -60,7 +60,6 @@ const SummaryList: React.FC<SummaryListProps> = ({
 
     try {
       const summariesData = await summariesApi.getSummaries({
-        skip: 0,
         limit: 20 // 처음에는 20개만 로드하여 성능 개선
       });
       setSummaries(summariesData);
@@ -43,6 +43,12 @@ const SummariesPage: React.FC = () => {
   const handleSaveNewSummary = async () => {
     if (!generatedSummary) return;
     
+    // 생성 스트림에서 이미 저장된 요약
+    if (generatedSummary.summary_id) {
+      setGeneratedSummary(null);
+      return;
+    }
+    
     setSaving(true);
     try {
       const summaryCreateDirect: SummaryCreateDirect = {
@@ -52,7 +58,8 @@ const SummariesPage: React.FC = () => {
         prompt_template_id: undefined,
         consultant_name: generatedSummary.consultant_name,
         customer_name: generatedSummary.customer_name,
-        consultation_title: generatedSummary.consultation_title
+        consultation_title: generatedSummary.consultation_title,
+        telemetry_id: generatedSummary.telemetry_id
       };
       
       await summariesApi.createSummaryDirect(summaryCreateDirect);
@@ -82,6 +89,15 @@ const SummariesPage: React.FC = () => {
     
     setSaving(true);
     try {
+      // 이미 저장된 요약은 수정 내용만 반영
+      if (generatedSummary.summary_id) {
+        await summariesApi.updateSummary(generatedSummary.summary_id, { summary_text: editedSummary });
+        setGeneratedSummary(null);
+        setIsEditing(false);
+        setEditedSummary('');
+        return;
+      }
+      
       // 새로 생성된 요약을 수정된 내용으로 저장
       const summaryCreateDirect: SummaryCreateDirect = {
         consultation_date: generatedSummary.consultation_date,
@@ -90,7 +106,8 @@ const SummariesPage: React.FC = () => {
         prompt_template_id: undefined,
         consultant_name: generatedSummary.consultant_name,
         customer_name: generatedSummary.customer_name,
-        consultation_title: generatedSummary.consultation_title
+        consultation_title: generatedSummary.consultation_title,
+        telemetry_id: generatedSummary.telemetry_id
       };
       
       await summariesApi.createSummaryDirect(summaryCreateDirect);
@@ -293,7 +310,7 @@ const SummariesPage: React.FC = () => {
                         onClick={handleSaveNewSummary}
                         disabled={saving}
                       >
-                        {saving ? '저장 중...' : '요약 저장'}
+                        {saving ? '저장 중...' : generatedSummary.summary_id ? '확인 (저장됨)' : '요약 저장'}
                       </Button>
                     </Box>
                   </Box>
@@ -12,7 +12,9 @@ import {
   CircularProgress,
   Pagination,
   Divider,
-  Chip
+  Chip,
+  MenuItem,
+  Button
 } from '@mui/material';
 import {
   Search as SearchIcon,
@@ -20,7 +22,7 @@ import {
   Person as PersonIcon
 } from '@mui/icons-material';
 import { summariesApi } from '../services/api';
-import { ConsultationSummary } from '../types';
+import { ConsultationSummary, SummarySection } from '../types';
 
 const SummaryHistoryPage: React.FC = () => {
   const theme = useTheme();
@@ -28,6 +30,10 @@ const SummaryHistoryPage: React.FC = () => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [searchQuery, setSearchQuery] = useState('');
+  const [sectionFilter, setSectionFilter] = useState(''); // 비어 있으면 전체 검색
+  const [sectionList, setSectionList] = useState<SummarySection[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | undefined>(undefined);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [page, setPage] = useState(1);
   const [selectedSummary, setSelectedSummary] = useState<ConsultationSummary | null>(null);
 
@@ -36,6 +42,9 @@ const SummaryHistoryPage: React.FC = () => {
   // 상담 요약 목록 로드
   useEffect(() => {
     loadSummaries();
+    summariesApi.getSummarySections()
+      .then(setSectionList)
+      .catch((error) => console.error('요약 항목 목록 로드 실패:', error));
   }, []);
 
   const loadSummaries = async () => {
@@ -43,11 +52,11 @@ const SummaryHistoryPage: React.FC = () => {
     setError(null);
 
     try {
-      const summariesData = await summariesApi.getSummaries({
-        skip: 0,
+      const summariesPage = await summariesApi.getSummariesPage({
         limit: 100
       });
-      setSummaries(summariesData);
+      setSummaries(summariesPage.items);
+      setNextCursor(summariesPage.next_cursor);
     } catch (error) {
       console.error('상담 요약 목록 로드 실패:', error);
       setError('상담 요약 목록을 불러오는데 실패했습니다.');
@@ -56,10 +65,42 @@ const SummaryHistoryPage: React.FC = () => {
     }
   };
 
+  // 이전 기록 더 불러오기 (커서 다음 페이지를 이어 붙임)
+  const loadMoreSummaries = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+
+    try {
+      const summariesPage = await summariesApi.getSummariesPage({
+        cursor: nextCursor,
+        limit: 100
+      });
+      setSummaries((prev) => [...prev, ...summariesPage.items]);
+      setNextCursor(summariesPage.next_cursor);
+    } catch (error) {
+      console.error('상담 요약 목록 추가 로드 실패:', error);
+      setError('상담 요약 목록을 불러오는데 실패했습니다.');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  // 목록 미리보기: 저장된 항목 본문 (항목이 없는 요약만 본문 앞부분)
+  const previewText = (summary: ConsultationSummary) => {
+    const sections = summary.sections || {};
+    const preview = sections.decisions || sections.customer_info || summary.summary_text;
+    return preview.replace(/\s+/g, ' ').substring(0, 40);
+  };
+
   // 통합 검색 필터링 및 최신순 정렬 (상담자, 고객 이름, 상담명 기준)
+  // 항목을 고르면 해당 항목 본문만 검색
   const filteredSummaries = summaries
     .filter(summary => {
       const query = searchQuery.toLowerCase();
+      if (sectionFilter) {
+        const sectionText = summary.sections?.[sectionFilter];
+        return !!sectionText && sectionText.toLowerCase().includes(query);
+      }
       return (
         // 기존 검색 (요약 텍스트, 원본 텍스트, 생성자)
         summary.summary_text.toLowerCase().includes(query) ||
@@ -125,9 +166,26 @@ const SummaryHistoryPage: React.FC = () => {
               히스토리 목록
             </Typography>
             <TextField
+              select
               fullWidth
               size="small"
-              placeholder="상담자, 고객명, 상담명으로 검색..."
+              label="검색 항목"
+              value={sectionFilter}
+              onChange={(e) => {
+                setSectionFilter(e.target.value);
+                setPage(1);
+              }}
+              sx={{ mb: 1 }}
+            >
+              <MenuItem value="">전체</MenuItem>
+              {sectionList.map((section) => (
+                <MenuItem key={section.key} value={section.key}>{section.title}</MenuItem>
+              ))}
+            </TextField>
+            <TextField
+              fullWidth
+              size="small"
+              placeholder={sectionFilter ? '항목 내용으로 검색...' : '상담자, 고객명, 상담명으로 검색...'}
               value={searchQuery}
               onChange={(e) => {
                 setSearchQuery(e.target.value);
@@ -159,7 +217,7 @@ const SummaryHistoryPage: React.FC = () => {
             ) : paginatedSummaries.length === 0 ? (
               <Box sx={{ textAlign: 'center', py: 4 }}>
                 <Typography variant="body2" color="text.secondary">
-                  {searchQuery 
+                  {searchQuery || sectionFilter
                     ? '검색 결과가 없습니다.' 
                     : '저장된 상담 요약이 없습니다.'
                   }
@@ -240,7 +298,7 @@ const SummaryHistoryPage: React.FC = () => {
                               whiteSpace: 'nowrap'
                             }}
                           >
-                            {summary.summary_text.substring(0, 40)}...
+                            {previewText(summary)}...
                           </Typography>
                         </Box>
                         
@@ -253,15 +311,22 @@ const SummaryHistoryPage: React.FC = () => {
           </Box>
 
           {/* 페이지네이션 */}
-          {totalPages > 1 && (
-            <Box sx={{ p: 2, borderTop: `1px solid ${theme.palette.divider}`, display: 'flex', justifyContent: 'center' }}>
-              <Pagination
-                count={totalPages}
-                page={page}
-                onChange={(_, newPage) => setPage(newPage)}
-                size="small"
-                color="primary"
-              />
+          {(totalPages > 1 || nextCursor) && (
+            <Box sx={{ p: 2, borderTop: `1px solid ${theme.palette.divider}`, display: 'flex', flexDirection: 'column', alignItems: 'center', gap: 1 }}>
+              {totalPages > 1 && (
+                <Pagination
+                  count={totalPages}
+                  page={page}
+                  onChange={(_, newPage) => setPage(newPage)}
+                  size="small"
+                  color="primary"
+                />
+              )}
+              {nextCursor && (
+                <Button size="small" onClick={loadMoreSummaries} disabled={loadingMore}>
+                  {loadingMore ? '불러오는 중...' : '이전 기록 더 불러오기'}
+                </Button>
+              )}
             </Box>
           )}
         </Paper>
@@ -397,15 +462,37 @@ const SummaryHistoryPage: React.FC = () => {
                       border: `1px solid ${theme.palette.divider}`
                     }}
                   >
-                    <Typography 
-                      variant="body2" 
-                      sx={{ 
-                        lineHeight: 1.6,
-                        whiteSpace: 'pre-wrap'
-                      }}
-                    >
-                      {selectedSummary.summary_text}
-                    </Typography>
+                    {selectedSummary.sections && Object.keys(selectedSummary.sections).length > 0 && sectionList.length > 0 ? (
+                      // 저장된 항목별 본문을 항목 제목과 함께 표시
+                      sectionList
+                        .filter((section) => selectedSummary.sections?.[section.key] !== undefined)
+                        .map((section, index) => (
+                          <Box key={section.key} sx={{ mt: index === 0 ? 0 : 2 }}>
+                            <Typography variant="body2" sx={{ fontWeight: 600, mb: 0.5 }}>
+                              {sectionList.indexOf(section) + 1}. {section.title}
+                            </Typography>
+                            <Typography 
+                              variant="body2" 
+                              sx={{ 
+                                lineHeight: 1.6,
+                                whiteSpace: 'pre-wrap'
+                              }}
+                            >
+                              {selectedSummary.sections?.[section.key]}
+                            </Typography>
+                          </Box>
+                        ))
+                    ) : (
+                      <Typography 
+                        variant="body2" 
+                        sx={{ 
+                          lineHeight: 1.6,
+                          whiteSpace: 'pre-wrap'
+                        }}
+                      >
+                        {selectedSummary.summary_text}
+                      </Typography>
+                    )}
                   </Paper>
                 </Box>
               </Box>
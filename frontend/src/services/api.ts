@@ -7,8 +7,14 @@ import type {
   ConsultationSummary,
   SummaryCreate,
   SummaryCreateDirect,
+  SummaryGenerateSaveRequest,
+  SummaryJob,
+  SummaryJobCreate,
   SummaryGenerateRequest,
-  SummaryGenerateResponse
+  SummaryGenerateResponse,
+  SummarySection,
+  SummarySectionMatch,
+  CursorPage
 } from '../types';
 
 // API 클라이언트 설정 (환경별)
@@ -52,11 +58,146 @@ apiClient.interceptors.response.use(
   }
 );
 
+// 스트리밍 요약 체크섬 검증 (SHA-256, 브라우저가 지원하지 않으면 생략)
+const verifyChecksum = async (text: string, expected?: string): Promise<boolean> => {
+  if (!expected || !window.crypto?.subtle) return true;
+  const digest = await window.crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+  const hex = Array.from(new Uint8Array(digest)).map((b) => b.toString(16).padStart(2, '0')).join('');
+  return hex === expected;
+};
+
+// 끊긴 스트림 재개 시도 횟수 / 대기 시간
+const MAX_STREAM_RESUMES = 5;
+const STREAM_RESUME_DELAY_MS = 1000;
+
+// 요약 스트림(SSE 프로토콜 v2) 수신: 델타만 받아 누적, 연결이 끊기면 같은 stream_id를 Last-Event-ID부터 재개
+const streamSummaryEvents = async (
+  open: () => Promise<Response>,
+  onContent: (content: string, accumulated: string) => void,
+  onComplete: (summary: string, metadata: any) => void,
+  onError: (error: string) => void
+): Promise<void> => {
+  // 요약 = delta 텍스트 합계, 오프셋은 유니코드 코드 포인트 기준 (이벤트 id와 동일)
+  let accumulated = '';
+  let offset = 0;
+  let metadata: any = {};
+  let streamId: string | null = null;
+  let lastEventId = '0';
+  let resumes = 0;
+
+  const handleEvent = async (event: string, data: any): Promise<boolean> => {
+    if (event === 'meta') {
+      metadata = { ...metadata, ...data };
+      streamId = data.stream_id || streamId;
+    } else if (event === 'delta') {
+      accumulated += data.text;
+      offset += Array.from(data.text as string).length;
+      onContent(data.text, accumulated);
+    } else if (event === 'checkpoint') {
+      if (data.offset !== offset) {
+        console.warn(`요약 스트림 오프셋 불일치: ${offset} != ${data.offset}`);
+      }
+    } else if (event === 'done') {
+      const summary = accumulated;
+      if (data.offset !== offset || !(await verifyChecksum(summary, data.sha256))) {
+        onError('요약 스트림 데이터가 손상되었습니다. 다시 시도해주세요.');
+        return true;
+      }
+      onComplete(summary, { ...metadata, ...data });
+      return true;
+    } else if (event === 'error') {
+      onError(data.error);
+      return true;
+    }
+    return false;
+  };
+
+  // 응답 본문을 끝까지 읽음: 완료/오류 이벤트를 처리했으면 true, 중간에 끊기면 false
+  const readEvents = async (response: Response): Promise<boolean> => {
+    const reader = response.body?.getReader();
+    if (!reader) {
+      throw new Error('No response body reader available');
+    }
+
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+      const { done, value } = await reader.read();
+      
+      if (done) return false;
+
+      buffer += decoder.decode(value, { stream: true });
+      
+      // SSE 이벤트 파싱 (빈 줄로 구분, ':'로 시작하는 줄은 ping 주석)
+      const events = buffer.split('\n\n');
+      buffer = events.pop() || ''; // 마지막 불완전한 이벤트는 버퍼에 유지
+
+      for (const rawEvent of events) {
+        let event = 'message';
+        let payload = '';
+        let eventId: string | null = null;
+        for (const line of rawEvent.split('\n')) {
+          if (line.startsWith('id: ')) {
+            eventId = line.slice(4);
+          } else if (line.startsWith('event: ')) {
+            event = line.slice(7);
+          } else if (line.startsWith('data: ')) {
+            payload += line.slice(6);
+          }
+        }
+        if (!payload) continue;
+
+        try {
+          const finished = await handleEvent(event, JSON.parse(payload));
+          if (eventId !== null) lastEventId = eventId;
+          if (finished) return true;
+        } catch (e) {
+          console.error('Error parsing SSE data:', e);
+        }
+      }
+    }
+  };
+
+  try {
+    while (true) {
+      let finished = false;
+      try {
+        const response = streamId
+          ? await fetch(`${API_BASE_URL}/api/summaries/generate/stream/${streamId}`, {
+              headers: { 'Last-Event-ID': lastEventId },
+            })
+          : await open();
+
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        finished = await readEvents(response);
+      } catch (error) {
+        // 스트림이 시작되기 전 오류나 재개 불가(404 등)는 그대로 실패 처리
+        if (!streamId || (error instanceof Error && error.message.startsWith('HTTP error'))) {
+          throw error;
+        }
+        console.warn('요약 스트림 연결 끊김, 재개 시도:', error);
+      }
+
+      if (finished) return;
+      if (!streamId || ++resumes > MAX_STREAM_RESUMES) {
+        throw new Error('요약 스트림 연결이 끊어졌습니다. 다시 시도해주세요.');
+      }
+      await new Promise((resolve) => setTimeout(resolve, STREAM_RESUME_DELAY_MS * resumes));
+    }
+  } catch (error) {
+    console.error('Streaming error:', error);
+    onError(error instanceof Error ? error.message : 'Unknown error occurred');
+  }
+};
+
 // 시술 관련 API
 export const proceduresApi = {
   // 시술 목록 조회
   getProcedures: async (params?: {
-    skip?: number;
+    cursor?: string;
     limit?: number;
     category?: string;
     active_only?: boolean;
@@ -119,72 +260,71 @@ export const summariesApi = {
     return response.data;
   },
 
-  // 스트리밍 요약 생성
+  // 스트리밍 요약 생성 (연결이 끊기면 stream_id + Last-Event-ID로 자동 재개)
   generateSummaryStream: async (
     request: SummaryGenerateRequest,
     onContent: (content: string, accumulated: string) => void,
     onComplete: (summary: string, metadata: any) => void,
     onError: (error: string) => void
   ): Promise<void> => {
-    try {
-      const response = await fetch(`${API_BASE_URL}/api/summaries/generate/stream`, {
+    await streamSummaryEvents(
+      () => fetch(`${API_BASE_URL}/api/summaries/generate/stream`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
         body: JSON.stringify(request),
-      });
+      }),
+      onContent,
+      onComplete,
+      onError
+    );
+  },
 
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
-      }
+  // 스트리밍 요약 생성 + 서버 저장 (완료 시 metadata.summary_id, 원문을 /direct로 다시 보내지 않음)
+  generateAndSaveSummaryStream: async (
+    request: SummaryGenerateSaveRequest,
+    onContent: (content: string, accumulated: string) => void,
+    onComplete: (summary: string, metadata: any) => void,
+    onError: (error: string) => void
+  ): Promise<void> => {
+    await streamSummaryEvents(
+      () => fetch(`${API_BASE_URL}/api/summaries/generate/stream/save`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify(request),
+      }),
+      onContent,
+      onComplete,
+      onError
+    );
+  },
 
-      const reader = response.body?.getReader();
-      if (!reader) {
-        throw new Error('No response body reader available');
-      }
+  // 요약 생성 작업 등록 (워커가 처리)
+  submitSummaryJob: async (job: SummaryJobCreate): Promise<SummaryJob> => {
+    const response = await apiClient.post('/api/summaries/jobs', job);
+    return response.data;
+  },
 
-      const decoder = new TextDecoder();
-      let buffer = '';
-
-      while (true) {
-        const { done, value } = await reader.read();
-        
-        if (done) break;
-
-        buffer += decoder.decode(value, { stream: true });
-        
-        // SSE 데이터 파싱
-        const lines = buffer.split('\n');
-        buffer = lines.pop() || ''; // 마지막 불완전한 줄은 버퍼에 유지
-
-        for (const line of lines) {
-          if (line.startsWith('data: ')) {
-            try {
-              const data = JSON.parse(line.slice(6));
-              
-              if (data.type === 'content') {
-                onContent(data.content, data.accumulated);
-              } else if (data.type === 'done') {
-                onComplete(data.summary, {
-                  template_used: data.template_used,
-                  consultation_date: data.consultation_date
-                });
-                return;
-              } else if (data.type === 'error') {
-                onError(data.error);
-                return;
-              }
-            } catch (e) {
-              console.error('Error parsing SSE data:', e);
-            }
-          }
-        }
+  // 요약 생성 작업 상태 조회
+  getSummaryJob: async (id: number): Promise<SummaryJob> => {
+    const response = await apiClient.get(`/api/summaries/jobs/${id}`);
+    return response.data;
+  },
+
+  // 요약 생성 작업 상태 구독 (SSE, 완료/실패 시 종료). 구독 해제 함수 반환
+  watchSummaryJob: (id: number, onStatus: (job: SummaryJob) => void): (() => void) => {
+    const source = new EventSource(`${API_BASE_URL}/api/summaries/jobs/${id}/events`);
+    source.addEventListener('status', (event) => {
+      const job: SummaryJob = JSON.parse((event as MessageEvent).data);
+      onStatus(job);
+      if (job.status === 'succeeded' || job.status === 'failed') {
+        source.close();
       }
-    } catch (error) {
-      console.error('Streaming error:', error);
-      onError(error instanceof Error ? error.message : 'Unknown error occurred');
-    }
+    });
+    return () => source.close();
   },
 
   // 상담 요약 생성 및 저장
@@ -201,7 +341,7 @@ export const summariesApi = {
 
   // 상담 요약 목록 조회
   getSummaries: async (params?: {
-    skip?: number;
+    cursor?: string;
     limit?: number;
     start_date?: string;
     end_date?: string;
@@ -210,6 +350,35 @@ export const summariesApi = {
     return response.data;
   },
 
+  // 상담 요약 목록 페이지 조회 (다음 페이지 커서 포함)
+  getSummariesPage: async (params?: {
+    cursor?: string;
+    limit?: number;
+    start_date?: string;
+    end_date?: string;
+  }): Promise<CursorPage<ConsultationSummary>> => {
+    const response = await apiClient.get('/api/summaries/', { params });
+    return { items: response.data, next_cursor: response.headers['x-next-cursor'] || undefined };
+  },
+
+  // 요약 항목 목록 (키, 제목)
+  getSummarySections: async (): Promise<SummarySection[]> => {
+    const response = await apiClient.get('/api/summaries/sections');
+    return response.data;
+  },
+
+  // 항목별 조회 (예: 결정 사항만 검색)
+  searchSummarySections: async (section: string, params?: {
+    q?: string;
+    cursor?: string;
+    limit?: number;
+    start_date?: string;
+    end_date?: string;
+  }): Promise<SummarySectionMatch[]> => {
+    const response = await apiClient.get(`/api/summaries/sections/${section}`, { params });
+    return response.data;
+  },
+
   // 특정 상담 요약 조회
   getSummary: async (id: number): Promise<ConsultationSummary> => {
     const response = await apiClient.get(`/api/summaries/${id}`);
@@ -16,6 +16,7 @@ export interface Procedure {
   precautions?: string;
   price_info?: string;
   additional_info?: Record<string, any>;
+  aliases?: string[];
   version: number;
   is_active: boolean;
   created_at: string;
@@ -36,6 +37,7 @@ export interface ProcedureCreate {
   precautions?: string;
   price_info?: string;
   additional_info?: Record<string, any>;
+  aliases?: string[];
 }
 
 export interface ProcedureUpdate {
@@ -51,6 +53,7 @@ export interface ProcedureUpdate {
   precautions?: string;
   price_info?: string;
   additional_info?: Record<string, any>;
+  aliases?: string[];
 }
 
 // 카테고리 타입
@@ -74,6 +77,31 @@ export interface ConsultationSummary {
   consultant_name?: string;  // 상담자 이름
   customer_name?: string;    // 고객 이름
   consultation_title?: string; // 상담명
+  generation_metrics?: Record<string, any>; // AI 생성 계측 (첫 토큰 시간, 토큰 수 등)
+  sections?: Record<string, string>; // 요약 항목 키 → 본문 (customer_info, decisions 등)
+}
+
+// 키셋 페이지 (next_cursor가 있으면 다음 페이지 요청 시 cursor로 전달)
+export interface CursorPage<T> {
+  items: T[];
+  next_cursor?: string;
+}
+
+// 요약 항목 (키, 제목)
+export interface SummarySection {
+  key: string;
+  title: string;
+}
+
+// 항목별 조회 결과
+export interface SummarySectionMatch {
+  id: number;
+  consultation_date: string;
+  consultant_name?: string;
+  customer_name?: string;
+  consultation_title?: string;
+  section: string;
+  text: string;
 }
 
 export interface SummaryCreate {
@@ -92,6 +120,7 @@ export interface SummaryCreateDirect {
   consultant_name?: string;
   customer_name?: string;
   consultation_title?: string;
+  telemetry_id?: number; // 생성 응답의 계측 ID
 }
 
 export interface SummaryGenerateRequest {
@@ -100,14 +129,43 @@ export interface SummaryGenerateRequest {
   prompt_template_id?: number;
 }
 
+export interface SummaryGenerateSaveRequest extends SummaryGenerateRequest {
+  consultant_name?: string;
+  customer_name?: string;
+  consultation_title?: string;
+  procedures_discussed?: number[];
+}
+
 export interface SummaryGenerateResponse {
   summary: string;
+  sections?: Record<string, string>; // 요약 항목 키 → 본문
   original_text: string;
   template_used: string;
   consultation_date: string;
   consultant_name?: string;
   customer_name?: string;
   consultation_title?: string;
+  telemetry_id?: number;
+  summary_id?: number; // 생성과 동시에 저장된 경우 상담 요약 ID
+}
+
+// 요약 생성 작업 (워커 처리)
+export interface SummaryJobCreate extends SummaryGenerateSaveRequest {
+  save_result?: boolean;
+}
+
+export interface SummaryJob {
+  id: number;
+  status: 'queued' | 'running' | 'succeeded' | 'failed';
+  attempts: number;
+  max_attempts: number;
+  summary_text?: string;
+  summary_id?: number;
+  telemetry_id?: number;
+  error?: string;
+  created_at: string;
+  started_at?: string;
+  finished_at?: string;
 }
 
 // API 응답 타입